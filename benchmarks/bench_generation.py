@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+bench_generation.py
+Benchmark do gerador: roda generate() para cada preset de PRESETS x cada subconjunto de
+bancos de choose_dbs(), com executáveis 'dotnet' e 'git' falsos (stubs) no PATH — não
+precisa de SDK nem de rede. Mede por combinação: tempo de parede, processos disparados,
+bytes gerados e pico de RSS do gerador.
+
+Rode:  python benchmarks/bench_generation.py [--presets simple-webapi] [--repeat 3]
+       python benchmarks/bench_generation.py --save-baseline benchmarks/baseline.json
+       python benchmarks/bench_generation.py --compare benchmarks/baseline.json --threshold 20
+"""
+
+import argparse
+import itertools
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from dotnet_easy import cli, presets, scaffold, tracing  # noqa: E402
+
+METRICS = ["wall_s", "spawns", "bytes", "peak_rss_kb"]
+
+# -----------------------
+# Stubs de dotnet/git
+# -----------------------
+# Simulam só o que o gerador lê depois: 'dotnet new' cria o csproj (com os mesmos
+# PackageReference dos templates reais) e os arquivos padrão; o resto é no-op.
+STUB_DOTNET = r'''
+import sys
+from pathlib import Path
+
+TEMPLATES = {
+    "webapi": ("Microsoft.NET.Sdk.Web", [("Microsoft.AspNetCore.OpenApi", "8.0.0"), ("Swashbuckle.AspNetCore", "6.6.2")], ["Program.cs"]),
+    "worker": ("Microsoft.NET.Sdk.Worker", [("Microsoft.Extensions.Hosting", "8.0.0")], ["Program.cs", "Worker.cs"]),
+    "grpc": ("Microsoft.NET.Sdk.Web", [("Grpc.AspNetCore", "2.57.0")], ["Program.cs"]),
+    "xunit": ("Microsoft.NET.Sdk", [("Microsoft.NET.Test.Sdk", "17.8.0"), ("xunit", "2.5.3")], ["UnitTest1.cs"]),
+    "classlib": ("Microsoft.NET.Sdk", [], ["Class1.cs"]),
+}
+
+def opt(args, *names):
+    for i, a in enumerate(args):
+        if a in names and i + 1 < len(args):
+            return args[i + 1]
+    return None
+
+args = sys.argv[1:]
+if args[:1] == ["new"] and len(args) > 1:
+    tpl = args[1]
+    name = opt(args, "-n", "--name")
+    if tpl == "sln":
+        Path(f"{name}.sln").write_text("﻿\r\nMicrosoft Visual Studio Solution File, Format Version 12.00\r\nGlobal\r\nEndGlobal\r\n", encoding="utf-8")
+    elif tpl in TEMPLATES:
+        out = Path(opt(args, "-o", "--output") or name)
+        out.mkdir(parents=True, exist_ok=True)
+        sdk, pkgs, files = TEMPLATES[tpl]
+        refs = "".join(f'    <PackageReference Include="{p}" Version="{v}" />\n' for p, v in pkgs)
+        groups = f"  <ItemGroup>\n{refs}  </ItemGroup>\n\n" if refs else ""
+        (out / f"{name}.csproj").write_text(
+            f'<Project Sdk="{sdk}">\n\n  <PropertyGroup>\n    <TargetFramework>{opt(args, "-f", "--framework")}</TargetFramework>\n'
+            f'  </PropertyGroup>\n\n{groups}</Project>\n', encoding="utf-8")
+        for f in files:
+            (out / f).write_text("// stub\n", encoding="utf-8")
+sys.exit(0)
+'''
+
+STUB_GIT = r'''
+import sys
+sys.exit(0)
+'''
+
+def install_stubs(bin_dir: Path):
+    for name, body in (("dotnet", STUB_DOTNET), ("git", STUB_GIT)):
+        path = bin_dir / name
+        path.write_text(f"#!{sys.executable}\n{body}", encoding="utf-8")
+        path.chmod(0o755)
+
+# -----------------------
+# Execução de uma combinação (num processo filho, para medir RSS isolado)
+# -----------------------
+def run_one(preset, dbs, out_file, use_cache):
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        opts = cli.default_options(no_cache=not use_cache, cache_dir=str(tmp / "cache"))
+        dest = tmp / "out" / "Bench.App"
+        # o cache é aquecido fora da medição: mede-se só a cópia
+        if use_cache:
+            _quiet(scaffold.generate, preset, "Bench.Warmup", tmp / "out" / "Bench.Warmup", "net8.0", dbs, opts)
+            tracing.TRACER.events.clear()
+        start = time.perf_counter()
+        _quiet(scaffold.generate, preset, "Bench.App", dest, "net8.0", dbs, opts)
+        wall = time.perf_counter() - start
+        size = sum(f.stat().st_size for f in dest.rglob("*") if f.is_file())
+    try:
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            rss //= 1024  # macOS reporta bytes
+    except ImportError:
+        rss = 0
+    result = {
+        "wall_s": round(wall, 4),
+        "spawns": sum(1 for e in tracing.TRACER.events if e["cat"] == "cmd"),
+        "bytes": size,
+        "peak_rss_kb": rss,
+    }
+    Path(out_file).write_text(json.dumps(result), encoding="utf-8")
+
+def _quiet(fn, *args):
+    real = sys.stdout
+    sys.stdout = open(os.devnull, "w", encoding="utf-8")
+    try:
+        fn(*args)
+    finally:
+        sys.stdout.close()
+        sys.stdout = real
+
+def measure(preset, dbs, env, use_cache):
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as fh:
+        out_file = fh.name
+    try:
+        cmd = [sys.executable, __file__, "--one", preset, "--one-dbs", ",".join(dbs), "--one-out", out_file]
+        if use_cache:
+            cmd.append("--cache")
+        res = subprocess.run(cmd, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        if res.returncode != 0:
+            raise RuntimeError(f"{preset} {dbs}: {res.stdout.decode('utf-8', errors='replace')[-2000:]}")
+        return json.loads(Path(out_file).read_text(encoding="utf-8"))
+    finally:
+        os.unlink(out_file)
+
+# -----------------------
+# Matriz, relatório e baseline
+# -----------------------
+def db_subsets(only=None):
+    dbs = presets.DATABASES
+    subsets = [list(c) for n in range(len(dbs) + 1) for c in itertools.combinations(dbs, n)]
+    if only is not None:
+        subsets = [s for s in subsets if ",".join(s) in only]
+    return subsets
+
+def combo_key(preset, dbs):
+    return f"{preset}[{','.join(dbs) or 'none'}]"
+
+def compare(results, baseline, threshold):
+    """Imprime a variação contra o baseline; retorna as combinações que pioraram além do limite."""
+    regressions = []
+    print(f"\n{'combinação':<52} {'métrica':<12} {'baseline':>12} {'atual':>12} {'Δ%':>8}")
+    for key, cur in results.items():
+        base = baseline.get(key)
+        if not base:
+            continue
+        for m in METRICS:
+            if not base.get(m):
+                continue
+            delta = (cur[m] - base[m]) / base[m] * 100
+            flag = ""
+            if delta > threshold:
+                flag = "  ⚠️"
+                regressions.append((key, m, delta))
+            print(f"{key:<52} {m:<12} {base[m]:>12} {cur[m]:>12} {delta:>7.1f}%{flag}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark do dotnet_easy com dotnet/git falsos.")
+    parser.add_argument("--presets", nargs="*", default=None, help="Presets a medir (padrão: todos).")
+    parser.add_argument("--dbs", nargs="*", default=None,
+                        help="Subconjuntos de bancos, ex: none sqlserver sqlserver,mongo (padrão: todos os 16).")
+    parser.add_argument("--repeat", type=int, default=1, help="Repetições por combinação (usa a mediana).")
+    parser.add_argument("--cache", action="store_true", help="Mede a geração servida pelo cache de scaffold.")
+    parser.add_argument("--json", metavar="ARQUIVO", default=None, help="Grava os resultados em JSON.")
+    parser.add_argument("--save-baseline", metavar="ARQUIVO", default=None, help="Grava os resultados como baseline.")
+    parser.add_argument("--compare", metavar="ARQUIVO", default=None, help="Compara com um baseline salvo.")
+    parser.add_argument("--threshold", type=float, default=25.0,
+                        help="Piora máxima (%%) tolerada no --compare antes de sair com erro.")
+    parser.add_argument("--one", help=argparse.SUPPRESS)
+    parser.add_argument("--one-dbs", default="", help=argparse.SUPPRESS)
+    parser.add_argument("--one-out", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.one:
+        run_one(args.one, [d for d in args.one_dbs.split(",") if d], args.one_out, args.cache)
+        return 0
+
+    chosen = args.presets or list(presets.PRESETS)
+    only = None
+    if args.dbs is not None:
+        only = {"" if d == "none" else d for d in args.dbs}
+    with tempfile.TemporaryDirectory() as bin_dir:
+        install_stubs(Path(bin_dir))
+        env = dict(os.environ, PATH=bin_dir + os.pathsep + os.environ.get("PATH", ""))
+        results = {}
+        print(f"{'combinação':<52} {'tempo':>9} {'spawns':>7} {'bytes':>9} {'RSS KB':>9}")
+        for preset in chosen:
+            for dbs in db_subsets(only):
+                runs = [measure(preset, dbs, env, args.cache) for _ in range(max(1, args.repeat))]
+                r = {m: statistics.median(run[m] for run in runs) for m in METRICS}
+                key = combo_key(preset, dbs)
+                results[key] = r
+                print(f"{key:<52} {r['wall_s']:>8.3f}s {r['spawns']:>7} {r['bytes']:>9} {r['peak_rss_kb']:>9}")
+
+    total = sum(r["wall_s"] for r in results.values())
+    print(f"\n{len(results)} combinação(ões), {total:.2f}s somados, "
+          f"{sum(r['spawns'] for r in results.values())} processos disparados")
+    payload = {"python": sys.version.split()[0], "platform": sys.platform, "cache": args.cache, "results": results}
+    for path in (args.json, args.save_baseline):
+        if path:
+            Path(path).write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+            print(f"Resultados gravados em {path}")
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} métrica(s) pioraram mais de {args.threshold:.0f}%.")
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+import_budget.py
+Orçamento de tempo de import do CLI: roda 'python -X importtime dotnet_easy_full_v2.py'
+com --version, --list-presets e --help e falha se algum deles importar um módulo
+proibido (o caminho rápido não pode carregar argparse, subprocess, o gerador...) ou
+se o custo de import do que não é o próprio interpretador passar do orçamento.
+
+Rode:  python benchmarks/import_budget.py [--repeat 5] [--scale 2]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+ENTRY = REPO_ROOT / "dotnet_easy_full_v2.py"
+
+# Módulos do pacote que só podem ser importados quando uma geração começa
+GENERATOR_MODULES = ["dotnet_easy." + m for m in (
+    "tracing", "proc", "emit", "msbuild", "templates", "nuget", "update", "scaffold", "cache", "batch")]
+HEAVY_STDLIB = ["subprocess", "concurrent.futures", "threading", "hashlib", "json", "uuid"]
+
+# (argumentos, módulos proibidos, orçamento em ms)
+SCENARIOS = [
+    (["--version"], GENERATOR_MODULES + HEAVY_STDLIB + ["argparse", "pathlib"], 10.0),
+    (["--list-presets"], GENERATOR_MODULES + HEAVY_STDLIB + ["argparse", "pathlib"], 10.0),
+    (["--help"], GENERATOR_MODULES + HEAVY_STDLIB, 40.0),
+]
+
+# -----------------------
+# Medição
+# -----------------------
+def import_times(args):
+    """{módulo: tempo próprio em µs} de uma execução com -X importtime."""
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONPROFILEIMPORTTIME"}
+    res = subprocess.run([sys.executable, "-X", "importtime", *args], cwd=REPO_ROOT, env=env,
+                         stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if res.returncode != 0:
+        raise RuntimeError(f"{args}: saiu com {res.returncode}\n{res.stderr.decode('utf-8', errors='replace')[-2000:]}")
+    times = {}
+    for line in res.stderr.decode("utf-8", errors="replace").splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(self_us)
+    return times
+
+def measure(args, baseline, repeat):
+    """Menor custo (ms) entre as repetições do que foi importado além do interpretador vazio, e os módulos."""
+    best, modules = None, set()
+    for _ in range(max(1, repeat)):
+        times = import_times([str(ENTRY), *args])
+        extra = {m: us for m, us in times.items() if m not in baseline}
+        cost = sum(extra.values()) / 1000
+        best = cost if best is None else min(best, cost)
+        modules |= set(extra)
+    return best, modules
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Orçamento de tempo de import do CLI do dotnet_easy.")
+    parser.add_argument("--repeat", type=int, default=5, help="Execuções por cenário (usa a menor).")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="Multiplica os orçamentos (máquinas de CI lentas).")
+    args = parser.parse_args(argv)
+
+    # o custo do próprio interpretador (site, encodings...) não entra na conta
+    baseline = set(import_times(["-c", "pass"]))
+    failures = []
+    print(f"{'cenário':<18} {'import ms':>10} {'orçamento':>10} {'módulos':>8}")
+    for scenario, forbidden, budget in SCENARIOS:
+        budget *= args.scale
+        cost, modules = measure(scenario, baseline, args.repeat)
+        name = " ".join(scenario)
+        flag = "  ⚠️" if cost > budget else ""
+        print(f"{name:<18} {cost:>10.2f} {budget:>10.1f} {len(modules):>8}{flag}")
+        if cost > budget:
+            failures.append(f"{name}: {cost:.2f} ms de import (orçamento: {budget:.1f} ms)")
+        loaded = sorted(m for m in forbidden if m in modules)
+        if loaded:
+            failures.append(f"{name}: importou {', '.join(loaded)}")
+    if failures:
+        print("\n" + "\n".join(failures))
+        return 1
+    print("\nDentro do orçamento.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,12 @@
+"""
+dotnet_easy
+GERADOR COMPLETO .NET — cross-platform, standalone (Python 3.7+)
+Gera presets, multiple DB support (sqlserver, postgres, mysql, mongo), target framework selection,
+pastas comuns (Utils, Controllers, Commands, Queries, Services, DTOs, Migrations), Docker, docker-compose,
+CI (GitHub Actions), .env, appsettings.json, Serilog wiring, sample DbContext/Mongo wiring, tests, git init.
+Rode: python dotnet_easy_full_v2.py  (ou python -m dotnet_easy)
+
+Os submódulos são importados sob demanda: importar o pacote não carrega nada além disto.
+"""
+
+__version__ = "2.0.0"
@@ -0,0 +1,130 @@
+"""Modo batch: gera as soluções de um manifesto JSON/YAML, sem prompts."""
+
+import io
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .presets import DATABASES, PRESETS, TARGET_FRAMEWORKS
+from .tracing import _thread_log, _ThreadStdout
+from .proc import default_jobs
+from .update import read_gen_manifest
+from .scaffold import generate
+
+# -----------------------
+# Batch (manifesto declarativo, sem prompts)
+# -----------------------
+def load_manifest(path: Path):
+    """
+    Lê o manifesto (JSON, ou YAML se PyYAML estiver instalado). Formato:
+      {"defaults": {"tf": "net8.0", "dbs": [], "dest": "out"},
+       "solutions": [{"preset": "simple-webapi", "name": "Acme.Orders", "dbs": ["postgres"]}, ...]}
+    (uma lista na raiz equivale a "solutions"). 'dest' relativo é resolvido a partir do manifesto.
+    Retorna a lista de jobs validados: dicts com preset, name, tf, dbs, dest, overwrite.
+    """
+    text = path.read_text(encoding="utf-8")
+    if path.suffix.lower() in (".yml", ".yaml"):
+        try:
+            import yaml
+        except ImportError:
+            print("Manifesto YAML requer PyYAML (pip install pyyaml); ou use JSON.")
+            sys.exit(1)
+        data = yaml.safe_load(text)
+    else:
+        data = json.loads(text)
+    if isinstance(data, list):
+        data = {"solutions": data}
+    defaults = data.get("defaults", {})
+    jobs = []
+    errors = []
+    for i, entry in enumerate(data.get("solutions", []), 1):
+        entry = dict(defaults, **entry)
+        name = str(entry.get("name", "")).strip()
+        preset = entry.get("preset")
+        tf = entry.get("tf", "net8.0")
+        dbs = [d for d in entry.get("dbs", []) if d != "none"]
+        if not name:
+            errors.append(f"#{i}: 'name' obrigatório")
+        if preset not in PRESETS:
+            errors.append(f"#{i} ({name}): preset inválido {preset!r}")
+        if tf not in TARGET_FRAMEWORKS:
+            errors.append(f"#{i} ({name}): target inválido {tf!r}")
+        bad = [d for d in dbs if d not in DATABASES]
+        if bad:
+            errors.append(f"#{i} ({name}): bancos inválidos {bad}")
+        dest = Path(entry.get("dest", "."))
+        if not dest.is_absolute():
+            dest = path.parent / dest
+        jobs.append({"preset": preset, "name": name, "tf": tf, "dbs": list(dict.fromkeys(dbs)),
+                     "dest": dest.resolve() / name, "overwrite": bool(entry.get("overwrite", False))})
+    if errors:
+        print("Manifesto inválido:")
+        for e in errors:
+            print(f"  - {e}")
+        sys.exit(1)
+    return jobs
+
+def _run_batch_job(job, opts):
+    """Executa um job num thread do pool; retorna (status, segundos, log)."""
+    _thread_log.buffer = buf = io.StringIO()
+    _thread_log.job = job["name"]
+    start = time.perf_counter()
+    status = "ok"
+    try:
+        if job["dest"].exists() and not job["overwrite"] and read_gen_manifest(job["dest"]) is None:
+            print(f"O diretório {job['dest']} já existe (use \"overwrite\": true no manifesto).")
+            status = "skipped"
+        else:
+            generate(job["preset"], job["name"], job["dest"], job["tf"], job["dbs"], opts)
+    except SystemExit as e:
+        status = "ok" if not e.code else f"erro ({e.code})"
+    except Exception as e:
+        print(f"Erro inesperado: {e}")
+        status = "erro"
+    finally:
+        _thread_log.buffer = None
+        _thread_log.job = None
+    return status, time.perf_counter() - start, buf.getvalue()
+
+def run_batch(manifest, opts):
+    """
+    Gera todas as soluções do manifesto num único processo, com até opts.batch_jobs em
+    paralelo. Catálogo de versões, templates do dotnet new e a pasta global de pacotes
+    NuGet (restore) são compartilhados entre os jobs. Retorna o número de falhas.
+    """
+    jobs = load_manifest(Path(manifest))
+    if not jobs:
+        print("Manifesto sem soluções.")
+        return 0
+    workers = max(1, min(opts.batch_jobs or default_jobs(), len(jobs)))
+    print(f"Batch: {len(jobs)} solução(ões), {workers} em paralelo\n")
+    real_stdout = sys.stdout
+    sys.stdout = _ThreadStdout(real_stdout)
+    start = time.perf_counter()
+    results = []
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_run_batch_job, job, opts) for job in jobs]
+            # Logs impressos na ordem do manifesto (saída determinística)
+            for job, fut in zip(jobs, futures):
+                status, secs, log = fut.result()
+                print(f"===== {job['name']} ({job['preset']}, {job['tf']}) =====")
+                print(log.rstrip())
+                results.append((job, status, secs))
+    finally:
+        sys.stdout = real_stdout
+    wall = time.perf_counter() - start
+
+    print("\nRelatório de throughput")
+    print(f"{'solução':<40} {'preset':<22} {'status':<12} {'tempo':>8}")
+    for job, status, secs in results:
+        print(f"{job['name']:<40} {job['preset']:<22} {status:<12} {secs:>7.1f}s")
+    done = sum(1 for _, status, _ in results if status == "ok")
+    failed = sum(1 for _, status, _ in results if status.startswith("erro"))
+    busy = sum(secs for _, _, secs in results)
+    print(f"\n{done} gerada(s), {failed} falha(s), {len(results) - done - failed} ignorada(s) em {wall:.1f}s")
+    if wall > 0:
+        print(f"Throughput: {done / wall * 60:.1f} soluções/min; paralelismo efetivo {busy / wall:.2f}x")
+    return failed
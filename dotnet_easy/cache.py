@@ -0,0 +1,171 @@
+"""Cache de scaffold: gera uma vez por preset/tf/bancos/versões, depois só copia e renomeia."""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from functools import lru_cache
+from pathlib import Path
+
+from .presets import PRESETS
+from .tracing import TRACER
+from .proc import run
+from .emit import BUILD_OUTPUT_DIRS, describe_emit, emit_files
+from .msbuild import write_sln
+from .templates import TEMPLATES_DIR
+from .nuget import NUGET, default_offline_feed, nuget_catalog
+from .scaffold import scaffold
+
+# -----------------------
+# Scaffold cache (gera uma vez por preset/tf/bancos/versões, depois só copia e renomeia)
+# -----------------------
+CACHE_PLACEHOLDER = "DotnetEasyCacheStamp"
+CACHE_FORMAT = 1
+_cache_locks = {}
+_cache_locks_guard = threading.Lock()
+
+def default_cache_dir():
+    env = os.environ.get("DOTNET_EASY_CACHE_DIR", "").strip()
+    return Path(env) if env else Path.home() / ".dotnet-easy" / "scaffold-cache"
+
+def scaffold_cache_key(key, tf, db_choices, opts):
+    """Hash do que define a árvore gerada: preset, tf, bancos, versões NuGet, modos e o próprio gerador."""
+    feed = ""
+    if opts.offline:
+        feed = str((Path(opts.offline_feed) if opts.offline_feed else default_offline_feed()).resolve())
+    material = {
+        "format": CACHE_FORMAT,
+        "preset": [key, PRESETS[key].describe()],
+        "tf": tf,
+        "dbs": sorted(db_choices),
+        "nuget": NUGET,
+        "versions": nuget_catalog(tf, opts.nuget_catalog),
+        "packages": opts.packages,
+        "cli_wiring": opts.cli_wiring,
+        "ef": [opts.db_context_pool, opts.ef_compiled_model],
+        "pool": [opts.db_pool_min, opts.db_pool_max, opts.db_pool_timeout],
+        "web_perf": opts.web_perf,
+        "runtime_profile": opts.runtime_profile,
+        "publish_mode": opts.publish_mode,
+        "offline_feed": feed,
+        "generator": _generator_digest(),
+    }
+    return hashlib.sha256(json.dumps(material, sort_keys=True).encode("utf-8")).hexdigest()[:24]
+
+@lru_cache(maxsize=None)
+def _generator_digest():
+    # Qualquer mudança nos templates/lógica do gerador (todos os módulos do pacote) invalida o cache
+    digest = hashlib.sha256()
+    for src in sorted(Path(__file__).resolve().parent.glob("*.py")):
+        digest.update(src.name.encode("utf-8") + b"\0" + src.read_bytes())
+    for tpl in sorted(TEMPLATES_DIR.glob("*.tpl")):
+        digest.update(tpl.name.encode("utf-8") + b"\0" + tpl.read_bytes())
+    return digest.hexdigest()
+
+def scaffold_cached(key, project_root_name, dest_root: Path, tf, db_choices, opts, work_root: Path = None):
+    cache_root = Path(opts.cache_dir) if opts.cache_dir else default_cache_dir()
+    entry = cache_root / scaffold_cache_key(key, tf, db_choices, opts)
+    with _cache_locks_guard:
+        lock = _cache_locks.setdefault(entry.name, threading.Lock())
+    with lock:
+        if not (entry / "meta.json").exists():
+            print(f"Cache de scaffold vazio para esta combinação; gerando modelo em {entry}")
+            build_cache_entry(entry, key, tf, db_choices, opts)
+        else:
+            print(f"> [cache] {entry.name}")
+    TRACER.phase("cache (cópia)")
+    start = time.perf_counter()
+    stats = stamp_cache_entry(entry, project_root_name, dest_root, work_root, opts.jobs)
+    print(f"> [cache] copiado para {dest_root} em {(time.perf_counter() - start) * 1000:.0f} ms: {describe_emit(stats)}")
+    # obj/ do cache (restore do modelo) fica fora do commit
+    return [p for p in stats["paths"] if not BUILD_OUTPUT_DIRS & set(p.parts)]
+
+def build_cache_entry(entry: Path, key, tf, db_choices, opts):
+    """
+    Gera o scaffold com o nome CACHE_PLACEHOLDER numa pasta temporária e a publica com
+    rename atômico (outro processo pode estar gerando a mesma entrada).
+    Se o restore funcionar, obj/*.json (project.assets.json etc.) vai junto; senão obj/ é descartado.
+    Com --skip-build o restore do modelo não roda (restored: false).
+    """
+    import shutil
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    tmp = entry.parent / f"{entry.name}.tmp-{uuid.uuid4().hex[:8]}"
+    build_root = tmp / "tree"
+    try:
+        scaffold(key, CACHE_PLACEHOLDER, build_root, tf, db_choices, opts)
+        restored = False
+        if not opts.skip_build:
+            TRACER.phase("cache (restore do modelo)")
+            restored = run("dotnet restore", cwd=str(build_root), check=False) == 0
+        for obj in build_root.glob("**/obj"):
+            if not restored:
+                shutil.rmtree(obj, ignore_errors=True)
+                continue
+            # Só os artefatos do restore; nada de saídas de compilação
+            for item in obj.iterdir():
+                if item.is_dir():
+                    shutil.rmtree(item, ignore_errors=True)
+        for b in build_root.glob("**/bin"):
+            shutil.rmtree(b, ignore_errors=True)
+        (tmp / "meta.json").write_text(json.dumps({
+            "build_root": str(build_root),
+            "placeholder": CACHE_PLACEHOLDER,
+            "restored": restored,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }, indent=2), encoding="utf-8")
+        try:
+            os.rename(tmp, entry)
+        except OSError:
+            pass  # outro gerador publicou a mesma entrada primeiro
+    finally:
+        if tmp.exists():
+            shutil.rmtree(tmp, ignore_errors=True)
+
+def stamp_cache_entry(entry: Path, project_root_name, dest_root: Path, work_root: Path = None, jobs=None):
+    """
+    Copia a árvore do cache para work_root (padrão: dest_root) trocando o placeholder
+    pelo nome real (caminhos, namespaces, nomes de banco em minúsculas) e o caminho
+    absoluto da geração pelo destino final. O .sln é reescrito com os caminhos reais (os
+    GUIDs dos projetos vêm deles), igual ao de uma geração sem cache.
+    Retorna as contagens de emit_files().
+    """
+    meta = json.loads((entry / "meta.json").read_text(encoding="utf-8"))
+    tree = entry / "tree"
+    old_root, new_root = meta["build_root"], str(dest_root)
+    replacements = [
+        (old_root, new_root),
+        (json.dumps(old_root)[1:-1], json.dumps(new_root)[1:-1]),  # caminhos escapados em obj/*.json
+        (meta["placeholder"], project_root_name),
+        (meta["placeholder"].lower(), project_root_name.lower()),
+    ]
+    files, dirs, slns = {}, [], {}
+    for path in sorted(tree.rglob("*")):
+        rel = str(path.relative_to(tree)).replace(meta["placeholder"], project_root_name)
+        if path.is_dir():
+            dirs.append(rel)
+            continue
+        data = path.read_bytes()
+        try:
+            text = data.decode("utf-8")
+        except UnicodeDecodeError:
+            files[rel] = data
+        else:
+            for old, new in replacements:
+                text = text.replace(old, new)
+            if path.suffix == ".csproj":
+                # UserSecretsId precisa ser único por projeto
+                text = re.sub(r"(<UserSecretsId>.*-)[0-9a-fA-F-]{36}(</UserSecretsId>)",
+                              lambda m: m.group(1) + str(uuid.uuid4()) + m.group(2), text)
+            if path.suffix == ".sln":
+                slns[rel] = re.findall(r'Project\("\{[^}]+\}"\) = "[^"]*", "([^"]+\.csproj)"', text)
+                continue
+            files[rel] = text
+    root = work_root or dest_root
+    stats = emit_files(root, files, dirs, jobs)
+    for rel, members in slns.items():
+        write_sln(root / rel, [root / m.replace("\\", "/") for m in members])
+        stats["paths"].append(Path(rel))
+    return stats
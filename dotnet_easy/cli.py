@@ -0,0 +1,210 @@
+"""Linha de comando: prompts, argumentos e o caminho rápido de --version/--list-presets."""
+
+import sys
+
+from . import __version__
+from .presets import DATABASES, PRESETS, PUBLISH_MODES, RUNTIME_PROFILES, TARGET_FRAMEWORKS, WEB_PERF_FEATURES
+
+# O resto do pacote (processos, emissão, templates, NuGet, cache...) só é importado quando
+# uma geração de fato começa: --version, --list-presets e --help não pagam por ele.
+# benchmarks/import_budget.py garante isso.
+
+# -----------------------
+# Prompts
+# -----------------------
+def choose_preset():
+    print("Presets disponíveis:")
+    for i, (k, v) in enumerate(PRESETS.items(), 1):
+        print(f"  {i}) {k} - {v.label}")
+    s = input("Escolha o número do preset: ").strip()
+    if not s:
+        print("Nenhum preset escolhido. Saindo.")
+        sys.exit(1)
+    try:
+        idx = int(s) - 1
+        key = list(PRESETS.keys())[idx]
+        return key
+    except Exception:
+        print("Entrada inválida.")
+        sys.exit(1)
+
+def choose_target_framework():
+    print("\nTargets disponíveis:")
+    options = TARGET_FRAMEWORKS
+    for i, t in enumerate(options, 1):
+        print(f"  {i}) {t}")
+    s = input("Escolha target framework (ENTER para net8.0): ").strip() or "1"
+    try:
+        return options[int(s)-1]
+    except Exception:
+        return "net8.0"
+
+def choose_dbs():
+    print("\nEscolha bancos (pode selecionar múltiplos separando por espaço). Opções:")
+    dbs = DATABASES + ["none"]
+    for i, d in enumerate(dbs, 1):
+        print(f"  {i}) {d}")
+    s = input("Ex: 1 4  (ENTER para 'none'): ").strip()
+    if not s:
+        return []
+    parts = s.split()
+    chosen = []
+    for p in parts:
+        try:
+            idx = int(p) - 1
+            if dbs[idx] != "none":
+                chosen.append(dbs[idx])
+        except:
+            continue
+    # remove duplicates
+    return list(dict.fromkeys(chosen))
+
+def run_generation(opts):
+    """Fluxo interativo: pergunta preset, nome, destino, target e bancos e chama generate()."""
+    from pathlib import Path
+    from .proc import confirm
+    from .scaffold import generate
+    from .update import read_gen_manifest
+    key = choose_preset()
+    project_root_name = input("\nNome da solução/projeto (ex: Company.Product): ").strip()
+    if not project_root_name:
+        print("Nome inválido.")
+        sys.exit(1)
+    target_input = input("Caminho onde gerar (ENTER para pasta atual): ").strip() or "."
+    dest_root = Path(target_input).resolve() / project_root_name
+    if dest_root.exists() and not opts.full and read_gen_manifest(dest_root) is not None:
+        print(f"{dest_root} já foi gerado antes: só o que mudou será refeito; arquivos editados à mão são mantidos.")
+    elif dest_root.exists():
+        print(f"O diretório {dest_root} já existe.")
+        if not confirm("Deseja sobrescrever/sobrescrever conteúdo?"):
+            print("Cancelado.")
+            sys.exit(0)
+
+    tf = choose_target_framework()
+    db_choices = choose_dbs()
+    generate(key, project_root_name, dest_root, tf, db_choices, opts)
+
+# -----------------------
+# Entrypoint
+# -----------------------
+def list_presets():
+    for k, v in PRESETS.items():
+        print(f"{k:<22} {v.label}")
+
+def parse_args(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Gerador de soluções .NET (presets, DBs, Docker, CI).")
+    parser.add_argument("--version", action="version", version=f"dotnet_easy {__version__}")
+    parser.add_argument("--list-presets", action="store_true", help="Lista os presets disponíveis e sai.")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Máximo de comandos 'dotnet' simultâneos (padrão: DOTNET_EASY_JOBS ou min(4, CPUs)).")
+    parser.add_argument("--cli-wiring", action="store_true",
+                        help="Usa o dotnet CLI (chamadas em lote) para referências e .sln em vez da escrita direta.")
+    parser.add_argument("--packages", choices=["pinned", "central", "cli"], default="pinned",
+                        help="pinned: PackageReference com versão do catálogo; central: Directory.Packages.props; "
+                             "cli: um 'dotnet add package' por pacote (restore a cada chamada).")
+    parser.add_argument("--nuget-catalog", metavar="ARQUIVO.json", default=None,
+                        help="JSON {\"Pacote\": \"versão\"} que sobrescreve o catálogo embutido.")
+    parser.add_argument("--offline", action="store_true",
+                        help="Restore somente a partir do feed local (gera nuget.config apontando para ele).")
+    parser.add_argument("--offline-feed", metavar="DIR", default=None,
+                        help="Pasta do feed offline (padrão: DOTNET_EASY_OFFLINE_FEED ou ~/.dotnet-easy/offline-feed).")
+    parser.add_argument("--seed-offline-feed", action="store_true",
+                        help="Baixa para o feed offline todos os pacotes do catálogo (todos os targets) e sai.")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Não usa o cache de scaffold (gera tudo do zero com 'dotnet new').")
+    parser.add_argument("--cache-dir", metavar="DIR", default=None,
+                        help="Pasta do cache de scaffold (padrão: DOTNET_EASY_CACHE_DIR ou ~/.dotnet-easy/scaffold-cache).")
+    parser.add_argument("--db-context-pool", type=int, nargs="?", const=1024, default=None, metavar="N",
+                        help="Registra o DbContext com AddDbContextPool (pool de N contextos, padrão 1024) em vez de AddDbContext.")
+    parser.add_argument("--ef-compiled-model", action="store_true",
+                        help="Gera o modelo compilado do EF Core no Infra (dotnet ef dbcontext optimize, depois do build) "
+                             "e o liga via UseModel.")
+    parser.add_argument("--db-pool-min", type=int, default=None, metavar="N",
+                        help="Mínimo de conexões no pool (SQL Server, Postgres, MySQL e Mongo). Padrão: 10 em APIs, 2 em workers.")
+    parser.add_argument("--db-pool-max", type=int, default=None, metavar="N",
+                        help="Máximo de conexões no pool. Padrão: 200 em APIs, 50 em workers.")
+    parser.add_argument("--db-pool-timeout", type=int, default=None, metavar="SEGUNDOS",
+                        help="Espera máxima por uma conexão do pool (Mongo: waitQueueTimeout). Padrão: 15 em APIs, 30 em workers.")
+    parser.add_argument("--web-perf", nargs="*", choices=WEB_PERF_FEATURES, default=None, metavar="RECURSO",
+                        help="Liga no Program.cs dos projetos webapi compressão de respostas (Brotli/Gzip), output cache "
+                             "e rate limiting, configurados pelo appsettings.json e cobertos por testes. "
+                             f"Sem argumentos: todos ({', '.join(WEB_PERF_FEATURES)}).")
+    parser.add_argument("--runtime-profile", choices=RUNTIME_PROFILES, default=None,
+                        help="Ajuste de runtime dos projetos executáveis: GC/JIT/thread pool no Directory.Build.props, "
+                             "variáveis DOTNET_* no .env e no docker-compose e limites do Kestrel no appsettings.json da API "
+                             "(padrão: os do SDK).")
+    parser.add_argument("--publish-mode", choices=PUBLISH_MODES, default="jit",
+                        help="Como os executáveis são publicados no Dockerfile e na CI: jit (padrão), r2r (ReadyToRun), "
+                             "aot (Native AOT em imagem runtime-deps/chiseled) ou trimmed (self-contained com trimming). "
+                             "Avisa quais templates usam reflexão incompatível com aot/trimmed.")
+    parser.add_argument("--full", action="store_true",
+                        help="Ignora o manifesto .dotnet-easy.json de uma geração anterior e regera tudo.")
+    parser.add_argument("--skip-build", action="store_true",
+                        help="Só gera (e faz o commit git): não roda restore/build/test.")
+    parser.add_argument("--binlog", action="store_true",
+                        help="Grava restore.binlog e build.binlog (-bl) na raiz da solução para análise de build.")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Só mostra o plano (comandos, pastas, arquivos, referências, pacotes); não toca no disco.")
+    parser.add_argument("--trace", metavar="ARQUIVO.json", default=None,
+                        help="Grava um trace (formato Chrome/Perfetto) de cada comando, escrita de arquivo e fase.")
+    parser.add_argument("--timings", action="store_true",
+                        help="Imprime ao final a tabela das fases e comandos mais lentos.")
+    parser.add_argument("--manifest", metavar="ARQUIVO", default=None,
+                        help="Modo batch: gera todas as soluções de um manifesto JSON/YAML, sem prompts.")
+    parser.add_argument("--batch-jobs", type=int, default=None,
+                        help="Soluções geradas em paralelo no modo batch (padrão: igual a --jobs).")
+    return parser.parse_args(argv)
+
+def default_options(**overrides):
+    """Opções padrão do CLI para uso programático: generate(..., default_options(jobs=8))."""
+    opts = parse_args([])
+    for k, v in overrides.items():
+        setattr(opts, k, v)
+    return opts
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    # Caminho rápido: sem argparse nem o resto do pacote
+    if argv == ["--version"]:
+        print(f"dotnet_easy {__version__}")
+        return 0
+    if argv == ["--list-presets"]:
+        list_presets()
+        return 0
+    args = parse_args(argv)
+    if args.list_presets:
+        list_presets()
+        return 0
+    from .tracing import TRACER
+    try:
+        if args.seed_offline_feed:
+            from pathlib import Path
+            from .nuget import default_offline_feed, seed_offline_feed
+            seed_offline_feed(Path(args.offline_feed) if args.offline_feed else default_offline_feed(),
+                              catalog_file=args.nuget_catalog, jobs=args.jobs)
+            return 0
+        if args.manifest:
+            from .batch import run_batch
+            return 1 if run_batch(args.manifest, args) else 0
+        run_generation(args)
+        return 0
+    except KeyboardInterrupt:
+        print("\nCancelado pelo usuário.")
+        return 0
+    except SystemExit as e:
+        # Captura saídas de 'sys.exit' para não imprimir traceback
+        if e.code != 0:
+            print(f"\nScript interrompido com erro (código: {e.code}).")
+        return e.code
+    except Exception as e:
+        print(f"\nOcorreu um erro inesperado no script: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    finally:
+        if args.trace:
+            TRACER.dump(args.trace)
+            print(f"\nTrace gravado em {args.trace} (abra em chrome://tracing ou ui.perfetto.dev)")
+        if args.trace or args.timings:
+            TRACER.summary()
@@ -0,0 +1,180 @@
+"""Escrita direta de .sln e .csproj (referências, itens) e ordem de build."""
+
+import os
+import re
+import uuid
+from pathlib import Path
+
+from .proc import run, run_parallel
+
+# -----------------------
+# MSBuild / solution writer (sem passar pelo dotnet CLI)
+# -----------------------
+SLN_CSPROJ_TYPE = "{FAE04EC0-301F-11D3-BF4B-00C04F79EFBC}"
+SLN_FOLDER_TYPE = "{2150E333-8FDC-42A3-9474-1A3956D46DE8}"
+SLN_CONFIGS = ["Debug|Any CPU", "Release|Any CPU"]
+
+def sln_guid(key):
+    # GUID determinístico a partir do caminho relativo: reexecuções geram o mesmo .sln
+    return "{" + str(uuid.uuid5(uuid.NAMESPACE_URL, key.replace("\\", "/"))).upper() + "}"
+
+def msbuild_path(path: Path, base: Path):
+    return os.path.relpath(path, base).replace("/", "\\")
+
+def insert_csproj_items(csproj: Path, tag, entries):
+    """
+    Insere itens <tag Include="..." attrs /> no csproj no mesmo layout do dotnet CLI:
+    acrescenta ao ItemGroup que já contém itens do mesmo tipo, ou cria um ItemGroup novo
+    após o último existente (ou antes de </Project>). Includes já presentes são ignorados.
+    entries: lista de (include, attrs). Retorna quantos itens foram inseridos.
+    """
+    text = csproj.read_text(encoding="utf-8")
+    nl = "\r\n" if "\r\n" in text else "\n"
+    existing = {i.lower() for i in re.findall(rf'<{tag}\s+Include="([^"]+)"', text)}
+    new_entries = []
+    for include, attrs in entries:
+        if include.lower() not in existing:
+            existing.add(include.lower())
+            new_entries.append((include, attrs))
+    if not new_entries:
+        return 0
+    items = "".join(f'    <{tag} Include="{i}"{(" " + a) if a else ""} />{nl}' for i, a in new_entries)
+
+    group = re.search(rf'([ \t]*<ItemGroup>\s*<{tag}\b.*?)([ \t]*</ItemGroup>)', text, re.S)
+    if group:
+        # Já existe um ItemGroup com esse tipo de item: acrescenta nele
+        text = text[:group.end(1)] + items + text[group.end(1):]
+    else:
+        block = f"  <ItemGroup>{nl}{items}  </ItemGroup>{nl}{nl}"
+        last_group = None
+        for m in re.finditer(r'</ItemGroup>[ \t]*\r?\n(\r?\n)?', text):
+            last_group = m
+        if last_group:
+            if not last_group.group(1):
+                block = nl + block
+            text = text[:last_group.end()] + block + text[last_group.end():]
+        else:
+            # Nenhum ItemGroup: como o 'dotnet add', o grupo novo fecha o projeto
+            m = re.search(r'(\r?\n)(\r?\n)?[ \t]*</Project>', text)
+            if not m:
+                raise ValueError(f"{csproj} não parece um projeto MSBuild")
+            at = m.end(2) if m.group(2) else m.end(1)
+            if not m.group(2):
+                block = nl + block
+            text = text[:at] + block + text[at:]
+    csproj.write_text(text, encoding="utf-8")
+    return len(new_entries)
+
+def remove_csproj_items(csproj: Path, tag, includes):
+    """
+    Remove itens <tag Include="..." /> (e o ItemGroup que ficar vazio). Retorna quantos
+    foram removidos.
+    """
+    text = csproj.read_text(encoding="utf-8")
+    wanted = {i.lower() for i in includes}
+    removed = 0
+    def drop(m):
+        nonlocal removed
+        if m.group(2).lower() not in wanted:
+            return m.group(0)
+        removed += 1
+        return ""
+    text = re.sub(rf'([ \t]*<{tag}\s+Include="([^"]+)"[^>]*?/>[ \t]*\r?\n)', drop, text)
+    if removed:
+        text = re.sub(r'[ \t]*<ItemGroup>\s*</ItemGroup>[ \t]*\r?\n(\r?\n)?', "", text)
+        csproj.write_text(text, encoding="utf-8")
+    return removed
+
+def add_project_references(csproj: Path, deps):
+    """
+    Equivalente a 'dotnet add <csproj> reference <deps...>': caminhos relativos com '\\',
+    sem duplicar referências existentes.
+    """
+    return insert_csproj_items(csproj, "ProjectReference", [(msbuild_path(d, csproj.parent), "") for d in deps])
+
+def write_sln(sln: Path, csprojs):
+    """
+    Escreve o .sln completo (mesmo formato de 'dotnet new sln' + 'dotnet sln add'):
+    pastas de solução para cada diretório intermediário (src/, tests/), tipos de projeto
+    padrão e configurações Debug/Release.
+    """
+    root = sln.parent
+    projects = []
+    folders = {}  # caminho relativo da pasta -> guid
+    nested = []
+    for csproj in csprojs:
+        rel = Path(os.path.relpath(csproj, root))
+        parts = rel.parts[:-1]
+        # Como o CLI: a pasta com o mesmo nome do projeto não vira pasta de solução
+        if parts and parts[-1] == csproj.stem:
+            parts = parts[:-1]
+        parent = None
+        for i in range(len(parts)):
+            key = "/".join(parts[:i + 1])
+            if key not in folders:
+                folders[key] = sln_guid("folder:" + key)
+                projects.append((SLN_FOLDER_TYPE, parts[i], parts[i], folders[key]))
+                if parent:
+                    nested.append((folders[key], parent))
+            parent = folders[key]
+        guid = sln_guid(str(rel))
+        projects.append((SLN_CSPROJ_TYPE, csproj.stem, str(rel).replace("/", "\\"), guid))
+        if parent:
+            nested.append((guid, parent))
+
+    lines = [
+        "",
+        "Microsoft Visual Studio Solution File, Format Version 12.00",
+        "# Visual Studio Version 17",
+        "VisualStudioVersion = 17.0.31903.59",
+        "MinimumVisualStudioVersion = 10.0.40219.1",
+    ]
+    for type_guid, name, path, guid in projects:
+        lines.append(f'Project("{type_guid}") = "{name}", "{path}", "{guid}"')
+        lines.append("EndProject")
+    lines.append("Global")
+    lines.append("\tGlobalSection(SolutionConfigurationPlatforms) = preSolution")
+    lines += [f"\t\t{c} = {c}" for c in SLN_CONFIGS]
+    lines.append("\tEndGlobalSection")
+    lines.append("\tGlobalSection(SolutionProperties) = preSolution")
+    lines.append("\t\tHideSolutionNode = FALSE")
+    lines.append("\tEndGlobalSection")
+    real = [p for p in projects if p[0] == SLN_CSPROJ_TYPE]
+    if real:
+        lines.append("\tGlobalSection(ProjectConfigurationPlatforms) = postSolution")
+        for _, _, _, guid in real:
+            for c in SLN_CONFIGS:
+                lines.append(f"\t\t{guid}.{c}.ActiveCfg = {c}")
+                lines.append(f"\t\t{guid}.{c}.Build.0 = {c}")
+        lines.append("\tEndGlobalSection")
+    if nested:
+        lines.append("\tGlobalSection(NestedProjects) = preSolution")
+        lines += [f"\t\t{child} = {parent}" for child, parent in nested]
+        lines.append("\tEndGlobalSection")
+    lines.append("EndGlobal")
+    with open(sln, "w", encoding="utf-8-sig", newline="") as fh:
+        fh.write("\r\n".join(lines) + "\r\n")
+
+def wire_solution(dest_root: Path, sln_name, csprojs, refs, order, use_cli=False, jobs=None):
+    """
+    Grava referências entre projetos e a membership do .sln.
+    Padrão: escrita direta dos arquivos (zero processos). Fallback (use_cli ou erro na
+    escrita nativa): um 'dotnet add reference' por csproj e um único 'dotnet sln add'.
+    """
+    sln = dest_root / f"{sln_name}.sln"
+    if not use_cli:
+        try:
+            added = sum(add_project_references(t, refs[t]) for t in order if t in refs)
+            write_sln(sln, csprojs)
+            print(f"> [nativo] {added} ProjectReference(s) e {len(csprojs)} projeto(s) em {sln.name}")
+            return
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Escrita nativa de csproj/sln falhou ({e}); usando dotnet CLI em lote.")
+    if not sln.exists():
+        run(f"dotnet new sln -n {sln_name}", cwd=str(dest_root))
+    run_parallel([
+        (f"dotnet add \"{t}\" reference " + " ".join(f"\"{d}\"" for d in refs[t]), str(dest_root))
+        for t in order if t in refs
+    ], jobs)
+    if csprojs:
+        run("dotnet sln add " + " ".join(f"\"{c}\"" for c in csprojs), cwd=str(dest_root))
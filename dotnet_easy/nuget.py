@@ -0,0 +1,219 @@
+"""Mapeamento e catálogo de pacotes NuGet, PackageReference/Directory.Packages.props e feed offline."""
+
+import json
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+
+from .presets import PRESETS, TARGET_FRAMEWORKS
+from .proc import run, run_parallel
+from .msbuild import insert_csproj_items
+
+# -----------------------
+# NuGet packages mapping
+# -----------------------
+NUGET = {
+    "serilog": ["Serilog.AspNetCore", "Serilog.Sinks.Console"],
+    "swashbuckle": ["Swashbuckle.AspNetCore"],
+    "mediatr": ["MediatR.Extensions.Microsoft.DependencyInjection"],
+    "autofac": ["Autofac.Extensions.DependencyInjection"],
+    "polly": ["Polly", "Microsoft.Extensions.Http.Polly"],
+    "healthchecks": ["AspNetCore.HealthChecks.UI.Client"],
+    # EF Core base packages (we'll add provider specific)
+    "efcore_base": ["Microsoft.EntityFrameworkCore", "Microsoft.EntityFrameworkCore.Design"],
+    # Providers
+    "sqlserver": ["Microsoft.EntityFrameworkCore.SqlServer"],
+    "postgres": ["Npgsql.EntityFrameworkCore.PostgreSQL"],
+    "mysql": ["Pomelo.EntityFrameworkCore.MySql"],
+    # Provider em memória dos testes do repositório (projeto de testes)
+    "efcore_tests": ["Microsoft.EntityFrameworkCore.Sqlite"],
+    # API em memória (WebApplicationFactory) nos testes de --web-perf
+    "aspnet_tests": ["Microsoft.AspNetCore.Mvc.Testing"],
+    # Mongo
+    "mongo": ["MongoDB.Driver"]
+}
+
+# Templates do 'dotnet new' usados pelos presets (os pacotes que eles trazem também vão para o feed offline)
+DOTNET_NEW_TEMPLATES = ["webapi", "worker", "grpc", "xunit", "classlib"]
+
+# Catálogo local de versões fixadas por target (modos --packages pinned/central)
+NUGET_VERSIONS = {
+    "net8.0": {
+        "Serilog.AspNetCore": "8.0.3",
+        "Serilog.Sinks.Console": "6.0.0",
+        "Swashbuckle.AspNetCore": "6.6.2",
+        "MediatR.Extensions.Microsoft.DependencyInjection": "11.1.0",
+        "Autofac.Extensions.DependencyInjection": "10.0.0",
+        "Polly": "8.4.2",
+        "Microsoft.Extensions.Http.Polly": "8.0.10",
+        "AspNetCore.HealthChecks.UI.Client": "8.0.1",
+        "Microsoft.EntityFrameworkCore": "8.0.10",
+        "Microsoft.EntityFrameworkCore.Design": "8.0.10",
+        "Microsoft.EntityFrameworkCore.SqlServer": "8.0.10",
+        "Microsoft.EntityFrameworkCore.Sqlite": "8.0.10",
+        "Microsoft.AspNetCore.Mvc.Testing": "8.0.10",
+        "Npgsql.EntityFrameworkCore.PostgreSQL": "8.0.10",
+        "Pomelo.EntityFrameworkCore.MySql": "8.0.2",
+        "MongoDB.Driver": "2.28.0",
+    },
+    "net7.0": {
+        "Serilog.AspNetCore": "7.0.0",
+        "Serilog.Sinks.Console": "5.0.1",
+        "Swashbuckle.AspNetCore": "6.5.0",
+        "MediatR.Extensions.Microsoft.DependencyInjection": "11.1.0",
+        "Autofac.Extensions.DependencyInjection": "9.0.0",
+        "Polly": "8.4.2",
+        "Microsoft.Extensions.Http.Polly": "7.0.20",
+        "AspNetCore.HealthChecks.UI.Client": "7.1.0",
+        "Microsoft.EntityFrameworkCore": "7.0.20",
+        "Microsoft.EntityFrameworkCore.Design": "7.0.20",
+        "Microsoft.EntityFrameworkCore.SqlServer": "7.0.20",
+        "Microsoft.EntityFrameworkCore.Sqlite": "7.0.20",
+        "Microsoft.AspNetCore.Mvc.Testing": "7.0.20",
+        "Npgsql.EntityFrameworkCore.PostgreSQL": "7.0.18",
+        "Pomelo.EntityFrameworkCore.MySql": "7.0.0",
+        "MongoDB.Driver": "2.28.0",
+    },
+}
+
+# -----------------------
+# Helper logic for NuGet packages
+# -----------------------
+def packages_for_project(role, kind, key, db_choices, web_perf=False):
+    """
+    Lista ordenada (sem duplicatas) dos pacotes NUGET que o projeto (papel no preset) recebe.
+    web_perf: o projeto de testes ganha os testes de --web-perf (WebApplicationFactory).
+    """
+    groups = []
+    # Serilog (WebAPI, Worker, Application)
+    if kind in ("webapi", "worker", "grpc") or role == "application":
+        groups.append("serilog")
+    # Swashbuckle (WebAPI)
+    if kind == "webapi":
+        groups.append("swashbuckle")
+    # EF Core (Infra E Api/Worker)
+    if (kind in ("webapi", "worker", "grpc") or role == "infra") and any(db in ("sqlserver","postgres","mysql") for db in db_choices):
+        groups.append("efcore_base")
+        groups += [db for db in ("sqlserver", "postgres", "mysql") if db in db_choices]
+    # SQLite em memória para os testes do TodoRepository (projeto de testes que referencia a Infra)
+    if kind == "test" and PRESETS[key].depends_on(role, "infra") and any(db in ("sqlserver","postgres","mysql") for db in db_choices):
+        groups.append("efcore_tests")
+    if kind == "test" and web_perf:
+        groups.append("aspnet_tests")
+    # Mongo (Infra E Api/Worker)
+    if (kind in ("webapi", "worker", "grpc") or role == "infra") and "mongo" in db_choices:
+        groups.append("mongo")
+    # Mediatr / Autofac (Application / Api)
+    if kind in ("webapi", "grpc") or role == "application":
+        groups += ["mediatr", "autofac"]
+    # Polly (Webhook-manager preset)
+    if "webhook" in key and (kind == "worker" or role == "processor"): # 'key' é o nome do preset
+        groups.append("polly")
+    # HealthChecks (Worker preset)
+    if "worker" in kind or "processor" in kind:
+        groups.append("healthchecks")
+    return list(dict.fromkeys(pkg for g in groups for pkg in NUGET.get(g, [])))
+
+def nuget_catalog(tf, catalog_file=None):
+    """Versões fixadas para o target; um JSON {"Pacote": "versão"} sobrescreve o padrão."""
+    versions = dict(NUGET_VERSIONS.get(tf, {}))
+    if catalog_file:
+        versions.update(_read_catalog_file(str(Path(catalog_file).resolve())))
+    return versions
+
+@lru_cache(maxsize=None)
+def _read_catalog_file(path):
+    # lido uma vez por processo, mesmo quando o batch gera centenas de soluções
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+def add_package_references(csproj: Path, packages):
+    """packages: lista de (id, versão ou None para gestão central)."""
+    return insert_csproj_items(csproj, "PackageReference",
+                               [(pkg, f'Version="{ver}"' if ver else "") for pkg, ver in packages])
+
+def write_central_package_props(dest_root: Path, csprojs, versions):
+    """
+    Central Package Management: move todo Version="..." dos PackageReference para um
+    Directory.Packages.props na raiz (o catálogo tem precedência sobre versões de template).
+    """
+    used = {}
+    for csproj in csprojs:
+        text = csproj.read_text(encoding="utf-8")
+        def strip_version(m):
+            used.setdefault(m.group(2), m.group(3))
+            return m.group(1) + m.group(4)
+        text = re.sub(r'(<PackageReference\s+Include="([^"]+)")\s+Version="([^"]*)"(.*?>)', strip_version, text)
+        for pkg in re.findall(r'<PackageReference\s+Include="([^"]+)"', text):
+            used.setdefault(pkg, None)
+        csproj.write_text(text, encoding="utf-8")
+    lines = [
+        "<Project>",
+        "  <PropertyGroup>",
+        "    <ManagePackageVersionsCentrally>true</ManagePackageVersionsCentrally>",
+        "  </PropertyGroup>",
+        "  <ItemGroup>",
+    ]
+    for pkg in sorted(used, key=str.lower):
+        ver = versions.get(pkg) or used[pkg]
+        if not ver:
+            raise ValueError(f"Pacote {pkg} sem versão no catálogo")
+        lines.append(f'    <PackageVersion Include="{pkg}" Version="{ver}" />')
+    lines += ["  </ItemGroup>", "</Project>", ""]
+    (dest_root / "Directory.Packages.props").write_text("\n".join(lines), encoding="utf-8")
+
+# -----------------------
+# Offline NuGet feed
+# -----------------------
+def default_offline_feed():
+    env = os.environ.get("DOTNET_EASY_OFFLINE_FEED", "").strip()
+    return Path(env) if env else Path.home() / ".dotnet-easy" / "offline-feed"
+
+def seed_offline_feed(feed: Path, catalog_file=None, jobs=None):
+    """
+    Popula o feed local (layout hierárquico, o mesmo da pasta global de pacotes) com
+    todos os pacotes do catálogo + os que os templates do 'dotnet new' trazem, para cada
+    target suportado, incluindo dependências transitivas, e os runtime packs/ferramentas
+    dos --publish-mode com RID. Precisa de rede uma única vez.
+    """
+    import tempfile
+    from .scaffold import PUBLISH_PROFILES, PUBLISH_RID
+    feed.mkdir(parents=True, exist_ok=True)
+    for tf in TARGET_FRAMEWORKS:
+        versions = nuget_catalog(tf, catalog_file)
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            run_parallel([
+                (f"dotnet new {tpl} -n Seed{tpl} -f {tf} -o \"{tmp / tpl}\" --no-restore", str(tmp))
+                for tpl in DOTNET_NEW_TEMPLATES
+            ], jobs)
+            template_pkgs = {}
+            for csproj in tmp.glob("*/*.csproj"):
+                for pkg, ver in re.findall(r'<PackageReference\s+Include="([^"]+)"\s+Version="([^"]+)"', csproj.read_text(encoding="utf-8")):
+                    template_pkgs.setdefault(pkg, ver)
+            template_pkgs.update(versions)
+            seed = tmp / "Seed.csproj"
+            seed.write_text(f'<Project Sdk="Microsoft.NET.Sdk">\n  <PropertyGroup>\n    <TargetFramework>{tf}</TargetFramework>\n  </PropertyGroup>\n</Project>\n', encoding="utf-8")
+            add_package_references(seed, sorted(template_pkgs.items()))
+            # dotnet-ef (--ef-compiled-model) é um pacote de ferramenta: baixado, não referenciado
+            ef_tool = versions["Microsoft.EntityFrameworkCore.Design"]
+            insert_csproj_items(seed, "PackageDownload", [("dotnet-ef", f'Version="[{ef_tool}]"')])
+            run(f"dotnet restore \"{seed}\" --packages \"{feed}\"", cwd=str(tmp))
+            # r2r/aot/trimmed: o restore com RID e as propriedades do modo faz o SDK baixar runtime
+            # packs, Crossgen2, ILCompiler e ILLink nas versões que ele mesmo vai pedir no publish
+            for mode, profile in PUBLISH_PROFILES.items():
+                if not profile["args"]:
+                    continue
+                props = {"TargetFramework": tf, "RuntimeIdentifier": PUBLISH_RID,
+                         "SelfContained": str(profile["self_contained"]).lower(), **profile["msbuild"]}
+                body = "\n".join(f"    <{k}>{v}</{k}>" for k, v in props.items())
+                proj = tmp / f"publish-{mode}" / f"Seed.{mode}.csproj"
+                proj.parent.mkdir()
+                proj.write_text(f'<Project Sdk="Microsoft.NET.Sdk.Web">\n  <PropertyGroup>\n{body}\n  </PropertyGroup>\n</Project>\n', encoding="utf-8")
+                run(f"dotnet restore \"{proj}\" --packages \"{feed}\"", cwd=str(tmp))
+    print(f"\n✅ Feed offline pronto em {feed}")
+
+def missing_from_feed(feed: Path, packages):
+    """packages: dict id -> versão. Retorna os que não estão no feed."""
+    return [f"{pkg} {ver}" for pkg, ver in packages.items()
+            if not (feed / pkg.lower() / ver.lower()).is_dir()]
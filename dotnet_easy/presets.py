@@ -0,0 +1,144 @@
+"""
+Registro de presets, targets e bancos suportados (importar este módulo não custa nada).
+Cada preset declara seus projetos por papel e as referências entre papéis (um DAG),
+validadas e ordenadas uma única vez no registro.
+"""
+
+import os
+
+# -----------------------
+# Registro de presets
+# -----------------------
+# kind -> template do 'dotnet new' (test vira xunit)
+PROJECT_KINDS = ("webapi", "worker", "grpc", "classlib", "test")
+
+def topo_order(nodes, edges):
+    """
+    Ordena nodes de forma que dependências venham antes dos dependentes.
+    edges: dict node -> lista de nodes dos quais ele depende. Ordem estável (segue 'nodes').
+    """
+    ordered = []
+    state = {}
+    def visit(n):
+        if state.get(n) == "done":
+            return
+        if state.get(n) == "visiting":
+            raise ValueError(f"Ciclo de referências envolvendo {n}")
+        state[n] = "visiting"
+        for dep in edges.get(n, []):
+            visit(dep)
+        state[n] = "done"
+        ordered.append(n)
+    for n in nodes:
+        visit(n)
+    return ordered
+
+class Preset:
+    """
+    Preset validado. projects: papel -> (sufixo do projeto, kind), na ordem declarada;
+    refs: papel -> papéis dos quais ele depende; order: papéis em ordem de build
+    (dependências primeiro). O gerador acha projetos por papel, sem varrer nomes.
+    """
+    def __init__(self, key, label, projects, refs=(), is_web=False):
+        self.key = key
+        self.label = label
+        self.is_web = is_web
+        self.projects = {}
+        for role, suffix, kind in projects:
+            if role in self.projects:
+                raise ValueError(f"Preset '{key}': papel '{role}' declarado duas vezes")
+            if kind not in PROJECT_KINDS:
+                raise ValueError(f"Preset '{key}': kind '{kind}' inválido (use {', '.join(PROJECT_KINDS)})")
+            self.projects[role] = (suffix, kind)
+        self.refs = {}
+        for role, dep in refs:
+            for r in (role, dep):
+                if r not in self.projects:
+                    raise ValueError(f"Preset '{key}': referência para papel desconhecido '{r}'")
+            if role == dep:
+                raise ValueError(f"Preset '{key}': '{role}' referencia a si mesmo")
+            deps = self.refs.setdefault(role, [])
+            if dep not in deps:
+                deps.append(dep)
+        try:
+            self.order = topo_order(list(self.projects), self.refs)
+        except ValueError as e:
+            raise ValueError(f"Preset '{key}': {e}") from None
+
+    def depends_on(self, role, dep):
+        """True se 'role' enxerga 'dep' pelas ProjectReference (diretas ou transitivas)."""
+        pending, seen = list(self.refs.get(role, [])), set()
+        while pending:
+            r = pending.pop()
+            if r == dep:
+                return True
+            if r not in seen:
+                seen.add(r)
+                pending += self.refs.get(r, [])
+        return False
+
+    def describe(self):
+        """Forma serializável (JSON) da definição; entra na chave do cache de scaffold."""
+        return {"label": self.label, "is_web": self.is_web,
+                "projects": [[r, s, k] for r, (s, k) in self.projects.items()],
+                "refs": {r: deps for r, deps in self.refs.items()}}
+
+PRESETS = {}
+
+def register_preset(key, label, projects, refs=(), is_web=False, replace=False):
+    """
+    Registra um preset (presets embutidos e de terceiros usam a mesma chamada).
+    projects: [(papel, sufixo, kind)]; refs: [(papel, papel do qual depende)].
+    Levanta ValueError se a definição for inválida ou tiver ciclos.
+    """
+    if key in PRESETS and not replace:
+        raise ValueError(f"Preset '{key}' já registrado")
+    PRESETS[key] = preset = Preset(key, label, projects, refs, is_web)
+    return preset
+
+# -----------------------
+# Presets embutidos
+# -----------------------
+register_preset(
+    "clean-webapi-efcore", "Clean Architecture WebAPI (Api/Domain/Infra/Application/Tests)",
+    projects=[("api", "Api", "webapi"), ("domain", "Domain", "classlib"), ("infra", "Infra", "classlib"),
+              ("application", "Application", "classlib"), ("tests", "Tests", "test")],
+    refs=[("application", "domain"), ("infra", "domain"), ("application", "infra"),
+          ("api", "application"), ("api", "infra"), ("tests", "infra"), ("tests", "api")],
+    is_web=True)
+register_preset(
+    "worker-service", "Worker Service (BackgroundService + infra/domain/tests)",
+    projects=[("worker", "Worker", "worker"), ("domain", "Domain", "classlib"), ("infra", "Infra", "classlib"),
+              ("tests", "Tests", "test")],
+    refs=[("infra", "domain"), ("worker", "infra"), ("worker", "domain"), ("tests", "infra"), ("tests", "worker")])
+register_preset(
+    "simple-webapi", "Simple WebAPI (single API project + Tests)",
+    projects=[("api", "Api", "webapi"), ("tests", "Tests", "test")],
+    refs=[("tests", "api")],
+    is_web=True)
+register_preset(
+    "webhook-manager", "Webhook Manager (API + Processor + Domain/Infra/Tests)",
+    projects=[("api", "Api", "webapi"), ("processor", "Processor", "worker"), ("domain", "Domain", "classlib"),
+              ("infra", "Infra", "classlib"), ("tests", "Tests", "test")],
+    refs=[("infra", "domain"), ("api", "infra"), ("api", "domain"), ("processor", "infra"), ("processor", "domain"),
+          ("tests", "infra"), ("tests", "api"), ("tests", "processor")],
+    is_web=True)
+register_preset(
+    "grpc-clean", "gRPC Clean (GrpcService + Domain/Infra/Application/Tests)",
+    projects=[("api", "GrpcService", "grpc"), ("domain", "Domain", "classlib"), ("infra", "Infra", "classlib"),
+              ("application", "Application", "classlib"), ("tests", "Tests", "test")],
+    refs=[("application", "domain"), ("infra", "domain"), ("application", "infra"),
+          ("api", "application"), ("api", "infra"), ("tests", "infra")])
+
+TARGET_FRAMEWORKS = ["net8.0", "net7.0"]
+DATABASES = ["sqlserver", "postgres", "mysql", "mongo"]
+# Middlewares de desempenho dos projetos webapi (--web-perf)
+WEB_PERF_FEATURES = ["compression", "output-cache", "rate-limit"]
+# Perfis de runtime (GC, JIT, thread pool, Kestrel) dos projetos executáveis (--runtime-profile)
+RUNTIME_PROFILES = ["latency", "throughput", "low-memory"]
+# Modo de publicação dos executáveis no Dockerfile e na CI (--publish-mode)
+PUBLISH_MODES = ["jit", "r2r", "aot", "trimmed"]
+
+# Presets de terceiros: módulos (separados por vírgula) que chamam register_preset no import
+for _module in filter(None, (m.strip() for m in os.environ.get("DOTNET_EASY_PRESETS", "").split(","))):
+    __import__(_module)
@@ -0,0 +1,100 @@
+"""Execução de processos externos (dotnet/git) com ambiente enxuto e paralelismo limitado."""
+
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from .tracing import TRACER, _thread_log
+
+# -----------------------
+# Processos (dotnet/git) e paralelismo
+# -----------------------
+def command_phase(cmd):
+    """Nome agregado de um comando para o trace: 'dotnet new', 'dotnet add package', 'git commit'..."""
+    words = cmd.split()
+    if len(words) > 1 and words[0] in ("dotnet", "git"):
+        if words[:2] == ["dotnet", "add"]:
+            sub = next((w for w in words[2:] if w in ("package", "reference")), "")
+            return f"dotnet add {sub}".strip()
+        return f"{words[0]} {words[1]}"
+    return words[0] if words else cmd
+
+# Ambiente de todo processo disparado: sem banner/primeira execução/telemetria, e com os
+# servidores de build (nós do MSBuild, servidor do MSBuild, VBCSCompiler) reaproveitados
+# entre todas as gerações da sessão em vez de subir a frio a cada 'dotnet build'.
+DOTNET_ENV = {
+    "DOTNET_NOLOGO": "1",
+    "DOTNET_SKIP_FIRST_TIME_EXPERIENCE": "1",
+    "DOTNET_CLI_TELEMETRY_OPTOUT": "1",
+    "DOTNET_CLI_USE_MSBUILD_SERVER": "1",
+}
+
+@lru_cache(maxsize=None)
+def _spawn_env():
+    env = dict(os.environ, **DOTNET_ENV)
+    env.pop("MSBUILDDISABLENODEREUSE", None)
+    return env
+
+def _spawn(cmd, cwd, capture):
+    with TRACER.span(command_phase(cmd), "cmd", cmd=cmd):
+        if capture:
+            res = subprocess.run(cmd, shell=True, cwd=cwd, env=_spawn_env(),
+                                 stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+            return res.returncode, res.stdout.decode("utf-8", errors="replace")
+        return subprocess.run(cmd, shell=True, cwd=cwd, env=_spawn_env()).returncode, ""
+
+def run(cmd, cwd=None, check=True):
+    print(f"> {cmd}")
+    # Dentro de um job do batch a saída do processo vai para o log do job
+    capture = getattr(_thread_log, "buffer", None) is not None
+    returncode, out = _spawn(cmd, cwd, capture)
+    if out.strip():
+        print(out.rstrip())
+    if check and returncode != 0:
+        print(f"Erro ({returncode}) executando: {cmd}")
+        sys.exit(returncode)
+    return returncode
+
+def run_captured(cmd, cwd=None):
+    # Variante de run() para uso em threads: captura a saída em vez de imprimir
+    return _spawn(cmd, cwd, capture=True)
+
+def run_parallel(steps, jobs=None):
+    """
+    Executa comandos independentes num pool limitado de threads.
+    steps: lista de (cmd, cwd). A saída é impressa na ordem de submissão (determinística),
+    e todas as falhas são reportadas antes de abortar.
+    """
+    if not steps:
+        return
+    jobs = max(1, min(jobs or default_jobs(), len(steps)))
+    job = getattr(_thread_log, "job", None)
+    def step(cmd, cwd):
+        _thread_log.job = job  # o trace atribui o comando ao job do batch que o disparou
+        return run_captured(cmd, cwd)
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(step, cmd, cwd) for cmd, cwd in steps]
+        results = []
+        for (cmd, _), fut in zip(steps, futures):
+            code, out = fut.result()
+            print(f"> {cmd}")
+            if out.strip():
+                print(out.rstrip())
+            results.append((cmd, code))
+    failed = [(cmd, code) for cmd, code in results if code != 0]
+    if failed:
+        for cmd, code in failed:
+            print(f"Erro ({code}) executando: {cmd}")
+        sys.exit(failed[0][1])
+
+def default_jobs():
+    env = os.environ.get("DOTNET_EASY_JOBS", "").strip()
+    if env.isdigit() and int(env) > 0:
+        return int(env)
+    return min(4, os.cpu_count() or 1)
+
+def confirm(prompt: str) -> bool:
+    r = input(f"{prompt} (y/N): ").strip().lower()
+    return r == "y"
@@ -0,0 +1,903 @@
+"""Plano de scaffold, execução (staging), build e commit git de uma solução."""
+
+import os
+import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+from .presets import DATABASES, PRESETS, WEB_PERF_FEATURES
+from .tracing import TRACER, _thread_log
+from .proc import default_jobs, run, run_captured, run_parallel
+from .emit import describe_emit, emit_files, walk_files
+from .msbuild import wire_solution
+from .templates import render
+from .nuget import (add_package_references, default_offline_feed, missing_from_feed, nuget_catalog,
+                    packages_for_project, write_central_package_props)
+from .update import GEN_MANIFEST, read_gen_manifest, update_tree, write_gen_manifest
+
+# -----------------------
+# Helper logic for DB wiring
+# -----------------------
+# Pool de conexões por perfil do preset: APIs atendem muitas requisições curtas em paralelo
+# (pool maior e aquecido, multiplexing no Npgsql); workers têm poucos consumidores longos
+POOL_PROFILES = {
+    "web": {"min": 10, "max": 200, "timeout": 15, "multiplexing": True},
+    "worker": {"min": 2, "max": 50, "timeout": 30, "multiplexing": False},
+}
+
+def connection_pool(key, opts):
+    """Parâmetros de pool do preset (perfil web ou worker), com os overrides --db-pool-*."""
+    web = any(kind in ("webapi", "grpc") for _, kind in PRESETS[key].projects.values())
+    pool = dict(POOL_PROFILES["web" if web else "worker"])
+    for k in ("min", "max", "timeout"):
+        value = getattr(opts, f"db_pool_{k}")
+        if value is not None:
+            pool[k] = value
+    if not 0 <= pool["min"] <= pool["max"] or pool["max"] < 1 or pool["timeout"] < 1:
+        print(f"Pool de conexões inválido: min={pool['min']} max={pool['max']} timeout={pool['timeout']}s")
+        sys.exit(1)
+    return pool
+
+def build_conn_strings(selected_dbs, project, pool):
+    conn_strings = []
+    env_vars = []
+    mongo_conn = ""
+    mongo_db = ""
+    for db in selected_dbs:
+        if db == "sqlserver":
+            cs = (f"Server=db;Database={project};User Id=sa;Password=Your_password123;"
+                  f"Min Pool Size={pool['min']};Max Pool Size={pool['max']};Connect Timeout={pool['timeout']};")
+            conn_strings.append(f'"SqlServer": "{cs}"')
+            env_vars.append(f'ConnectionStrings__SqlServer={cs}')
+        if db == "postgres":
+            cs = (f"Host=postgres;Database={project};Username=postgres;Password=Your_password123;"
+                  f"Minimum Pool Size={pool['min']};Maximum Pool Size={pool['max']};Timeout={pool['timeout']};"
+                  f"Multiplexing={'true' if pool['multiplexing'] else 'false'}")
+            conn_strings.append(f'"Postgres": "{cs}"')
+            env_vars.append(f'ConnectionStrings__Postgres={cs}')
+        if db == "mysql":
+            cs = (f"Server=mysql;Database={project};User=root;Password=Your_password123;"
+                  f"Minimum Pool Size={pool['min']};Maximum Pool Size={pool['max']};Connection Timeout={pool['timeout']};"
+                  "Connection Reset=true;")
+            conn_strings.append(f'"MySql": "{cs}"')
+            env_vars.append(f'ConnectionStrings__MySql={cs}')
+        if db == "mongo":
+            mongo_conn = "mongodb://mongo:27017"
+            mongo_db = project.lower()
+            env_vars.append(f'MongoSettings__ConnectionString={mongo_conn}')
+            env_vars.append(f'MongoSettings__Database={mongo_db}')
+            env_vars.append(f'MongoSettings__MinPoolSize={pool["min"]}')
+            env_vars.append(f'MongoSettings__MaxPoolSize={pool["max"]}')
+            env_vars.append(f'MongoSettings__WaitQueueTimeoutSeconds={pool["timeout"]}')
+    return ",\n    ".join(conn_strings), "\n".join(env_vars), mongo_conn, mongo_db
+
+def db_flags(selected_dbs):
+    """Variáveis de condição dos templates: um booleano por banco + ef (algum relacional)."""
+    flags = {db: db in selected_dbs for db in DATABASES}
+    flags["ef"] = any(db in ("sqlserver", "postgres", "mysql") for db in selected_dbs)
+    return flags
+
+def ef_registration(opts):
+    """
+    Variáveis de _db_registrations.cs.tpl: AddDbContextPool com --db-context-pool (um pool
+    de contextos reaproveitados em vez de um novo por escopo) e o modelo compilado do EF.
+    """
+    pool = opts.db_context_pool
+    return {
+        "add_db_context": "AddDbContextPool" if pool else "AddDbContext",
+        "pool_size": f", poolSize: {pool}" if pool else "",
+        "compiled_model": opts.ef_compiled_model,
+        "use_model": ".UseAppDbContextModel()" if opts.ef_compiled_model else "",
+    }
+
+def web_perf(opts):
+    """
+    Flags de template dos middlewares pedidos com --web-perf (sem argumentos: todos):
+    compression, output_cache e rate_limit.
+    """
+    chosen = WEB_PERF_FEATURES if opts.web_perf == [] else (opts.web_perf or ())
+    return {feature.replace("-", "_"): feature in chosen for feature in WEB_PERF_FEATURES}
+
+# -----------------------
+# Perfis de runtime (--runtime-profile)
+# -----------------------
+# msbuild: propriedades dos projetos executáveis (vão para o runtimeconfig.json);
+# env: as mesmas chaves como DOTNET_* do container, para ajustar no deploy sem rebuild (o runtime
+# lê os números em hexadecimal); kestrel: limites das APIs (appsettings "Kestrel:Limits").
+RUNTIME_TUNING = {
+    # GC de servidor com coletas de gen2 em background (pausas curtas) e thread pool já aquecido
+    # para rajadas, sem esperar a injeção gradual de threads
+    "latency": {
+        "msbuild": {"ServerGarbageCollection": "true", "ConcurrentGarbageCollection": "true",
+                    "TieredCompilation": "true", "TieredPGO": "true", "ThreadPoolMinThreads": "64"},
+        "env": {"DOTNET_gcServer": "1", "DOTNET_gcConcurrent": "1", "DOTNET_TieredPGO": "1"},
+        "kestrel": {"max_connections": 5000, "max_upgraded": 1000, "max_body": 10 * 1024 * 1024,
+                    "keep_alive": "00:00:30", "headers_timeout": "00:00:10",
+                    "max_streams": 100, "connection_window": 1024 * 1024, "stream_window": 768 * 1024},
+    },
+    # GC de servidor sem o background GC, gen0 maior (menos coletas) e memória retida entre coletas
+    "throughput": {
+        "msbuild": {"ServerGarbageCollection": "true", "ConcurrentGarbageCollection": "false",
+                    "RetainVMGarbageCollection": "true", "TieredCompilation": "true", "TieredPGO": "true"},
+        "env": {"DOTNET_gcServer": "1", "DOTNET_gcConcurrent": "0", "DOTNET_GCgen0size": "0x4000000",
+                "DOTNET_TieredPGO": "1"},
+        "kestrel": {"max_connections": 20000, "max_upgraded": 5000, "max_body": 30000000,
+                    "keep_alive": "00:02:00", "headers_timeout": "00:00:30",
+                    "max_streams": 250, "connection_window": 2 * 1024 * 1024, "stream_window": 1024 * 1024},
+    },
+    # GC de workstation (um heap), teto de heap em 70% do limite do container e GC mais agressivo
+    # em compactar (GCConserveMemory)
+    "low-memory": {
+        "msbuild": {"ServerGarbageCollection": "false", "ConcurrentGarbageCollection": "false",
+                    "TieredCompilation": "true", "TieredPGO": "false"},
+        "env": {"DOTNET_gcServer": "0", "DOTNET_gcConcurrent": "0", "DOTNET_GCHeapHardLimitPercent": "0x46",
+                "DOTNET_GCConserveMemory": "5"},
+        "kestrel": {"max_connections": 1000, "max_upgraded": 200, "max_body": 4 * 1024 * 1024,
+                    "keep_alive": "00:00:30", "headers_timeout": "00:00:10",
+                    "max_streams": 50, "connection_window": 128 * 1024, "stream_window": 96 * 1024},
+    },
+}
+
+def runtime_tuning(opts):
+    """
+    Variáveis de template do --runtime-profile: 'runtime_props' (Directory.Build.props dos
+    executáveis), 'runtime_env'/'compose_runtime_env' (.env e docker-compose) e os limites do
+    Kestrel. Sem perfil, tudo vazio: ficam os padrões do SDK e do runtime.
+    """
+    tuning = RUNTIME_TUNING.get(opts.runtime_profile)
+    if tuning is None:
+        return {"runtime_profile": "", "runtime_props": "", "runtime_env": "", "compose_runtime_env": "", "kestrel": False}
+    return {
+        "runtime_profile": opts.runtime_profile,
+        "runtime_props": "\n".join(f"    <{k}>{v}</{k}>" for k, v in tuning["msbuild"].items()),
+        "runtime_env": "\n".join(f"{k}={v}" for k, v in tuning["env"].items()),
+        "compose_runtime_env": "\n".join(f'      {k}: "{v}"' for k, v in tuning["env"].items()),
+        "kestrel": True,
+        **tuning["kestrel"],
+    }
+
+# -----------------------
+# Modos de publicação (--publish-mode)
+# -----------------------
+PUBLISH_RID = "linux-x64"
+# msbuild: propriedades dos executáveis (PublishAot/PublishTrimmed também ligam os analisadores
+# de AOT/trimming já no build); args: RID e self-contained do 'dotnet publish' no Dockerfile e na CI;
+# packs: pacotes que o SDK baixa sozinho no restore com RID (versão escolhida pelo SDK)
+PUBLISH_PROFILES = {
+    # IL + JIT com tiered compilation: imagem aspnet/runtime, o padrão do SDK
+    "jit": {"msbuild": {}, "args": "", "self_contained": False, "packs": []},
+    # IL com código nativo pré-compilado: startup mais rápido na mesma imagem, binários maiores
+    "r2r": {"msbuild": {"PublishReadyToRun": "true"},
+            "args": f"-r {PUBLISH_RID} --self-contained false", "self_contained": False,
+            "packs": [f"Microsoft.NETCore.App.Crossgen2.{PUBLISH_RID}"]},
+    # binário nativo sem JIT: imagem runtime-deps (chiseled no .NET 8: sem shell, sem root, sem ICU)
+    "aot": {"msbuild": {"PublishAot": "true", "InvariantGlobalization": "true", "StripSymbols": "true",
+                        "TrimmerSingleWarn": "false"},
+            "args": f"-r {PUBLISH_RID}", "self_contained": True,
+            "packs": [f"Microsoft.NETCore.App.Runtime.{PUBLISH_RID}", "Microsoft.DotNet.ILCompiler",
+                      f"runtime.{PUBLISH_RID}.Microsoft.DotNet.ILCompiler"]},
+    # self-contained só com o que é alcançável; TrimMode partial poupa assemblies que não se declaram trimmable
+    "trimmed": {"msbuild": {"PublishTrimmed": "true", "TrimMode": "partial", "TrimmerSingleWarn": "false"},
+                "args": f"-r {PUBLISH_RID} --self-contained true", "self_contained": True,
+                "packs": [f"Microsoft.NETCore.App.Runtime.{PUBLISH_RID}", "Microsoft.NET.ILLink.Tasks"]},
+}
+
+def missing_publish_packs(feed: Path, mode, tf):
+    """
+    Pacotes do --publish-mode ausentes do feed offline (qualquer versão serve: quem escolhe
+    é o SDK instalado). O ILLink só vem como pacote a partir do net8.0.
+    """
+    packs = [p for p in PUBLISH_PROFILES[mode]["packs"]
+             if p != "Microsoft.NET.ILLink.Tasks" or float(tf[len("net"):]) >= 8]
+    return [p for p in packs if not (feed / p.lower()).is_dir()]
+
+# Pacotes dos templates que dependem de reflexão em runtime: com aot/trimmed publicam com avisos
+# IL2026/IL3050 e podem quebrar só em produção
+REFLECTION_PACKAGES = {
+    "Serilog.AspNetCore": "Serilog (sinks e destructuring por reflexão)",
+    "Swashbuckle.AspNetCore": "Swagger (Swashbuckle gera o documento por reflexão)",
+    "MediatR.Extensions.Microsoft.DependencyInjection": "MediatR (varredura de assemblies)",
+    "Autofac.Extensions.DependencyInjection": "Autofac (reflexão e Reflection.Emit)",
+    "Microsoft.EntityFrameworkCore": "EF Core (modelo e materialização por reflexão)",
+    "MongoDB.Driver": "MongoDB.Driver (serialização por reflexão)",
+}
+
+def publish_settings(opts, tf, entry, dest_root):
+    """
+    Variáveis de template do --publish-mode: imagens do Dockerfile, restore/publish do
+    Dockerfile e publish da CI (só o executável de entrada; com RID quando o modo exige) e
+    'publish_props' para o Directory.Build.props dos executáveis. http_port: porta em que as
+    imagens escutam (a partir do .NET 8, ASPNETCORE_HTTP_PORTS=8080, usuário não-root).
+    entry: (nome, pasta, tipo) do executável de entrada, ou None.
+    """
+    mode = PUBLISH_PROFILES[opts.publish_mode]
+    version = tf[len("net"):]
+    if mode["self_contained"]:
+        image = "runtime-deps"
+        tag = f"{version}-jammy-chiseled" if opts.publish_mode == "aot" and float(version) >= 8 else version
+    else:
+        # aspnet também para workers: o pacote de health checks traz o framework ASP.NET Core
+        image, tag = "aspnet", version
+    target = ""
+    if entry is not None:
+        target = (entry[1] / f"{entry[0]}.csproj").relative_to(dest_root).as_posix() + " "
+    args = f" {mode['args']}" if mode["args"] else ""
+    # o restore do Dockerfile tem que casar com o publish --no-restore (RID e runtime packs)
+    restore_args = f"-r {PUBLISH_RID} -p:SelfContained={str(mode['self_contained']).lower()}" if mode["args"] else ""
+    return {
+        "publish_mode": opts.publish_mode,
+        "publish_props": "\n".join(f"    <{k}>{v}</{k}>" for k, v in mode["msbuild"].items()),
+        "runtime_image": image, "image_tag": tag, "sdk_tag": version,
+        "http_port": 8080 if float(version) >= 8 else 80,
+        "native_toolchain": opts.publish_mode == "aot",
+        "self_contained": mode["self_contained"],
+        "docker_restore": f"dotnet restore {target}{restore_args}".rstrip(),
+        "docker_publish": f"dotnet publish {target}-c Release -o /app/publish --no-restore{args}",
+        "ci_publish": f"dotnet publish {target}-c Release -o publish{args}",
+    }
+
+def publish_warnings(opts, tf, key, projects, db_choices):
+    """
+    {projeto executável: [o que nele não é compatível com aot/trimmed]}; vazio no jit/r2r.
+    Só avisa: a geração segue e o publish mostra os avisos IL2026/IL3050 de cada um.
+    """
+    if opts.publish_mode not in ("aot", "trimmed"):
+        return {}
+    found = {}
+    for role, (name, _, kind) in projects.items():
+        if kind not in ("webapi", "worker", "grpc"):
+            continue
+        reasons = [REFLECTION_PACKAGES[p] for p in packages_for_project(role, kind, key, db_choices)
+                   if p in REFLECTION_PACKAGES]
+        if kind == "webapi":
+            reasons.insert(0, "controllers MVC (AddControllers não suporta trimming/Native AOT; use minimal APIs)")
+        if kind in ("webapi", "grpc") and opts.publish_mode == "aot" and float(tf[len("net"):]) < 8:
+            reasons.insert(0, f"ASP.NET Core só publica com Native AOT a partir do net8.0 (alvo: {tf})")
+        if reasons:
+            found[name] = reasons
+    return found
+
+# -----------------------
+# Scaffold plan (tudo em memória antes de tocar no disco)
+# -----------------------
+class ScaffoldPlan:
+    """
+    Resultado de plan_scaffold(): comandos 'dotnet new', pastas, arquivos, remoções,
+    referências, membros do .sln e pacotes. Caminhos relativos à raiz da solução, para
+    que a execução possa acontecer numa pasta de staging.
+    """
+    def __init__(self, root: Path, sln_name, opts):
+        self.root = root
+        self.sln_name = sln_name
+        self.opts = opts
+        self.commands = {}      # csproj -> 'dotnet new ...' (cwd = raiz), independentes entre si
+        self.dirs = []          # pastas (relativas)
+        self.files = {}         # arquivo relativo -> conteúdo final
+        self.deletes = []       # arquivos de template a remover após o 'dotnet new'
+        self.refs = {}          # csproj -> [csproj referenciados]
+        self.build_order = []   # csprojs em ordem de dependência
+        self.sln_projects = []  # csprojs da solution
+        self.packages = []      # (csproj, [pacotes]) em ordem de dependência
+        self.versions = None    # catálogo de versões (None no modo --packages cli)
+        self.post_build = []    # (etapa, comando) depois do build, seguidos de um novo build
+        self.emitted = set()    # tudo o que a execução deixou no disco (índice do commit git)
+        self.removed = []       # arquivos gerados antes e removidos numa atualização
+
+    def rel(self, path):
+        path = Path(path)
+        return path.relative_to(self.root) if path.is_absolute() else path
+
+    def mkdir(self, path):
+        self.dirs.append(self.rel(path))
+
+    def write(self, path, content):
+        self.files[self.rel(path)] = content
+
+    def delete(self, path):
+        self.deletes.append(self.rel(path))
+
+    def has(self, path):
+        """Arquivo já planejado nesta geração."""
+        return self.rel(path) in self.files
+
+    def print(self):
+        """Saída do --dry-run."""
+        total = sum(len(c.encode("utf-8")) for c in self.files.values())
+        print(f"Plano para {self.root}:")
+        print(f"\nComandos (em paralelo, até {self.opts.jobs or default_jobs()} por vez):")
+        for cmd in self.commands.values():
+            print(f"  {cmd}")
+        dirs = sorted(set(self.dirs) | {f.parent for f in self.files} - {Path(".")})
+        print(f"\nPastas ({len(dirs)}):")
+        for d in dirs:
+            print(f"  {d.as_posix()}/")
+        print(f"\nArquivos ({len(self.files)}, {total} bytes):")
+        for f in sorted(self.files):
+            print(f"  {f.as_posix()} ({len(self.files[f].encode('utf-8'))} B)")
+        if self.deletes:
+            print("\nRemoções (arquivos padrão dos templates):")
+            for f in self.deletes:
+                print(f"  {f.as_posix()}")
+        mode = "dotnet CLI em lote" if self.opts.cli_wiring else "escrita direta"
+        print(f"\nReferências ({mode}):")
+        for target in self.build_order:
+            if target in self.refs:
+                print(f"  {target.as_posix()} -> {', '.join(d.name for d in self.refs[target])}")
+        print(f"\nSolution {self.sln_name}.sln: {len(self.sln_projects)} projeto(s)")
+        print(f"\nPacotes (--packages {self.opts.packages}):")
+        for csproj, pkgs in self.packages:
+            listed = ", ".join(f"{p} {self.versions[p]}" if self.versions else p for p in pkgs)
+            print(f"  {csproj.name}: {listed}")
+
+def execute_plan(plan: ScaffoldPlan, work_root: Path, opts):
+    """
+    Executa o plano em work_root na ordem mais barata: 'dotnet new' em paralelo,
+    remoções, cada pasta criada uma única vez, arquivos escritos em paralelo e, por fim,
+    csproj/sln e pacotes (escrita direta ou CLI em lote).
+    """
+    jobs = opts.jobs
+    work_root.mkdir(parents=True, exist_ok=True)
+
+    TRACER.phase("projetos (dotnet new)")
+    # --full sobre um destino existente: o staging é uma cópia, as pastas dos projetos já existem
+    run_parallel([(cmd + (" --force" if (work_root / c.parent).exists() else ""), str(work_root))
+                  for c, cmd in plan.commands.items()], jobs)
+
+    TRACER.phase("pastas + templates")
+    for rel in plan.deletes:
+        path = work_root / rel
+        if path.exists():
+            path.unlink()
+    for c in plan.commands:
+        plan.emitted.update(walk_files(work_root / c.parent, work_root))
+    stats = emit_files(work_root, plan.files, plan.dirs, jobs)
+    plan.emitted.update(stats["paths"])
+    print(f"> [emit] {describe_emit(stats)}")
+
+    TRACER.phase("referências + sln")
+    sln_csprojs = []
+    for rel in plan.sln_projects:
+        if (work_root / rel).exists():
+            sln_csprojs.append(work_root / rel)
+        else:
+            print(f"⚠️ csproj não encontrado em {work_root / rel.parent}")
+    refs = {work_root / t: [work_root / d for d in deps] for t, deps in plan.refs.items()}
+    order = [work_root / c for c in plan.build_order]
+    wire_solution(work_root, plan.sln_name, sln_csprojs, refs, order, use_cli=opts.cli_wiring, jobs=jobs)
+    plan.emitted.add(Path(f"{plan.sln_name}.sln"))
+
+    TRACER.phase("pacotes NuGet")
+    print("\nAdicionando pacotes NuGet conforme escolhas...")
+    if plan.versions is None:
+        # Cada 'dotnet add package' faz restore do grafo do projeto: serial, em ordem de dependência
+        for csproj, pkgs in plan.packages:
+            for pkg in pkgs:
+                run(f"dotnet add \"{work_root / csproj}\" package {pkg}", cwd=str(work_root))
+    else:
+        # Escrita direta com versões do catálogo; o único restore acontece no fim
+        central = opts.packages == "central"
+        total = 0
+        for csproj, pkgs in plan.packages:
+            total += add_package_references(work_root / csproj,
+                                            [(p, None if central else plan.versions[p]) for p in pkgs])
+        if central:
+            write_central_package_props(work_root, [c for c in order if c.exists()], plan.versions)
+            plan.emitted.add(Path("Directory.Packages.props"))
+        print(f"> [{opts.packages}] {total} PackageReference(s) escritos em {len(plan.packages)} projeto(s)")
+
+@contextmanager
+def staged_tree(dest_root: Path):
+    """
+    Pasta de trabalho ao lado do destino (mesmo filesystem). Se o bloco falhar, ela é
+    apagada e o destino fica intacto; se terminar, é publicada com rename. Quando o
+    destino já existe, o staging começa como cópia dele e os dois são trocados no fim.
+    """
+    import shutil
+    dest_root.parent.mkdir(parents=True, exist_ok=True)
+    work = dest_root.parent / f".{dest_root.name}.staging-{uuid.uuid4().hex[:8]}"
+    existed = dest_root.exists()
+    if existed:
+        shutil.copytree(dest_root, work, symlinks=True)
+    else:
+        work.mkdir()
+    try:
+        yield work
+    except BaseException:
+        shutil.rmtree(work, ignore_errors=True)
+        print(f"\n↩️ Geração interrompida; {dest_root} não foi alterado.")
+        raise
+    if existed:
+        backup = dest_root.parent / f".{dest_root.name}.old-{uuid.uuid4().hex[:8]}"
+        os.rename(dest_root, backup)
+        os.rename(work, dest_root)
+        shutil.rmtree(backup, ignore_errors=True)
+    else:
+        os.rename(work, dest_root)
+
+# -----------------------
+# Geração
+# -----------------------
+def preset_projects(key, project_root_name, dest_root: Path):
+    """Projetos do preset por papel: papel -> (proj_name, proj_folder, kind), na ordem declarada."""
+    projects = {}
+    for role, (suffix, kind) in PRESETS[key].projects.items():
+        proj_name = f"{project_root_name}.{suffix}"
+        # testes vão para 'tests', os demais para 'src'
+        base = dest_root / ("tests" if kind == "test" else "src")
+        projects[role] = (proj_name, base / proj_name, kind)
+    return projects
+
+def plan_projects(key, project_root_name, dest_root: Path):
+    """Projetos do preset como tuplas (proj_name, proj_folder, kind), sem tocar no disco."""
+    return list(preset_projects(key, project_root_name, dest_root).values())
+
+def generate(key, project_root_name, dest_root: Path, tf, db_choices, opts):
+    """
+    Gera a solução sem nenhuma pergunta (usado pelo fluxo interativo e pelo modo batch).
+    opts: namespace de parse_args()/default_options().
+    Se dest_root tem o manifesto de uma geração anterior, só o que mudou é refeito
+    (a menos que opts.full). Senão o scaffold é montado numa pasta de staging e só
+    aparece em dest_root se completar.
+    """
+    print(f"\nGerando preset '{key}' em {dest_root} com target {tf} e DBs {db_choices}\n")
+    plan = plan_scaffold(key, project_root_name, dest_root, tf, db_choices, opts)
+    if opts.dry_run:
+        plan.print()
+        print("\nDepois: git init + add (só os arquivos gerados) + commit, em paralelo com:")
+        if not opts.skip_build:
+            for _, cmd in build_commands(dest_root, plan_projects(key, project_root_name, dest_root), opts,
+                                         plan.post_build):
+                print(f"  {cmd}")
+        print("(--dry-run: nada foi executado)")
+        return
+    previous = None if opts.full else read_gen_manifest(dest_root)
+    with TRACER.span(project_root_name, "generate", preset=key, tf=tf, dbs=",".join(db_choices)):
+        try:
+            if previous is not None:
+                if not update_tree(plan, dest_root, previous, opts):
+                    print(f"\n✅ Nada mudou desde a última geração em {dest_root}.")
+                    return
+            else:
+                with staged_tree(dest_root) as work:
+                    if opts.no_cache:
+                        execute_plan(plan, work, opts)
+                    else:
+                        from .cache import scaffold_cached  # o cache importa este módulo
+                        plan.emitted.update(scaffold_cached(key, project_root_name, dest_root, tf, db_choices, opts, work))
+                    write_gen_manifest(work, plan, None)
+            finalize(project_root_name, dest_root, plan_projects(key, project_root_name, dest_root), opts, plan,
+                     updated=previous is not None)
+        finally:
+            TRACER.phase()
+
+def scaffold(key, project_root_name, dest_root: Path, tf, db_choices, opts, work_root: Path = None):
+    """Cria projetos, referências, arquivos e pacotes (tudo antes de git/restore/build)."""
+    plan = plan_scaffold(key, project_root_name, dest_root, tf, db_choices, opts)
+    execute_plan(plan, work_root or dest_root, opts)
+
+def plan_scaffold(key, project_root_name, dest_root: Path, tf, db_choices, opts):
+    """
+    Monta o ScaffoldPlan completo em memória, sem tocar no disco.
+    Os conteúdos usam dest_root (destino final) mesmo quando a execução acontece numa
+    pasta de staging.
+    """
+    preset = PRESETS[key]
+    plan = ScaffoldPlan(dest_root, project_root_name, opts)
+
+    # Offline: todo restore vem do feed local (nuget.config com <clear />)
+    if opts.offline:
+        feed = Path(opts.offline_feed) if opts.offline_feed else default_offline_feed()
+        required = nuget_catalog(tf, opts.nuget_catalog)
+        if opts.ef_compiled_model and db_flags(db_choices)["ef"]:
+            required["dotnet-ef"] = required["Microsoft.EntityFrameworkCore.Design"]
+        missing = missing_from_feed(feed, required) + missing_publish_packs(feed, opts.publish_mode, tf)
+        if missing:
+            print(f"Feed offline {feed} incompleto para {tf}; faltam: {', '.join(missing)}")
+            print("Rode uma vez com rede: python dotnet_easy_full_v2.py --seed-offline-feed")
+            sys.exit(1)
+        plan.write(dest_root / "nuget.config", render("nuget.config.tpl", feed=feed.resolve()))
+
+    # -----------------------------
+    # Criar pastas principais
+    # -----------------------------
+    plan.mkdir(dest_root / "src")
+    plan.mkdir(dest_root / "tests")
+
+    # -----------------------------
+    # Criar projetos (em paralelo: cada 'dotnet new' é independente)
+    # O restore implícito do 'dotnet new' fica desligado: rodaria na pasta de staging
+    # (caminhos errados em obj/) e o restore final cobre tudo.
+    # -----------------------------
+    projects = preset_projects(key, project_root_name, dest_root)  # papel -> (proj_name, proj_folder, kind)
+    created = list(projects.values())
+    for name, folder, kind in created:
+        rel = plan.rel(folder).as_posix()
+        plan.commands[plan.rel(folder / f"{name}.csproj")] = (
+            f"dotnet new {'xunit' if kind == 'test' else kind} -n {name} -f {tf} -o \"{rel}\" --no-restore")
+
+    # -----------------------------
+    # Referências entre projetos: o DAG do preset, já validado e ordenado no registro
+    # -----------------------------
+    def csproj(role):
+        name, folder, _ = projects[role]
+        return folder / f"{name}.csproj"
+
+    refs = {csproj(role): [csproj(dep) for dep in deps] for role, deps in preset.refs.items()}
+    all_csprojs = [folder / f"{name}.csproj" for name, folder, k in created]
+    build_order = [csproj(role) for role in preset.order]
+
+    # testes de exemplo só quando o projeto de testes referencia o projeto testado: presets
+    # de terceiros (DOTNET_EASY_PRESETS) podem ter 'tests' sem a aresta
+    def tested(role):
+        return "tests" in projects and preset.depends_on("tests", role)
+
+    # -----------------------------
+    # Referências e projetos da solution
+    # -----------------------------
+    plan.refs = {plan.rel(t): [plan.rel(d) for d in deps] for t, deps in refs.items()}
+    plan.build_order = [plan.rel(c) for c in build_order]
+    plan.sln_projects = [plan.rel(c) for c in all_csprojs]
+
+
+    # create common folders inside each project
+    for role, (name, folder, kind) in projects.items():
+        if kind == "webapi" or kind == "grpc":
+            plan.mkdir(folder / "Controllers")
+            plan.mkdir(folder / "DTOs")
+        if role == "application":
+            plan.mkdir(folder / "Commands")
+            plan.mkdir(folder / "Queries")
+            plan.mkdir(folder / "Services")
+            plan.mkdir(folder / "DTOs")
+        if role == "infra":
+            plan.mkdir(folder / "Services")
+            plan.mkdir(folder / "Migrations")
+        
+        plan.mkdir(folder / "Utils")
+
+
+    # produce connection strings etc
+    pool = connection_pool(key, opts)
+    conn_strings, env_vars, mongo_conn, mongo_db = build_conn_strings(db_choices, project_root_name, pool)
+    conn_strings_block = conn_strings if conn_strings else ""
+    env_conn_block = env_vars if env_vars else ""
+    dbs = db_flags(db_choices)
+    # Outbox/inbox de webhooks: Processor + Domain/Infra e um banco relacional (EF)
+    webhooks = dbs["ef"] and all(role in projects for role in ("processor", "domain", "infra"))
+    # Middlewares de --web-perf (só projetos webapi); os testes sobem a API do papel "api" em memória
+    has_webapi = any(kind == "webapi" for _, _, kind in created)
+    perf = {feature: on and has_webapi for feature, on in web_perf(opts).items()}
+    perf_tests = any(perf.values()) and tested("api") and projects["api"][2] == "webapi"
+    runtime = runtime_tuning(opts)
+    env_ctx = {"env_conn_vars": env_conn_block, "runtime_profile": runtime["runtime_profile"],
+               "runtime_env": runtime["runtime_env"]}
+    entry = entry_project(created)
+    publish = publish_settings(opts, tf, entry, dest_root)
+    aot_issues = publish_warnings(opts, tf, key, projects, db_choices)
+    for name, reasons in aot_issues.items():
+        print(f"⚠️ {name} não é compatível com --publish-mode {opts.publish_mode}: {'; '.join(reasons)}")
+    # Limites do Kestrel do perfil: no appsettings.json da API e como padrão do próprio Program.cs
+    kestrel = {k: v for k, v in runtime.items() if k not in ("runtime_env", "compose_runtime_env", "runtime_props")}
+    kestrel["kestrel"] = runtime["kestrel"] and has_webapi
+    appsettings_ctx = {"mongo": dbs["mongo"], "pool_min": pool["min"], "pool_max": pool["max"], "pool_timeout": pool["timeout"],
+                       "conn_strings": conn_strings_block or '"Default": ""', "mongo_conn": mongo_conn or "",
+                       "mongo_db": mongo_db or "", "worker": False, "webhooks": False,
+                       **{feature: False for feature in perf}, **kestrel, "kestrel": False}
+
+    # Write Program.cs replacement for webapi/worker projects
+    for role, (name, folder, kind) in projects.items():
+        ns = name  # use full project name as namespace
+        if kind == "webapi":
+            plan.write(folder / "Program.cs", render("Program.webapi.cs.tpl", root_ns=project_root_name,
+                                                     services="builder.Services", config="builder.Configuration",
+                                                     webhooks=webhooks, **kestrel,
+                                                     **perf, **dbs, **ef_registration(opts)))
+            plan.write(folder / "Controllers" / "HealthController.cs",
+                       render("HealthController.cs.tpl", ns=ns, output_cache=perf["output_cache"]))
+            # appsettings / .env in root
+            plan.write(dest_root / "appsettings.json", render("appsettings.json.tpl", **appsettings_ctx))
+            plan.write(dest_root / ".env", render("env.tpl", **env_ctx))
+            # seções de --web-perf e Kestrel:Limits: no appsettings.json da própria API (o que o host
+            # carrega). Sempre gerado: uma regeneração sem as flags não pode apagá-lo
+            write_host_settings(plan, folder, appsettings_ctx, **perf, kestrel=kestrel["kestrel"])
+        
+        if kind == "worker":
+            plan.write(folder / "Program.cs", render("Program.worker.cs.tpl", ns=ns, root_ns=project_root_name,
+                                                     services="services", config="hostContext.Configuration",
+                                                     webhooks=webhooks, **dbs, **ef_registration(opts)))
+            
+            # Sobrescreve Worker.cs com namespace: consumidores em paralelo sobre uma fila limitada
+            plan.write(folder / "Worker.cs", render("Worker.cs.tpl", ns=ns))
+            plan.write(folder / "WorkQueue.cs", render("WorkQueue.cs.tpl", ns=ns))
+            # seções "Worker" e "Webhooks" (só o Processor liga o dispatcher): no appsettings.json
+            # do próprio projeto, o que o host carrega e o publish leva
+            write_host_settings(plan, folder, appsettings_ctx, worker=True, webhooks=webhooks and role == "processor")
+            if tested(role):
+                plan.write(projects["tests"][1] / "WorkerPipelineTests.cs",
+                           render("WorkerPipelineTests.cs.tpl", ns=project_root_name, worker_ns=ns))
+            
+            plan.write(dest_root / ".env", render("env.tpl", **env_ctx))
+        
+        if kind == "grpc":
+            pass # Manter o padrão por enquanto
+
+        # --runtime-profile e --publish-mode: importado antes do csproj gerado pelo 'dotnet new'
+        if kind in ("webapi", "worker", "grpc") and (runtime["runtime_props"] or publish["publish_props"]):
+            notes = "\n".join(f"       - {r}" for r in aot_issues.get(name, []))
+            plan.write(folder / "Directory.Build.props", render("Runtime.Directory.Build.props.tpl",
+                                                               profile=runtime["runtime_profile"],
+                                                               runtime_props=runtime["runtime_props"],
+                                                               publish_mode=publish["publish_mode"],
+                                                               publish_props=publish["publish_props"],
+                                                               publish_notes=notes))
+        
+        if kind == "classlib":
+            # remove o 'Class1.cs' padrão
+            plan.delete(folder / "Class1.cs")
+        
+        if kind == "test":
+             # remove o 'UnitTest1.cs' padrão
+            plan.delete(folder / "UnitTest1.cs")
+            plan.write(folder / "SmokeTests.cs", render("SmokeTests.cs.tpl", ns=project_root_name))
+
+    # For infra project: add DbContext / Mongo context and sample entity & repository
+    if "infra" in projects:
+        folder = projects["infra"][1]
+        # add DbContext if EF chosen
+        if dbs["ef"]:
+            plan.write(folder / "AppDbContext.cs", render("AppDbContext.cs.tpl", ns=project_root_name, webhooks=webhooks))
+            # add sample repository (+ its tests, on SQLite in memory)
+            plan.write(folder / "TodoRepository.cs", render("TodoRepository.cs.tpl", ns=project_root_name))
+            if tested("infra"):
+                plan.write(projects["tests"][1] / "TodoRepositoryTests.cs",
+                           render("TodoRepositoryTests.cs.tpl", ns=project_root_name))
+        # add mongo context if selected
+        if dbs["mongo"]:
+            plan.write(folder / "MongoContext.cs", render("MongoContext.cs.tpl", ns=project_root_name))
+        
+    # Add sample entity under Domain (find Domain project)
+    if "domain" in projects:
+        plan.write(projects["domain"][1] / "TodoEntity.cs", render("TodoEntity.cs.tpl", ns=project_root_name))
+
+    if perf_tests:
+        plan.write(projects["tests"][1] / "WebPerfTests.cs",
+                   render("WebPerfTests.cs.tpl", ns=project_root_name, api_ns=projects["api"][0], **perf))
+
+    # Webhooks: entidades (Domain), outbox/inbox (Infra), dispatcher (Processor), endpoints (Api) e teste de integração
+    if webhooks:
+        processor_ns = projects["processor"][0]
+        plan.write(projects["domain"][1] / "WebhookDelivery.cs", render("WebhookDelivery.cs.tpl", ns=project_root_name))
+        plan.write(projects["infra"][1] / "WebhookOutbox.cs", render("WebhookOutbox.cs.tpl", ns=project_root_name))
+        for tpl in ("WebhookDispatcher.cs", "WebhookSender.cs"):
+            plan.write(projects["processor"][1] / tpl, render(tpl + ".tpl", ns=processor_ns, root_ns=project_root_name))
+        if "api" in projects:
+            plan.write(projects["api"][1] / "Controllers" / "WebhooksController.cs",
+                       render("WebhooksController.cs.tpl", ns=projects["api"][0], root_ns=project_root_name))
+        if tested("processor"):
+            plan.write(projects["tests"][1] / "WebhookDeliveryTests.cs",
+                       render("WebhookDeliveryTests.cs.tpl", ns=project_root_name, processor_ns=processor_ns))
+
+
+    # -----------------------------
+    # Adicionar pacotes NuGet
+    # -----------------------------
+    # Calcula todos os PackageReference de cada csproj de uma vez, em ordem de dependência
+    if opts.packages != "cli":
+        plan.versions = nuget_catalog(tf, opts.nuget_catalog)
+    for role in preset.order:
+        name, folder, kind = projects[role]
+        pkgs = packages_for_project(role, kind, key, db_choices, web_perf=perf_tests)
+        if not pkgs:
+            continue
+        if plan.versions is not None:
+            missing = [p for p in pkgs if p not in plan.versions]
+            if missing:
+                print(f"Pacote(s) sem versão no catálogo para {tf}: {', '.join(missing)}")
+                sys.exit(1)
+        plan.packages.append((plan.rel(folder / f"{name}.csproj"), pkgs))
+
+    # Modelo compilado do EF Core: 'dotnet ef dbcontext optimize' precisa do assembly, então
+    # roda depois do primeiro build; o build seguinte já liga o modelo via UseModel
+    startup = next((p for p in created if p[2] in ("webapi", "worker")), None)
+    if opts.ef_compiled_model and dbs["ef"] and "infra" in projects and startup:
+        infra_name, infra_folder, _ = projects["infra"]
+        ef_version = (plan.versions or nuget_catalog(tf, opts.nuget_catalog))["Microsoft.EntityFrameworkCore.Design"]
+        plan.write(infra_folder / "AppDbContextOptions.cs", render("AppDbContextOptions.cs.tpl", ns=project_root_name))
+        plan.write(infra_folder / "Directory.Build.props", render("Infra.Directory.Build.props.tpl"))
+        plan.write(dest_root / ".config" / "dotnet-tools.json", render("dotnet-tools.json.tpl", ef_version=ef_version))
+        infra_csproj = plan.rel(infra_folder / f"{infra_name}.csproj").as_posix()
+        startup_csproj = plan.rel(startup[1] / f"{startup[0]}.csproj").as_posix()
+        plan.post_build = [
+            ("tool-restore", "dotnet tool restore"),
+            ("ef-model", f'dotnet ef dbcontext optimize --no-build --configuration Release --context AppDbContext '
+                         f'--project "{infra_csproj}" --startup-project "{startup_csproj}" '
+                         f'--output-dir CompiledModels --namespace {project_root_name}.Infra.CompiledModels'),
+        ]
+
+    # Generate Dockerfile + docker-compose
+    if entry is not None and (db_choices or preset.is_web or "worker" in key):
+        plan.write(dest_root / "Dockerfile", render("Dockerfile.tpl", dll_name=entry[0],
+                                                    restore_copies=docker_restore_copies(plan, entry, refs, opts),
+                                                    **publish))
+        plan.write(dest_root / ".dockerignore", render("dockerignore.tpl"))
+        plan.write(dest_root / "docker-compose.yml", render("docker-compose.yml.tpl", compose_runtime_env=runtime["compose_runtime_env"],
+                                                            http_port=publish["http_port"], **dbs))
+
+    # Write README, .gitignore and CI
+    api_proj_name = entry_project_name(created, project_root_name)
+
+    plan.write(dest_root / ".gitignore", render("gitignore.tpl"))
+    plan.write(dest_root / "README.md", render("README.md.tpl", project=project_root_name, preset=key, tf=tf, dbs=",".join(db_choices) or "none", root=dest_root, project_api=(api_proj_name or "")))
+    
+    # appsettings.json
+    if not plan.has(dest_root / "appsettings.json"):
+        plan.write(dest_root / "appsettings.json", render("appsettings.json.tpl", **appsettings_ctx))
+    # .env
+    if not plan.has(dest_root / ".env"):
+        plan.write(dest_root / ".env", render("env.tpl", **env_ctx))
+    # CI
+    plan.write(dest_root / ".github/workflows/ci.yml", render("ci.yml.tpl", sdk_version=publish["sdk_tag"], ci_publish=publish["ci_publish"]))
+    return plan
+
+def write_host_settings(plan, folder, ctx, **sections):
+    """
+    appsettings.json de um projeto executável com as seções que o host dele lê: é esse
+    arquivo (não o da raiz da solução) que o host carrega e o 'dotnet publish' copia.
+    """
+    plan.write(folder / "appsettings.json", render("appsettings.json.tpl", **{**ctx, **sections}))
+
+def docker_restore_copies(plan, entry, refs, opts):
+    """
+    COPYs da camada de restore do Dockerfile: só o que decide o restore do executável de
+    entrada (o csproj dele e os que ele referencia, transitivamente, mais os .props e o
+    nuget.config). Editar código-fonte não invalida essa camada.
+    """
+    name, folder, _ = entry
+    pending, csprojs = [folder / f"{name}.csproj"], []
+    while pending:
+        c = pending.pop(0)
+        if c not in csprojs:
+            csprojs.append(c)
+            pending += refs.get(c, [])
+    files = []
+    for c in csprojs:
+        files.append(c)
+        if plan.has(c.parent / "Directory.Build.props"):
+            files.append(c.parent / "Directory.Build.props")
+    if opts.packages == "central":
+        files.append(plan.root / "Directory.Packages.props")
+    if plan.has(plan.root / "nuget.config"):
+        files.append(plan.root / "nuget.config")
+    lines = []
+    for f in files:
+        rel = plan.rel(f)
+        parent = rel.parent.as_posix()
+        lines.append(f'COPY ["{rel.as_posix()}", "{"./" if parent == "." else parent + "/"}"]')
+    return "\n".join(lines)
+
+def entry_project(created):
+    """(nome, pasta, tipo) do executável de entrada: a webapi, senão o primeiro worker/grpc; None se não houver."""
+    return (next((p for p in created if p[2] == "webapi"), None)
+            or next((p for p in created if p[2] in ("worker", "grpc")), None))
+
+def entry_project_name(created, project_root_name):
+    entry = entry_project(created)
+    return entry[0] if entry else project_root_name
+
+def build_commands(dest_root: Path, created, opts, post_build=()):
+    """
+    restore uma única vez, build paralelo (-m) sem restore e com os servidores de build
+    da sessão, test sem recompilar. Com --binlog, restore e build gravam restore.binlog
+    e build.binlog na raiz da solução (abrir no MSBuild Structured Log Viewer).
+    post_build (plan.post_build) roda depois do build e é seguido de um build incremental.
+    """
+    def binlog(stage):
+        return f' -bl:"{dest_root / f"{stage}.binlog"}"' if opts.binlog else ""
+    build = "dotnet build --no-restore --configuration Release -m -nodeReuse:true -p:UseSharedCompilation=true"
+    steps = [
+        ("restore", "dotnet restore" + binlog("restore")),
+        ("build", build + binlog("build")),
+    ]
+    if post_build:
+        steps += list(post_build)
+        steps.append(("rebuild", build))
+    if any(kind == "test" for (_, _, kind) in created):
+        steps.append(("test", "dotnet test --no-build --configuration Release"))
+    return steps
+
+def git_snapshot(dest_root: Path, paths, removed=(), message="chore: scaffold generated by dotnet_easy_full_v2"):
+    """
+    Commit só com os arquivos que o gerador emitiu, num único processo de shell:
+    git init + git add --pathspec-from-file + git commit. Nada de 'git add .': bin/obj de
+    execuções anteriores e os artefatos do restore nunca são varridos.
+    Não imprime nada (roda numa thread, em paralelo com restore/build): retorna (código, saída).
+    """
+    import fnmatch
+    import tempfile
+    # 'git add' de um caminho ignorado explicitamente é erro (.env, *.binlog): filtra
+    # pelos padrões simples do .gitignore da solução (pasta/, *.ext, nome)
+    try:
+        lines = (dest_root / ".gitignore").read_text(encoding="utf-8").splitlines()
+    except OSError:
+        lines = []
+    patterns = [l.strip() for l in lines if l.strip() and not l.startswith(("#", "!"))]
+    def ignored(rel):
+        for pat in patterns:
+            if pat.endswith("/"):
+                if pat.strip("/") in rel.parts[:-1]:
+                    return True
+            elif any(fnmatch.fnmatch(part, pat) for part in rel.parts):
+                return True
+        return False
+    paths = [p for p in paths if not ignored(p)]
+    with tempfile.TemporaryDirectory() as tmp:
+        def pathspec(name, items):
+            path = Path(tmp) / name
+            path.write_bytes(b"\0".join(p.as_posix().encode("utf-8") for p in sorted(items)))
+            return f'--pathspec-from-file="{path}" --pathspec-file-nul'
+        cmd = "git init -q"
+        if removed:
+            cmd += f" && git rm -q --cached --ignore-unmatch {pathspec('rm', removed)}"
+        cmd += f" && git add -A {pathspec('add', paths)} && git commit -q -m \"{message}\""
+        return run_captured(cmd, str(dest_root))
+
+def finalize(project_root_name, dest_root: Path, created, opts, plan, updated=False):
+    """
+    Commit git dos arquivos gerados, em paralelo com o pipeline restore/build/test.
+    """
+    api_proj_name = entry_project_name(created, project_root_name)
+
+    # Git numa thread: só lê os arquivos listados e .git/, o build só escreve em bin/obj
+    print(f"\nInicializando git (opcional) com {len(plan.emitted)} arquivo(s) gerado(s)...")
+    message = f"chore: scaffold {'updated' if updated else 'generated'} by dotnet_easy_full_v2"
+    job = getattr(_thread_log, "job", None)
+    def git_stage():
+        _thread_log.job = job
+        return git_snapshot(dest_root, plan.emitted | {Path(GEN_MANIFEST)}, plan.removed, message)
+    git_pool = ThreadPoolExecutor(max_workers=1)
+    git_future = git_pool.submit(git_stage)
+
+    # Restore / build / test
+    if opts.skip_build:
+        print("\n--skip-build: restore/build/test não executados.")
+    else:
+        print("\nExecutando dotnet restore / build / test (se dotnet estiverível)...")
+    try:
+        for stage, cmd in ([] if opts.skip_build else build_commands(dest_root, created, opts, plan.post_build)):
+            TRACER.phase(stage)
+            run(cmd, cwd=str(dest_root))
+        TRACER.phase()
+    except Exception as e:
+        print("dotnet comandos falharam (talvez SDK não instalado). Scaffold criado; rode manualmente 'dotnet restore' e 'dotnet build'.")
+        print("Erro:", e)
+        # Se o build falhou, saímos com o código de erro para o usuário ver
+        if isinstance(e, SystemExit):
+            sys.exit(e.code)
+        else:
+            sys.exit(1)
+    finally:
+        code, out = git_future.result()
+        git_pool.shutdown()
+        print(f"\n> git init/add/commit ({len(plan.emitted)} arquivo(s))")
+        if out.strip():
+            print(out.rstrip())
+        if code != 0:
+            print(f"git não está disponível ou commit falhou (código {code}).")
+
+
+    print("\n✅ Scaffold completo criado em:", dest_root)
+    print("Próximos passos recomendados:")
+    if opts.skip_build:
+        print(f" - cd \"{dest_root}\" && dotnet build")
+        for _, cmd in plan.post_build:
+            print(f" - {cmd}  (e depois 'dotnet build' de novo)" if cmd.startswith("dotnet ef") else f" - {cmd}")
+    if api_proj_name:
+        print(f" - cd \"{dest_root}\"")
+        print(f" - dotnet run --project src/{api_proj_name}")
+    else:
+        first = created[0][1] if created else dest_root
+        print(f" - cd \"{first}\" && dotnet run")
+    print(" - Ajuste appsettings.json e .env; preencha ServerVersion para MySQL se necessário; configure secrets no CI para deploy/push de imagem.")
+    print("\nBoa codificação! 🚀")
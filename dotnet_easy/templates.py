@@ -0,0 +1,106 @@
+"""Motor de templates: compila templates/*.tpl uma vez, no primeiro uso de cada um."""
+
+import re
+from functools import lru_cache
+from pathlib import Path
+
+# -----------------------
+# Templates (templates/*.tpl, carregados sob demanda e compilados uma única vez)
+# -----------------------
+# Sintaxe mínima:
+#   {{ nome }}                         valor de ctx["nome"]
+#   {% if a %} / {% elif not b %} / {% else %} / {% endif %}
+#                                      condição com nomes, and/or/not (linha inteira)
+#   {% include "_parcial.tpl" %}       renderiza outro template com o mesmo ctx, indentado
+#                                      pelo recuo da tag
+# Tags {% %} ocupam a linha toda e somem da saída (linha e quebra). Chaves simples de
+# C#/JSON não precisam de escape. Cada template vira uma função Python, gerada e
+# compilada na primeira vez que é usada; as seguintes só chamam a função.
+TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
+
+_TEMPLATE_TOKEN = re.compile(r"\{\{\s*(\w+)\s*\}\}|^([ \t]*)\{%\s*(.*?)\s*%\}[ \t]*(?:\n|\Z)", re.M)
+
+def compile_template(source, name="<template>"):
+    """Gera e compila a função render(ctx, include) -> str de um template."""
+    code = ["def render(ctx, include):", " out = []", " emit = out.append"]
+    depth = 1
+    blocks = []
+    pos = 0
+
+    def fail(msg, at):
+        raise ValueError(f"template {name}, linha {source.count(chr(10), 0, at) + 1}: {msg}")
+
+    def condition(expr, at):
+        words = expr.split()
+        if not words:
+            fail("condição vazia", at)
+        out = []
+        for w in words:
+            if w in ("and", "or", "not"):
+                out.append(w)
+            elif re.fullmatch(r"[A-Za-z_]\w*", w):
+                out.append(f"ctx[{w!r}]")
+            else:
+                fail(f"condição inválida: {expr!r}", at)
+        return " ".join(out)
+
+    def literal(text, at):
+        if "{%" in text:
+            fail("tags {% %} devem ocupar a linha inteira", at + text.index("{%"))
+        if text:
+            code.append(" " * depth + f"emit({text!r})")
+
+    for m in _TEMPLATE_TOKEN.finditer(source):
+        literal(source[pos:m.start()], pos)
+        pos = m.end()
+        if m.group(1):
+            code.append(" " * depth + f"emit(str(ctx[{m.group(1)!r}]))")
+            continue
+        word, _, arg = m.group(3).partition(" ")
+        if word == "if":
+            code.append(" " * depth + f"if {condition(arg, m.start())}:")
+            code.append(" " * (depth + 1) + "pass")
+            blocks.append("if")
+            depth += 1
+        elif word in ("elif", "else"):
+            if blocks[-1:] != ["if"]:
+                fail(f"{{% {word} %}} sem {{% if %}}", m.start())
+            head = f"elif {condition(arg, m.start())}:" if word == "elif" else "else:"
+            code.append(" " * (depth - 1) + head)
+            code.append(" " * depth + "pass")
+            if word == "else":
+                blocks[-1] = "else"
+        elif word == "endif":
+            if not blocks:
+                fail("{% endif %} sem {% if %}", m.start())
+            blocks.pop()
+            depth -= 1
+        elif word == "include":
+            code.append(" " * depth + f"emit(include({arg.strip().strip(chr(34))!r}, ctx, {m.group(2)!r}))")
+        else:
+            fail(f"tag desconhecida: {m.group(3)!r}", m.start())
+    literal(source[pos:], pos)
+    if blocks:
+        fail("{% if %} sem {% endif %}", len(source))
+    code.append(" return ''.join(out)")
+    namespace = {}
+    exec(compile("\n".join(code), f"<template {name}>", "exec"), namespace)
+    return namespace["render"]
+
+@lru_cache(maxsize=None)
+def load_template(name):
+    """Lê e compila templates/<name> no primeiro uso (nada é lido no import)."""
+    return compile_template((TEMPLATES_DIR / name).read_text(encoding="utf-8"), name)
+
+def _include(name, ctx, indent):
+    text = load_template(name)(ctx, _include)
+    if not indent:
+        return text
+    return "".join(indent + line if line.strip() else line for line in text.splitlines(True))
+
+def render(name, **ctx):
+    """Renderiza templates/<name> com as variáveis de ctx."""
+    try:
+        return load_template(name)(ctx, _include)
+    except KeyError as e:
+        raise ValueError(f"template {name}: variável {e} não informada") from None
@@ -0,0 +1,31 @@
+using Microsoft.EntityFrameworkCore;
+
+namespace {{ ns }}.Infra
+{
+    public class AppDbContext : DbContext
+    {
+        public AppDbContext(DbContextOptions<AppDbContext> options) : base(options) { }
+
+        public DbSet<{{ ns }}.Domain.TodoEntity> Todos { get; set; }
+{% if webhooks %}
+        public DbSet<{{ ns }}.Domain.WebhookDelivery> WebhookDeliveries { get; set; }
+        public DbSet<{{ ns }}.Domain.InboxMessage> InboxMessages { get; set; }
+
+        protected override void OnModelCreating(ModelBuilder modelBuilder)
+        {
+            var delivery = modelBuilder.Entity<{{ ns }}.Domain.WebhookDelivery>();
+            delivery.Property(d => d.EndpointUrl).HasMaxLength(2048);
+            delivery.Property(d => d.EventType).HasMaxLength(200);
+            delivery.Property(d => d.LeaseOwner).HasMaxLength(128);
+            delivery.Property(d => d.LastError).HasMaxLength(2000);
+            // Varredura do outbox: pendentes por vencimento
+            delivery.HasIndex(d => new { d.Status, d.NextAttemptAt });
+
+            var inbox = modelBuilder.Entity<{{ ns }}.Domain.InboxMessage>();
+            inbox.HasKey(m => new { m.Source, m.MessageId });
+            inbox.Property(m => m.Source).HasMaxLength(100);
+            inbox.Property(m => m.MessageId).HasMaxLength(200);
+        }
+{% endif %}
+    }
+}
@@ -0,0 +1,17 @@
+using Microsoft.EntityFrameworkCore;
+
+namespace {{ ns }}.Infra
+{
+    public static class AppDbContextOptions
+    {
+        // Modelo compilado (CompiledModels/, gerado por 'dotnet ef dbcontext optimize'): o EF
+        // não monta o modelo no primeiro uso. Até ele existir, o modelo é montado em runtime.
+        public static DbContextOptionsBuilder UseAppDbContextModel(this DbContextOptionsBuilder options)
+        {
+#if EF_COMPILED_MODEL
+            options.UseModel(CompiledModels.AppDbContextModel.Instance);
+#endif
+            return options;
+        }
+    }
+}
@@ -0,0 +1,28 @@
+# syntax=docker/dockerfile:1
+FROM mcr.microsoft.com/dotnet/{{ runtime_image }}:{{ image_tag }} AS base
+WORKDIR /app
+EXPOSE {{ http_port }}
+
+FROM mcr.microsoft.com/dotnet/sdk:{{ sdk_tag }} AS build
+{% if native_toolchain %}
+# Native AOT: o ILCompiler linka o binário com clang
+RUN apt-get update && apt-get install -y --no-install-recommends clang zlib1g-dev && rm -rf /var/lib/apt/lists/*
+{% endif %}
+WORKDIR /src
+# Restore só com os csproj/props: editar código não invalida esta camada, e os pacotes
+# ficam no cache do BuildKit entre builds (não entram na imagem)
+{{ restore_copies }}
+RUN --mount=type=cache,id=nuget,target=/root/.nuget/packages \
+    {{ docker_restore }}
+COPY . .
+RUN --mount=type=cache,id=nuget,target=/root/.nuget/packages \
+    {{ docker_publish }}
+
+FROM base AS final
+WORKDIR /app
+COPY --from=build /app/publish .
+{% if self_contained %}
+ENTRYPOINT ["./{{ dll_name }}"]
+{% else %}
+ENTRYPOINT ["dotnet", "{{ dll_name }}.dll"]
+{% endif %}
@@ -0,0 +1,20 @@
+using Microsoft.AspNetCore.Mvc;
+{% if output_cache %}
+using Microsoft.AspNetCore.OutputCaching;
+{% endif %}
+using System.Collections.Generic;
+using System.Threading.Tasks;
+
+namespace {{ ns }}.Controllers
+{
+    [ApiController]
+    [Route("api/[controller]")]
+    public class HealthController : ControllerBase
+    {
+        [HttpGet]
+{% if output_cache %}
+        [OutputCache(PolicyName = "Health")]
+{% endif %}
+        public IActionResult Get() => Ok(new { status = "ok" });
+    }
+}
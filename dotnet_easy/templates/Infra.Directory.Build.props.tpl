@@ -0,0 +1,9 @@
+<Project>
+  <Import Project="$([MSBuild]::GetPathOfFileAbove('Directory.Build.props', '$(MSBuildThisFileDirectory)../'))"
+          Condition="'$([MSBuild]::GetPathOfFileAbove('Directory.Build.props', '$(MSBuildThisFileDirectory)../'))' != ''" />
+
+  <!-- Liga o modelo compilado do EF Core assim que 'dotnet ef dbcontext optimize' o gerar -->
+  <PropertyGroup Condition="Exists('$(MSBuildThisFileDirectory)CompiledModels/AppDbContextModel.cs')">
+    <DefineConstants>$(DefineConstants);EF_COMPILED_MODEL</DefineConstants>
+  </PropertyGroup>
+</Project>
@@ -0,0 +1,28 @@
+using System;
+using MongoDB.Driver;
+namespace {{ ns }}.Infra
+{
+    public class MongoSettings
+    {
+        public string ConnectionString { get; set; } = string.Empty;
+        public string Database { get; set; } = string.Empty;
+        public int MinPoolSize { get; set; }
+        public int MaxPoolSize { get; set; } = 100;
+        public int WaitQueueTimeoutSeconds { get; set; } = 120;
+    }
+
+    public class MongoContext
+    {
+        public IMongoDatabase Database { get; }
+        public MongoContext(MongoSettings settings)
+        {
+            // Um único MongoClient (singleton) com o pool dimensionado para o serviço; quem espera
+            // por conexão além de WaitQueueTimeout recebe erro em vez de enfileirar sem limite
+            var clientSettings = MongoClientSettings.FromConnectionString(settings.ConnectionString);
+            clientSettings.MinConnectionPoolSize = settings.MinPoolSize;
+            clientSettings.MaxConnectionPoolSize = settings.MaxPoolSize;
+            clientSettings.WaitQueueTimeout = TimeSpan.FromSeconds(settings.WaitQueueTimeoutSeconds);
+            Database = new MongoClient(clientSettings).GetDatabase(settings.Database);
+        }
+    }
+}
@@ -0,0 +1,127 @@
+using Microsoft.AspNetCore.Builder;
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Hosting;
+using Microsoft.Extensions.Configuration;
+using Serilog;
+{% if output_cache or rate_limit %}
+using System;
+{% endif %}
+{% if compression %}
+using Microsoft.AspNetCore.ResponseCompression;
+{% endif %}
+{% if rate_limit %}
+using System.Threading.RateLimiting;
+using Microsoft.AspNetCore.Http;
+{% endif %}
+{% if ef %}
+using Microsoft.EntityFrameworkCore;
+{% endif %}
+{% if ef and compiled_model %}
+using {{ root_ns }}.Infra;
+{% endif %}
+{% if mongo %}
+using MongoDB.Driver;
+{% endif %}
+
+var builder = WebApplication.CreateBuilder(args);
+
+// Serilog
+builder.Host.UseSerilog((ctx, cfg) => cfg.WriteTo.Console());
+{% if kestrel %}
+
+// Limites do Kestrel do perfil de runtime '{{ runtime_profile }}' (conexões, corpo, HTTP/2); a seção
+// "Kestrel:Limits" da configuração (appsettings, variáveis Kestrel__Limits__*) sobrescreve
+builder.WebHost.ConfigureKestrel((ctx, kestrel) =>
+{
+    var limits = kestrel.Limits;
+    limits.MaxConcurrentConnections = {{ max_connections }};
+    limits.MaxConcurrentUpgradedConnections = {{ max_upgraded }};
+    limits.MaxRequestBodySize = {{ max_body }};
+    limits.KeepAliveTimeout = TimeSpan.Parse("{{ keep_alive }}");
+    limits.RequestHeadersTimeout = TimeSpan.Parse("{{ headers_timeout }}");
+    limits.Http2.MaxStreamsPerConnection = {{ max_streams }};
+    limits.Http2.InitialConnectionWindowSize = {{ connection_window }};
+    limits.Http2.InitialStreamWindowSize = {{ stream_window }};
+    ctx.Configuration.GetSection("Kestrel:Limits").Bind(limits);
+});
+{% endif %}
+
+builder.Services.AddControllers();
+builder.Services.AddEndpointsApiExplorer();
+builder.Services.AddSwaggerGen();
+
+{% if compression %}
+// Compressão de respostas (Brotli, depois Gzip), seção "ResponseCompression"
+builder.Services.AddResponseCompression(opt =>
+{
+    opt.EnableForHttps = builder.Configuration.GetValue("ResponseCompression:EnableForHttps", true);
+    opt.Providers.Add<BrotliCompressionProvider>();
+    opt.Providers.Add<GzipCompressionProvider>();
+});
+builder.Services.Configure<BrotliCompressionProviderOptions>(builder.Configuration.GetSection("ResponseCompression:Brotli"));
+builder.Services.Configure<GzipCompressionProviderOptions>(builder.Configuration.GetSection("ResponseCompression:Gzip"));
+
+{% endif %}
+{% if output_cache %}
+// Output cache em memória, seção "OutputCache"; a política "Health" vale para o HealthController
+builder.Services.AddOutputCache(opt =>
+{
+    var cache = builder.Configuration.GetSection("OutputCache");
+    opt.DefaultExpirationTimeSpan = TimeSpan.FromSeconds(cache.GetValue("DefaultExpirationSeconds", 60));
+    opt.SizeLimit = cache.GetValue("SizeLimitMb", 100L) * 1024 * 1024;
+    opt.AddPolicy("Health", policy => policy.Expire(TimeSpan.FromSeconds(cache.GetValue("HealthExpirationSeconds", 5))));
+});
+
+{% endif %}
+{% if rate_limit %}
+// Rate limiting global: janela fixa por IP de origem, seção "RateLimiting" (atrás de proxy,
+// configure UseForwardedHeaders para o IP ser o do cliente)
+builder.Services.AddRateLimiter(opt =>
+{
+    var limits = builder.Configuration.GetSection("RateLimiting");
+    var window = new FixedWindowRateLimiterOptions
+    {
+        PermitLimit = limits.GetValue("PermitLimit", 100),
+        Window = TimeSpan.FromSeconds(limits.GetValue("WindowSeconds", 1)),
+        QueueLimit = limits.GetValue("QueueLimit", 0),
+        QueueProcessingOrder = QueueProcessingOrder.OldestFirst,
+    };
+    opt.RejectionStatusCode = StatusCodes.Status429TooManyRequests;
+    opt.GlobalLimiter = PartitionedRateLimiter.Create<HttpContext, string>(ctx =>
+        RateLimitPartition.GetFixedWindowLimiter(ctx.Connection.RemoteIpAddress?.ToString() ?? "unknown", _ => window));
+});
+
+{% endif %}
+{% if ef or mongo %}
+{% include "_db_registrations.cs.tpl" %}
+
+{% endif %}
+{% if webhooks %}
+// Outbox/inbox de webhooks (entregues pelo Processor)
+builder.Services.AddScoped<{{ root_ns }}.Infra.WebhookOutbox>();
+builder.Services.AddScoped<{{ root_ns }}.Infra.WebhookInbox>();
+
+{% endif %}
+var app = builder.Build();
+
+{% if compression %}
+app.UseResponseCompression();
+
+{% endif %}
+if (app.Environment.IsDevelopment())
+{
+    app.UseSwagger();
+    app.UseSwaggerUI();
+}
+
+app.UseHttpsRedirection();
+{% if rate_limit %}
+app.UseRateLimiter();
+{% endif %}
+app.UseAuthorization();
+{% if output_cache %}
+app.UseOutputCache();
+{% endif %}
+app.MapControllers();
+
+app.Run();
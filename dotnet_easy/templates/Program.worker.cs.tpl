@@ -0,0 +1,37 @@
+using System;
+using Microsoft.Extensions.Configuration;
+using Microsoft.Extensions.Hosting;
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Options;
+using Serilog;
+using {{ ns }};
+{% if ef %}
+using Microsoft.EntityFrameworkCore;
+{% endif %}
+{% if ef and compiled_model %}
+using {{ root_ns }}.Infra;
+{% endif %}
+{% if mongo %}
+using MongoDB.Driver;
+{% endif %}
+
+Host.CreateDefaultBuilder(args)
+    .UseSerilog((ctx, cfg) => cfg.WriteTo.Console())
+    .ConfigureServices((hostContext, services) =>
+    {
+        // Pipeline: produtores -> WorkQueue (limitada) -> Worker (N consumidores em lote)
+        services.AddOptions<WorkerOptions>().Bind({{ config }}.GetSection("Worker"));
+        services.AddOptions<HostOptions>().Configure<IOptions<WorkerOptions>>((host, worker) =>
+            host.ShutdownTimeout = TimeSpan.FromSeconds(worker.Value.DrainTimeoutSeconds + 5));
+        services.AddSingleton<WorkQueue>();
+        services.AddSingleton<IWorkHandler, LoggingWorkHandler>();
+        services.AddHostedService<Worker>();
+        services.AddHostedService<SampleProducer>();
+{% if webhooks %}
+        // Outbox de webhooks: WebhookDispatcher + HttpClient pooled com Polly (seção "Webhooks")
+        services.AddWebhookDelivery({{ config }});
+{% endif %}
+        {% include "_db_registrations.cs.tpl" %}
+    })
+    .Build()
+    .Run();
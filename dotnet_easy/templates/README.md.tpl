@@ -0,0 +1,13 @@
+# {{ project }}
+Scaffold gerado pelo dotnet_easy_full_v2.py
+
+Preset: {{ preset }}
+Target Framework: {{ tf }}
+Databases: {{ dbs }}
+
+Como começar:
+1. Ajuste `.env` com suas credenciais
+2. `cd {{ root }}`
+3. `dotnet restore`
+4. `dotnet build`
+5. `dotnet run --project src/{{ project_api }}` (ou o projeto worker)
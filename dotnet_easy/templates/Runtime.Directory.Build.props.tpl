@@ -0,0 +1,24 @@
+<Project>
+  <Import Project="$([MSBuild]::GetPathOfFileAbove('Directory.Build.props', '$(MSBuildThisFileDirectory)../'))"
+          Condition="'$([MSBuild]::GetPathOfFileAbove('Directory.Build.props', '$(MSBuildThisFileDirectory)../'))' != ''" />
+{% if runtime_props %}
+
+  <!-- Perfil de runtime '{{ profile }}' (--runtime-profile): vai para o runtimeconfig.json;
+       as variáveis DOTNET_* do .env/docker-compose sobrescrevem estes valores no deploy -->
+  <PropertyGroup>
+{{ runtime_props }}
+  </PropertyGroup>
+{% endif %}
+{% if publish_props %}
+
+  <!-- Modo de publicação '{{ publish_mode }}' (--publish-mode), o mesmo do Dockerfile e da CI -->
+{% if publish_notes %}
+  <!-- Incompatível com este modo (avisos IL2026/IL3050 no publish):
+{{ publish_notes }}
+  -->
+{% endif %}
+  <PropertyGroup>
+{{ publish_props }}
+  </PropertyGroup>
+{% endif %}
+</Project>
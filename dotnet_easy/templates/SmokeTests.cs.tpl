@@ -0,0 +1,10 @@
+using Xunit;
+
+namespace {{ ns }}.Tests
+{
+    public class SmokeTests
+    {
+        [Fact]
+        public void TrueIsTrue() => Assert.True(true);
+    }
+}
@@ -0,0 +1,9 @@
+namespace {{ ns }}.Domain
+{
+    public class TodoEntity
+    {
+        public int Id { get; set; }
+        public string Title { get; set; } = string.Empty;
+        public bool Done { get; set; }
+    }
+}
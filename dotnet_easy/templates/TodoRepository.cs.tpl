@@ -0,0 +1,72 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Runtime.CompilerServices;
+using System.Threading;
+using System.Threading.Tasks;
+using Microsoft.EntityFrameworkCore;
+using {{ ns }}.Domain;
+
+namespace {{ ns }}.Infra
+{
+    public sealed record TodoPage(IReadOnlyList<TodoEntity> Items, int? NextAfterId);
+
+    public class TodoRepository
+    {
+        public const int MaxPageSize = 500;
+
+        // Consultas quentes compiladas uma vez por processo: o EF não retraduz o LINQ a cada chamada
+        private static readonly Func<AppDbContext, int, CancellationToken, Task<TodoEntity?>> ById =
+            EF.CompileAsyncQuery((AppDbContext ctx, int id, CancellationToken ct) =>
+                ctx.Todos.AsNoTracking().FirstOrDefault(t => t.Id == id));
+
+        private static readonly Func<AppDbContext, int, int, IAsyncEnumerable<TodoEntity>> PageAfter =
+            EF.CompileAsyncQuery((AppDbContext ctx, int afterId, int size) =>
+                ctx.Todos.AsNoTracking().Where(t => t.Id > afterId).OrderBy(t => t.Id).Take(size));
+
+        private readonly AppDbContext _ctx;
+        public TodoRepository(AppDbContext ctx) => _ctx = ctx;
+
+        public Task<TodoEntity?> GetByIdAsync(int id, CancellationToken ct = default) => ById(_ctx, id, ct);
+
+        // Paginação por chave (keyset): custo constante em qualquer página, ao contrário de Skip/Take
+        public async Task<TodoPage> GetPageAsync(int afterId = 0, int pageSize = 50, CancellationToken ct = default)
+        {
+            var size = Math.Clamp(pageSize, 1, MaxPageSize);
+            var items = new List<TodoEntity>(size);
+            await foreach (var todo in PageAfter(_ctx, afterId, size).WithCancellation(ct))
+                items.Add(todo);
+            return new TodoPage(items, items.Count == size ? items[^1].Id : null);
+        }
+
+        // Streaming: linhas lidas do cursor uma a uma, sem materializar a tabela em memória
+        public async IAsyncEnumerable<TodoEntity> StreamAllAsync([EnumeratorCancellation] CancellationToken ct = default)
+        {
+            await foreach (var todo in _ctx.Todos.AsNoTracking().OrderBy(t => t.Id).AsAsyncEnumerable().WithCancellation(ct))
+                yield return todo;
+        }
+
+        // Inserção em lote: um SaveChanges por lote (o provedor agrupa os INSERTs), sem DetectChanges
+        // a cada Add e com o ChangeTracker limpo entre lotes para a memória não crescer
+        public async Task<int> AddRangeAsync(IEnumerable<TodoEntity> todos, int batchSize = 1000, CancellationToken ct = default)
+        {
+            var inserted = 0;
+            var autoDetect = _ctx.ChangeTracker.AutoDetectChangesEnabled;
+            _ctx.ChangeTracker.AutoDetectChangesEnabled = false;
+            try
+            {
+                foreach (var batch in todos.Chunk(Math.Max(1, batchSize)))
+                {
+                    _ctx.Todos.AddRange(batch);
+                    inserted += await _ctx.SaveChangesAsync(ct);
+                    _ctx.ChangeTracker.Clear();
+                }
+            }
+            finally
+            {
+                _ctx.ChangeTracker.AutoDetectChangesEnabled = autoDetect;
+            }
+            return inserted;
+        }
+    }
+}
@@ -0,0 +1,85 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Threading.Tasks;
+using Microsoft.Data.Sqlite;
+using Microsoft.EntityFrameworkCore;
+using {{ ns }}.Domain;
+using {{ ns }}.Infra;
+using Xunit;
+
+namespace {{ ns }}.Tests
+{
+    public class TodoRepositoryTests : IDisposable
+    {
+        private readonly SqliteConnection _connection = new("DataSource=:memory:");
+        private readonly AppDbContext _ctx;
+        private readonly TodoRepository _repo;
+
+        public TodoRepositoryTests()
+        {
+            _connection.Open();
+            _ctx = new AppDbContext(new DbContextOptionsBuilder<AppDbContext>().UseSqlite(_connection).Options);
+            _ctx.Database.EnsureCreated();
+            _repo = new TodoRepository(_ctx);
+        }
+
+        public void Dispose()
+        {
+            _ctx.Dispose();
+            _connection.Dispose();
+        }
+
+        private static IEnumerable<TodoEntity> Todos(int count) =>
+            Enumerable.Range(1, count).Select(i => new TodoEntity { Title = $"todo {i}" });
+
+        [Fact]
+        public async Task AddRangeAsync_InsertsInBatchesWithoutTracking()
+        {
+            Assert.Equal(25, await _repo.AddRangeAsync(Todos(25), batchSize: 10));
+            Assert.Equal(25, await _ctx.Todos.CountAsync());
+            Assert.Empty(_ctx.ChangeTracker.Entries());
+        }
+
+        [Fact]
+        public async Task GetByIdAsync_ReturnsUntrackedEntity()
+        {
+            await _repo.AddRangeAsync(Todos(3));
+            var todo = await _repo.GetByIdAsync(2);
+            Assert.NotNull(todo);
+            Assert.Equal("todo 2", todo!.Title);
+            Assert.Empty(_ctx.ChangeTracker.Entries());
+            Assert.Null(await _repo.GetByIdAsync(42));
+        }
+
+        [Fact]
+        public async Task GetPageAsync_WalksEveryPageByKey()
+        {
+            await _repo.AddRangeAsync(Todos(25));
+            var sizes = new List<int>();
+            var ids = new List<int>();
+            int? after = 0;
+            while (after is int afterId)
+            {
+                var page = await _repo.GetPageAsync(afterId, pageSize: 10);
+                sizes.Add(page.Items.Count);
+                ids.AddRange(page.Items.Select(t => t.Id));
+                after = page.NextAfterId;
+            }
+            Assert.Equal(new[] { 10, 10, 5 }, sizes);
+            Assert.Equal(ids.OrderBy(id => id).Distinct(), ids);
+            Assert.Equal(25, ids.Count);
+        }
+
+        [Fact]
+        public async Task StreamAllAsync_YieldsEveryRowInKeyOrder()
+        {
+            await _repo.AddRangeAsync(Todos(12), batchSize: 5);
+            var ids = new List<int>();
+            await foreach (var todo in _repo.StreamAllAsync())
+                ids.Add(todo.Id);
+            Assert.Equal(12, ids.Count);
+            Assert.Equal(ids.OrderBy(id => id), ids);
+        }
+    }
+}
@@ -0,0 +1,72 @@
+using System.Collections.Generic;
+using System.Net;
+using System.Net.Http;
+using System.Threading.Tasks;
+using Microsoft.AspNetCore.Hosting;
+using Microsoft.AspNetCore.Mvc.Testing;
+using Microsoft.Extensions.Configuration;
+using Xunit;
+
+namespace {{ ns }}.Tests
+{
+    // Sobe a API em memória (TestServer) e confere que os middlewares de desempenho estão ativos.
+    // O HealthController marca o assembly da API (Program não serve: o dos outros executáveis colide).
+    public class WebPerfTests : IClassFixture<WebApplicationFactory<{{ api_ns }}.Controllers.HealthController>>
+    {
+        private readonly WebApplicationFactory<{{ api_ns }}.Controllers.HealthController> _factory;
+
+        public WebPerfTests(WebApplicationFactory<{{ api_ns }}.Controllers.HealthController> factory) => _factory = factory;
+
+        // Um servidor novo por teste (cache e contadores do rate limiter zerados), com overrides de configuração
+        private HttpClient Client(Dictionary<string, string?>? settings = null) =>
+            _factory.WithWebHostBuilder(host => host.ConfigureAppConfiguration((_, config) =>
+                config.AddInMemoryCollection(settings ?? new Dictionary<string, string?>()))).CreateClient();
+{% if compression %}
+
+        [Theory]
+        [InlineData("br")]
+        [InlineData("gzip")]
+        public async Task Responses_AreCompressed(string encoding)
+        {
+            using var request = new HttpRequestMessage(HttpMethod.Get, "/api/health");
+            request.Headers.AcceptEncoding.ParseAdd(encoding);
+            using var response = await Client().SendAsync(request);
+
+            response.EnsureSuccessStatusCode();
+            Assert.Contains(encoding, response.Content.Headers.ContentEncoding);
+        }
+{% endif %}
+{% if output_cache %}
+
+        [Fact]
+        public async Task HealthEndpoint_IsServedFromOutputCache()
+        {
+            var client = Client();
+            using var first = await client.GetAsync("/api/health");
+            using var second = await client.GetAsync("/api/health");
+
+            first.EnsureSuccessStatusCode();
+            second.EnsureSuccessStatusCode();
+            // Age só aparece em respostas servidas pelo output cache
+            Assert.False(first.Headers.Contains("Age"));
+            Assert.True(second.Headers.Contains("Age"));
+        }
+{% endif %}
+{% if rate_limit %}
+
+        [Fact]
+        public async Task RequestsOverTheLimit_AreRejected()
+        {
+            var client = Client(new Dictionary<string, string?>
+            {
+                ["RateLimiting:PermitLimit"] = "2",
+                ["RateLimiting:WindowSeconds"] = "60",
+            });
+
+            Assert.Equal(HttpStatusCode.OK, (await client.GetAsync("/api/health")).StatusCode);
+            Assert.Equal(HttpStatusCode.OK, (await client.GetAsync("/api/health")).StatusCode);
+            Assert.Equal(HttpStatusCode.TooManyRequests, (await client.GetAsync("/api/health")).StatusCode);
+        }
+{% endif %}
+    }
+}
@@ -0,0 +1,36 @@
+using System;
+
+namespace {{ ns }}.Domain
+{
+    public enum WebhookStatus
+    {
+        Pending = 0,
+        Delivered = 1,
+        Dead = 2,
+    }
+
+    // Linha do outbox: uma entrega de webhook e o estado das tentativas
+    public class WebhookDelivery
+    {
+        public long Id { get; set; }
+        public string EndpointUrl { get; set; } = string.Empty;
+        public string EventType { get; set; } = string.Empty;
+        public string Payload { get; set; } = string.Empty;
+        public WebhookStatus Status { get; set; }
+        public int Attempts { get; set; }
+        public DateTime NextAttemptAt { get; set; }     // vencimento da tentativa (ou do lease, enquanto reivindicada)
+        public string? LeaseOwner { get; set; }
+        public string? LastError { get; set; }
+        public DateTime CreatedAt { get; set; }
+        public DateTime? DeliveredAt { get; set; }
+    }
+
+    // Linha do inbox: webhook recebido, único por (Source, MessageId)
+    public class InboxMessage
+    {
+        public string Source { get; set; } = string.Empty;
+        public string MessageId { get; set; } = string.Empty;
+        public string Payload { get; set; } = string.Empty;
+        public DateTime ReceivedAt { get; set; }
+    }
+}
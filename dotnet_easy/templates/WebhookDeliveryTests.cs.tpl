@@ -0,0 +1,188 @@
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Linq;
+using System.Net;
+using System.Net.Sockets;
+using System.Threading.Tasks;
+using Microsoft.Data.Sqlite;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.Extensions.Configuration;
+using Microsoft.Extensions.DependencyInjection;
+using {{ ns }}.Domain;
+using {{ ns }}.Infra;
+using {{ processor_ns }};
+using Xunit;
+using Xunit.Abstractions;
+
+namespace {{ ns }}.Tests
+{
+    // Integração: outbox em SQLite em memória + WebhookDispatcher real (HttpClientFactory + Polly)
+    // entregando para um servidor HTTP local de mentira (HttpListener).
+    public class WebhookDeliveryTests : IAsyncLifetime
+    {
+        private readonly ITestOutputHelper _output;
+        private readonly SqliteConnection _connection = new("DataSource=:memory:");
+        private readonly HttpListener _listener = new();
+        private readonly ConcurrentDictionary<string, int> _received = new();
+        private ServiceProvider _services = null!;
+        private Task _serving = Task.CompletedTask;
+        private string _baseUrl = string.Empty;
+
+        public WebhookDeliveryTests(ITestOutputHelper output) => _output = output;
+
+        public async Task InitializeAsync()
+        {
+            _baseUrl = $"http://127.0.0.1:{FreePort()}/";
+            _listener.Prefixes.Add(_baseUrl);
+            _listener.Start();
+            _serving = ServeAsync();
+
+            await _connection.OpenAsync();
+            var config = new ConfigurationBuilder().AddInMemoryCollection(new Dictionary<string, string?>
+            {
+                ["Webhooks:BatchSize"] = "200",
+                ["Webhooks:MaxConcurrencyPerEndpoint"] = "32",
+                ["Webhooks:MaxAttempts"] = "2",
+                ["Webhooks:InlineRetries"] = "0",
+            }).Build();
+            var services = new ServiceCollection();
+            services.AddLogging();
+            services.AddDbContext<AppDbContext>(opt => opt.UseSqlite(_connection));
+            services.AddWebhookDelivery(config);
+            _services = services.BuildServiceProvider();
+            using var scope = _services.CreateScope();
+            await scope.ServiceProvider.GetRequiredService<AppDbContext>().Database.EnsureCreatedAsync();
+        }
+
+        public async Task DisposeAsync()
+        {
+            _listener.Stop();
+            await _serving;
+            await _services.DisposeAsync();
+            await _connection.DisposeAsync();
+        }
+
+        private static int FreePort()
+        {
+            var probe = new TcpListener(IPAddress.Loopback, 0);
+            probe.Start();
+            var port = ((IPEndPoint)probe.LocalEndpoint).Port;
+            probe.Stop();
+            return port;
+        }
+
+        // /ok/* responde 200 e conta o Webhook-Id; /down/* responde 500
+        private async Task ServeAsync()
+        {
+            while (_listener.IsListening)
+            {
+                HttpListenerContext ctx;
+                try
+                {
+                    ctx = await _listener.GetContextAsync();
+                }
+                catch (Exception) when (!_listener.IsListening)
+                {
+                    return;
+                }
+                var ok = ctx.Request.Url!.AbsolutePath.StartsWith("/ok/", StringComparison.Ordinal);
+                if (ok)
+                    _received.AddOrUpdate(ctx.Request.Headers["Webhook-Id"]!, 1, (_, n) => n + 1);
+                ctx.Response.StatusCode = ok ? 200 : 500;
+                ctx.Response.Close();
+            }
+        }
+
+        private async Task EnqueueAsync(int count, string path)
+        {
+            using var scope = _services.CreateScope();
+            var outbox = scope.ServiceProvider.GetRequiredService<WebhookOutbox>();
+            for (var i = 0; i < count; i++)
+                await outbox.EnqueueAsync($"{_baseUrl}{path}/{i % 4}", "todo.created", $"{{\"n\":{i}}}");
+        }
+
+        private async Task<List<WebhookDelivery>> DeliveriesAsync()
+        {
+            using var scope = _services.CreateScope();
+            return await scope.ServiceProvider.GetRequiredService<AppDbContext>().WebhookDeliveries.AsNoTracking().ToListAsync();
+        }
+
+        private async Task<int> DrainAsync()
+        {
+            var dispatcher = _services.GetRequiredService<WebhookDispatcher>();
+            var claimed = 0;
+            int n;
+            while ((n = await dispatcher.DispatchOnceAsync(default)) > 0)
+                claimed += n;
+            return claimed;
+        }
+
+        [Fact]
+        public async Task Dispatcher_DeliversEveryWebhookOnce()
+        {
+            const int total = 2000;
+            await EnqueueAsync(total, "ok");
+
+            var watch = Stopwatch.StartNew();
+            Assert.Equal(total, await DrainAsync());
+            watch.Stop();
+
+            _output.WriteLine($"{total / watch.Elapsed.TotalSeconds:N0} deliveries/s ({total} in {watch.ElapsedMilliseconds} ms)");
+            Assert.Equal(total, _received.Count);
+            Assert.All(_received.Values, n => Assert.Equal(1, n));
+            Assert.All(await DeliveriesAsync(), d =>
+            {
+                Assert.Equal(WebhookStatus.Delivered, d.Status);
+                Assert.NotNull(d.DeliveredAt);
+                Assert.Null(d.LeaseOwner);
+            });
+            Assert.True(watch.Elapsed < TimeSpan.FromSeconds(60), $"took {watch.Elapsed}");
+        }
+
+        [Fact]
+        public async Task FailedDeliveries_AreRescheduledThenDead()
+        {
+            await EnqueueAsync(3, "down");
+
+            Assert.Equal(3, await DrainAsync());
+            var rescheduled = await DeliveriesAsync();
+            Assert.All(rescheduled, d =>
+            {
+                Assert.Equal(WebhookStatus.Pending, d.Status);
+                Assert.Equal(1, d.Attempts);
+                Assert.True(d.NextAttemptAt > DateTime.UtcNow);
+                Assert.False(string.IsNullOrEmpty(d.LastError));
+            });
+
+            // não vencidas: o próximo ciclo não pega nada
+            Assert.Equal(0, await DrainAsync());
+
+            using (var scope = _services.CreateScope())
+                await scope.ServiceProvider.GetRequiredService<AppDbContext>().WebhookDeliveries
+                    .ExecuteUpdateAsync(s => s.SetProperty(d => d.NextAttemptAt, DateTime.UtcNow.AddSeconds(-1)));
+            Assert.Equal(3, await DrainAsync());
+            Assert.All(await DeliveriesAsync(), d => Assert.Equal(WebhookStatus.Dead, d.Status));
+        }
+
+        [Fact]
+        public async Task ClaimBatch_LeasesRowsAwayFromOtherProcessors()
+        {
+            await EnqueueAsync(10, "ok");
+            using var scope = _services.CreateScope();
+            var outbox = scope.ServiceProvider.GetRequiredService<WebhookOutbox>();
+
+            var first = await outbox.ClaimBatchAsync("processor-a", 6, TimeSpan.FromMinutes(1));
+            var second = await outbox.ClaimBatchAsync("processor-b", 6, TimeSpan.FromMinutes(1));
+
+            Assert.Equal(6, first.Count);
+            Assert.Equal(4, second.Count);
+            Assert.Empty(first.Select(d => d.Id).Intersect(second.Select(d => d.Id)));
+            Assert.Empty(await outbox.ClaimBatchAsync("processor-c", 6, TimeSpan.FromMinutes(1)));
+            // só o dono do lease fecha a entrega
+            Assert.Equal(0, await outbox.MarkDeliveredAsync(first.Select(d => d.Id).ToList(), "processor-b"));
+            Assert.Equal(6, await outbox.MarkDeliveredAsync(first.Select(d => d.Id).ToList(), "processor-a"));
+        }
+    }
+}
@@ -0,0 +1,137 @@
+using System;
+using System.Linq;
+using System.Net.Http;
+using System.Threading;
+using System.Threading.Tasks;
+using Microsoft.Extensions.Configuration;
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Hosting;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+using {{ root_ns }}.Domain;
+using {{ root_ns }}.Infra;
+
+namespace {{ ns }}
+{
+    public class WebhookOptions
+    {
+        public int BatchSize { get; set; } = 100;                 // entregas reivindicadas por ciclo
+        public int PollIntervalMs { get; set; } = 500;            // espera quando o outbox está vazio
+        public int LeaseSeconds { get; set; } = 60;               // depois disso a entrega volta a vencer
+        public int MaxAttempts { get; set; } = 8;                 // tentativas agendadas antes de Dead
+        public int MaxConcurrencyPerEndpoint { get; set; } = 8;
+        public int TimeoutSeconds { get; set; } = 10;             // por requisição
+        public int InlineRetries { get; set; } = 2;               // tentativas rápidas antes de reagendar
+        public int BreakerFailures { get; set; } = 5;
+        public int BreakerSeconds { get; set; } = 30;
+    }
+
+    // Lê o outbox em lotes e entrega os webhooks. Vários Processors podem rodar ao mesmo tempo:
+    // cada lote é reivindicado com lease (ver WebhookOutbox.ClaimBatchAsync).
+    public class WebhookDispatcher : BackgroundService
+    {
+        private sealed record Outcome(WebhookDelivery Delivery, string? Error);
+
+        private readonly IServiceScopeFactory _scopes;
+        private readonly WebhookOptions _options;
+        private readonly ILogger<WebhookDispatcher> _logger;
+        private readonly string _owner = $"{Environment.MachineName}/{Guid.NewGuid():N}";
+
+        public WebhookDispatcher(IServiceScopeFactory scopes, IOptions<WebhookOptions> options, ILogger<WebhookDispatcher> logger)
+        {
+            _scopes = scopes;
+            _options = options.Value;
+            _logger = logger;
+        }
+
+        protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+        {
+            var idle = TimeSpan.FromMilliseconds(Math.Max(10, _options.PollIntervalMs));
+            while (!stoppingToken.IsCancellationRequested)
+            {
+                int claimed;
+                try
+                {
+                    claimed = await DispatchOnceAsync(stoppingToken);
+                }
+                catch (OperationCanceledException) when (stoppingToken.IsCancellationRequested)
+                {
+                    break;
+                }
+                catch (Exception ex)
+                {
+                    _logger.LogError(ex, "Webhook dispatch cycle failed.");
+                    claimed = 0;
+                }
+                // Lote cheio: deve haver mais entregas vencidas, segue sem esperar
+                if (claimed >= _options.BatchSize)
+                    continue;
+                try
+                {
+                    await Task.Delay(idle, stoppingToken);
+                }
+                catch (OperationCanceledException)
+                {
+                    break;
+                }
+            }
+        }
+
+        // Um ciclo: reivindica um lote, entrega tudo em paralelo (limitado por endpoint nas políticas) e
+        // grava os resultados: sucessos num único UPDATE, falhas reagendadas. Retorna quantas reivindicou.
+        public async Task<int> DispatchOnceAsync(CancellationToken ct)
+        {
+            using var scope = _scopes.CreateScope();
+            var outbox = scope.ServiceProvider.GetRequiredService<WebhookOutbox>();
+            var sender = scope.ServiceProvider.GetRequiredService<WebhookSender>();
+            var batch = await outbox.ClaimBatchAsync(_owner, _options.BatchSize, TimeSpan.FromSeconds(_options.LeaseSeconds), ct);
+            if (batch.Count == 0)
+                return 0;
+
+            var outcomes = await Task.WhenAll(batch.Select(async delivery =>
+            {
+                try
+                {
+                    await sender.SendAsync(delivery, ct);
+                    return new Outcome(delivery, null);
+                }
+                catch (Exception ex) when (!ct.IsCancellationRequested)
+                {
+                    return new Outcome(delivery, ex.Message);
+                }
+            }));
+
+            // Sem o token do host: o lote já foi entregue, o resultado precisa ser gravado
+            var delivered = outcomes.Where(o => o.Error is null).Select(o => o.Delivery.Id).ToList();
+            if (delivered.Count > 0)
+                await outbox.MarkDeliveredAsync(delivered, _owner, CancellationToken.None);
+            foreach (var failed in outcomes.Where(o => o.Error is not null))
+                await outbox.MarkFailedAsync(failed.Delivery, _owner, failed.Error!, _options.MaxAttempts, CancellationToken.None);
+            _logger.LogDebug("Webhook batch: {Delivered} delivered, {Failed} rescheduled.", delivered.Count, batch.Count - delivered.Count);
+            return batch.Count;
+        }
+    }
+
+    public static class WebhookServiceCollectionExtensions
+    {
+        // Outbox, políticas, HttpClient pooled e o WebhookDispatcher (hosted service)
+        public static IServiceCollection AddWebhookDelivery(this IServiceCollection services, IConfiguration configuration)
+        {
+            services.AddOptions<WebhookOptions>().Bind(configuration.GetSection("Webhooks"));
+            services.AddSingleton<WebhookPolicies>();
+            services.AddScoped<WebhookOutbox>();
+            services.AddSingleton<WebhookDispatcher>();
+            services.AddHostedService(sp => sp.GetRequiredService<WebhookDispatcher>());
+            services.AddHttpClient<WebhookSender>()
+                .ConfigurePrimaryHttpMessageHandler(sp => new SocketsHttpHandler
+                {
+                    // o pool renova as conexões (e o DNS) sozinho; o handler pode viver o processo todo
+                    PooledConnectionLifetime = TimeSpan.FromMinutes(2),
+                    MaxConnectionsPerServer = Math.Max(1, sp.GetRequiredService<IOptions<WebhookOptions>>().Value.MaxConcurrencyPerEndpoint),
+                })
+                .SetHandlerLifetime(Timeout.InfiniteTimeSpan)
+                .AddPolicyHandler((sp, request) => sp.GetRequiredService<WebhookPolicies>().For(request));
+            return services;
+        }
+    }
+}
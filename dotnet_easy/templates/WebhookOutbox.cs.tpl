@@ -0,0 +1,137 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Threading;
+using System.Threading.Tasks;
+using Microsoft.EntityFrameworkCore;
+using {{ ns }}.Domain;
+
+namespace {{ ns }}.Infra
+{
+    // Outbox de webhooks na base da aplicação: enfileirar é gravar uma linha (na transação de quem
+    // chama); o Processor reivindica lotes com lease, entrega e agenda as novas tentativas.
+    public class WebhookOutbox
+    {
+        public const int MaxErrorLength = 2000;
+
+        private readonly AppDbContext _ctx;
+        public WebhookOutbox(AppDbContext ctx) => _ctx = ctx;
+
+        public async Task<long> EnqueueAsync(string endpointUrl, string eventType, string payload, CancellationToken ct = default)
+        {
+            var now = DateTime.UtcNow;
+            var delivery = new WebhookDelivery
+            {
+                EndpointUrl = endpointUrl,
+                EventType = eventType,
+                Payload = payload,
+                Status = WebhookStatus.Pending,
+                CreatedAt = now,
+                NextAttemptAt = now,
+            };
+            _ctx.WebhookDeliveries.Add(delivery);
+            await _ctx.SaveChangesAsync(ct);
+            return delivery.Id;
+        }
+
+        // Reivindica até batchSize entregas vencidas. Numa transação, as linhas são lidas com SKIP LOCKED
+        // (outros Processors pulam as travadas em vez de esperar) e recebem o lease: NextAttemptAt passa
+        // para agora + lease. Se o Processor cair no meio do lote, as entregas voltam a vencer sozinhas.
+        public async Task<IReadOnlyList<WebhookDelivery>> ClaimBatchAsync(string owner, int batchSize, TimeSpan lease, CancellationToken ct = default)
+        {
+            var now = DateTime.UtcNow;
+            await using var tx = await _ctx.Database.BeginTransactionAsync(ct);
+            var batch = await Due(now, Math.Max(1, batchSize)).AsNoTracking().ToListAsync(ct);
+            if (batch.Count == 0)
+                return batch;
+            var ids = batch.Select(d => d.Id).ToList();
+            var until = now + lease;
+            await _ctx.WebhookDeliveries.Where(d => ids.Contains(d.Id))
+                .ExecuteUpdateAsync(s => s.SetProperty(d => d.NextAttemptAt, until).SetProperty(d => d.LeaseOwner, owner), ct);
+            await tx.CommitAsync(ct);
+            return batch;
+        }
+
+        // Sucessos do lote num único UPDATE (só os que ainda são deste dono do lease)
+        public Task<int> MarkDeliveredAsync(IReadOnlyCollection<long> ids, string owner, CancellationToken ct = default) =>
+            _ctx.WebhookDeliveries.Where(d => ids.Contains(d.Id) && d.LeaseOwner == owner)
+                .ExecuteUpdateAsync(s => s
+                    .SetProperty(d => d.Status, WebhookStatus.Delivered)
+                    .SetProperty(d => d.DeliveredAt, DateTime.UtcNow)
+                    .SetProperty(d => d.LeaseOwner, (string?)null), ct);
+
+        // Falha: reagenda com backoff exponencial ou desiste (Dead) ao chegar em maxAttempts
+        public Task<int> MarkFailedAsync(WebhookDelivery delivery, string owner, string error, int maxAttempts, CancellationToken ct = default)
+        {
+            var id = delivery.Id;
+            var attempts = delivery.Attempts + 1;
+            var status = attempts >= maxAttempts ? WebhookStatus.Dead : WebhookStatus.Pending;
+            var next = DateTime.UtcNow + RetryDelay(attempts);
+            var lastError = error.Length > MaxErrorLength ? error[..MaxErrorLength] : error;
+            return _ctx.WebhookDeliveries.Where(d => d.Id == id && d.LeaseOwner == owner)
+                .ExecuteUpdateAsync(s => s
+                    .SetProperty(d => d.Attempts, attempts)
+                    .SetProperty(d => d.Status, status)
+                    .SetProperty(d => d.NextAttemptAt, next)
+                    .SetProperty(d => d.LastError, lastError)
+                    .SetProperty(d => d.LeaseOwner, (string?)null), ct);
+        }
+
+        // 2, 4, 8... segundos até 1 hora, com ±20% de jitter para as tentativas não saírem sincronizadas
+        public static TimeSpan RetryDelay(int attempt)
+        {
+            var seconds = Math.Min(3600, Math.Pow(2, Math.Max(1, attempt)));
+            return TimeSpan.FromSeconds(seconds * (0.8 + Random.Shared.NextDouble() * 0.4));
+        }
+
+        private IQueryable<WebhookDelivery> Due(DateTime now, int batchSize)
+        {
+            var pending = (int)WebhookStatus.Pending;
+            return _ctx.Database.ProviderName switch
+            {
+                "Npgsql.EntityFrameworkCore.PostgreSQL" => _ctx.WebhookDeliveries.FromSql(
+                    $"SELECT * FROM \"WebhookDeliveries\" WHERE \"Status\" = {pending} AND \"NextAttemptAt\" <= {now} ORDER BY \"NextAttemptAt\" LIMIT {batchSize} FOR UPDATE SKIP LOCKED"),
+                "Pomelo.EntityFrameworkCore.MySql" => _ctx.WebhookDeliveries.FromSql(
+                    $"SELECT * FROM `WebhookDeliveries` WHERE `Status` = {pending} AND `NextAttemptAt` <= {now} ORDER BY `NextAttemptAt` LIMIT {batchSize} FOR UPDATE SKIP LOCKED"),
+                // READPAST é o SKIP LOCKED do SQL Server; UPDLOCK segura as linhas até o commit
+                "Microsoft.EntityFrameworkCore.SqlServer" => _ctx.WebhookDeliveries.FromSql(
+                    $"SELECT TOP ({batchSize}) * FROM [WebhookDeliveries] WITH (UPDLOCK, READPAST, ROWLOCK) WHERE [Status] = {pending} AND [NextAttemptAt] <= {now} ORDER BY [NextAttemptAt]"),
+                // Outros provedores (SQLite dos testes): sem travas por linha, a transação serializa
+                _ => _ctx.WebhookDeliveries
+                    .Where(d => d.Status == WebhookStatus.Pending && d.NextAttemptAt <= now)
+                    .OrderBy(d => d.NextAttemptAt)
+                    .Take(batchSize),
+            };
+        }
+    }
+
+    // Inbox: webhooks recebidos gravados uma vez por (origem, id); reenvios do remetente viram no-op
+    public class WebhookInbox
+    {
+        private readonly AppDbContext _ctx;
+        public WebhookInbox(AppDbContext ctx) => _ctx = ctx;
+
+        public async Task<bool> TryAcceptAsync(string source, string messageId, string payload, CancellationToken ct = default)
+        {
+            if (await Exists(source, messageId, ct))
+                return false;
+            _ctx.InboxMessages.Add(new InboxMessage { Source = source, MessageId = messageId, Payload = payload, ReceivedAt = DateTime.UtcNow });
+            try
+            {
+                await _ctx.SaveChangesAsync(ct);
+                return true;
+            }
+            catch (DbUpdateException)
+            {
+                // corrida com outra réplica recebendo o mesmo webhook: a chave primária decide
+                _ctx.ChangeTracker.Clear();
+                if (await Exists(source, messageId, ct))
+                    return false;
+                throw;
+            }
+        }
+
+        private Task<bool> Exists(string source, string messageId, CancellationToken ct) =>
+            _ctx.InboxMessages.AsNoTracking().AnyAsync(m => m.Source == source && m.MessageId == messageId, ct);
+    }
+}
@@ -0,0 +1,65 @@
+using System;
+using System.Collections.Concurrent;
+using System.Globalization;
+using System.Net;
+using System.Net.Http;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+using Microsoft.Extensions.Options;
+using Polly;
+using Polly.Extensions.Http;
+using Polly.Timeout;
+using {{ root_ns }}.Domain;
+
+namespace {{ ns }}
+{
+    // Cliente tipado do IHttpClientFactory: conexões reaproveitadas do pool do SocketsHttpHandler
+    public class WebhookSender
+    {
+        private readonly HttpClient _http;
+        public WebhookSender(HttpClient http) => _http = http;
+
+        public async Task SendAsync(WebhookDelivery delivery, CancellationToken ct)
+        {
+            using var request = new HttpRequestMessage(HttpMethod.Post, delivery.EndpointUrl)
+            {
+                Content = new StringContent(delivery.Payload, Encoding.UTF8, "application/json"),
+            };
+            // Webhook-Id estável entre tentativas: o destinatário deduplica (ver WebhookInbox)
+            request.Headers.Add("Webhook-Id", delivery.Id.ToString(CultureInfo.InvariantCulture));
+            request.Headers.Add("Webhook-Event", delivery.EventType);
+            using var response = await _http.SendAsync(request, HttpCompletionOption.ResponseHeadersRead, ct);
+            response.EnsureSuccessStatusCode();
+        }
+    }
+
+    // Políticas por endpoint (esquema + host + porta): o bulkhead limita as requisições simultâneas a
+    // cada destino e o circuit breaker isola só o destino que está falhando.
+    public sealed class WebhookPolicies
+    {
+        private readonly ConcurrentDictionary<string, IAsyncPolicy<HttpResponseMessage>> _byEndpoint = new();
+        private readonly WebhookOptions _options;
+
+        public WebhookPolicies(IOptions<WebhookOptions> options) => _options = options.Value;
+
+        public IAsyncPolicy<HttpResponseMessage> For(HttpRequestMessage request) =>
+            _byEndpoint.GetOrAdd(request.RequestUri!.GetLeftPart(UriPartial.Authority), _ => Create());
+
+        private IAsyncPolicy<HttpResponseMessage> Create()
+        {
+            var bulkhead = Policy.BulkheadAsync<HttpResponseMessage>(
+                Math.Max(1, _options.MaxConcurrencyPerEndpoint), Math.Max(1, _options.BatchSize));
+            // Poucas tentativas rápidas em processo; as demais são reagendadas pelo outbox
+            var retry = HttpPolicyExtensions.HandleTransientHttpError()
+                .OrResult(r => r.StatusCode == HttpStatusCode.TooManyRequests)
+                .Or<TimeoutRejectedException>()
+                .WaitAndRetryAsync(Math.Max(0, _options.InlineRetries), attempt => TimeSpan.FromMilliseconds(100 * attempt));
+            var breaker = HttpPolicyExtensions.HandleTransientHttpError()
+                .Or<TimeoutRejectedException>()
+                .CircuitBreakerAsync(Math.Max(1, _options.BreakerFailures), TimeSpan.FromSeconds(_options.BreakerSeconds));
+            var timeout = Policy.TimeoutAsync<HttpResponseMessage>(TimeSpan.FromSeconds(Math.Max(1, _options.TimeoutSeconds)));
+            return Policy.WrapAsync(bulkhead, retry, breaker, timeout);
+        }
+    }
+}
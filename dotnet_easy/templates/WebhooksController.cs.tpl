@@ -0,0 +1,47 @@
+using System;
+using System.Text.Json;
+using System.Threading;
+using System.Threading.Tasks;
+using Microsoft.AspNetCore.Mvc;
+using {{ root_ns }}.Infra;
+
+namespace {{ ns }}.Controllers
+{
+    [ApiController]
+    [Route("api/[controller]")]
+    public class WebhooksController : ControllerBase
+    {
+        public sealed record OutgoingWebhook(string EndpointUrl, string EventType, JsonElement Payload);
+
+        private readonly WebhookOutbox _outbox;
+        private readonly WebhookInbox _inbox;
+
+        public WebhooksController(WebhookOutbox outbox, WebhookInbox inbox)
+        {
+            _outbox = outbox;
+            _inbox = inbox;
+        }
+
+        // Enfileira no outbox; o Processor entrega (com novas tentativas) fora da requisição
+        [HttpPost("outbox")]
+        public async Task<IActionResult> Enqueue(OutgoingWebhook webhook, CancellationToken ct)
+        {
+            if (!Uri.TryCreate(webhook.EndpointUrl, UriKind.Absolute, out var uri) ||
+                (uri.Scheme != Uri.UriSchemeHttp && uri.Scheme != Uri.UriSchemeHttps))
+                return BadRequest(new { error = "EndpointUrl must be an absolute http(s) URL." });
+            var id = await _outbox.EnqueueAsync(uri.ToString(), webhook.EventType, webhook.Payload.GetRawText(), ct);
+            return Accepted(new { id });
+        }
+
+        // Recebe webhooks de terceiros; reenvios com o mesmo Webhook-Id são aceitos e ignorados
+        [HttpPost("inbox/{source}")]
+        public async Task<IActionResult> Receive(string source, [FromHeader(Name = "Webhook-Id")] string? messageId,
+                                                 [FromBody] JsonElement payload, CancellationToken ct)
+        {
+            if (string.IsNullOrWhiteSpace(messageId))
+                return BadRequest(new { error = "Missing Webhook-Id header." });
+            var accepted = await _inbox.TryAcceptAsync(source, messageId, payload.GetRawText(), ct);
+            return Ok(new { accepted, duplicate = !accepted });
+        }
+    }
+}
@@ -0,0 +1,73 @@
+using System;
+using System.Collections.Generic;
+using System.Threading;
+using System.Threading.Channels;
+using System.Threading.Tasks;
+using Microsoft.Extensions.Hosting;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+
+namespace {{ ns }}
+{
+    public sealed record WorkItem(long Id, string Payload);
+
+    // Fila limitada em memória entre produtores e o Worker. Cheia, EnqueueAsync espera
+    // (backpressure): a origem é lida no ritmo que os consumidores aguentam.
+    public sealed class WorkQueue
+    {
+        private readonly Channel<WorkItem> _channel;
+
+        public WorkQueue(IOptions<WorkerOptions> options)
+        {
+            _channel = Channel.CreateBounded<WorkItem>(new BoundedChannelOptions(Math.Max(1, options.Value.Capacity))
+            {
+                FullMode = BoundedChannelFullMode.Wait,
+                SingleReader = false,
+                SingleWriter = false,
+            });
+        }
+
+        public ChannelReader<WorkItem> Reader => _channel.Reader;
+
+        public ValueTask EnqueueAsync(WorkItem item, CancellationToken ct = default) => _channel.Writer.WriteAsync(item, ct);
+
+        public bool TryEnqueue(WorkItem item) => _channel.Writer.TryWrite(item);
+
+        public void Complete() => _channel.Writer.TryComplete();
+    }
+
+    public interface IWorkHandler
+    {
+        Task HandleBatchAsync(IReadOnlyList<WorkItem> batch, CancellationToken ct);
+    }
+
+    public class LoggingWorkHandler : IWorkHandler
+    {
+        private readonly ILogger<LoggingWorkHandler> _logger;
+        public LoggingWorkHandler(ILogger<LoggingWorkHandler> logger) => _logger = logger;
+
+        public Task HandleBatchAsync(IReadOnlyList<WorkItem> batch, CancellationToken ct)
+        {
+            _logger.LogInformation("Processed batch of {Count} item(s), last id {Id}.", batch.Count, batch[^1].Id);
+            return Task.CompletedTask;
+        }
+    }
+
+    // Produtor de exemplo: troque pelo consumidor da sua fila (RabbitMQ, SQS, Kafka...)
+    public class SampleProducer : BackgroundService
+    {
+        private readonly WorkQueue _queue;
+        public SampleProducer(WorkQueue queue) => _queue = queue;
+
+        protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+        {
+            long id = 0;
+            using var timer = new PeriodicTimer(TimeSpan.FromSeconds(1));
+            while (await timer.WaitForNextTickAsync(stoppingToken))
+            {
+                id++;
+                await _queue.EnqueueAsync(new WorkItem(id, $"tick {id}"), stoppingToken);
+            }
+        }
+    }
+}
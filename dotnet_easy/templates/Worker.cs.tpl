@@ -0,0 +1,89 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Threading;
+using System.Threading.Tasks;
+using Microsoft.Extensions.Hosting;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+
+namespace {{ ns }}
+{
+    public class WorkerOptions
+    {
+        public int Capacity { get; set; } = 1024;          // itens na fila antes de os produtores esperarem
+        public int Parallelism { get; set; }               // consumidores em paralelo; 0 = um por núcleo
+        public int BatchSize { get; set; } = 64;           // itens entregues ao handler de uma vez
+        public int DrainTimeoutSeconds { get; set; } = 20; // tempo para esvaziar a fila no shutdown
+    }
+
+    // Consumidores da WorkQueue: N laços em paralelo, cada um tirando lotes da fila. No shutdown a
+    // fila é fechada para escrita e os consumidores drenam o que ficou (até DrainTimeoutSeconds).
+    public class Worker : BackgroundService
+    {
+        private readonly WorkQueue _queue;
+        private readonly IWorkHandler _handler;
+        private readonly WorkerOptions _options;
+        private readonly ILogger<Worker> _logger;
+        private readonly CancellationTokenSource _drain = new();
+
+        public Worker(WorkQueue queue, IWorkHandler handler, IOptions<WorkerOptions> options, ILogger<Worker> logger)
+        {
+            _queue = queue;
+            _handler = handler;
+            _options = options.Value;
+            _logger = logger;
+        }
+
+        protected override Task ExecuteAsync(CancellationToken stoppingToken)
+        {
+            var parallelism = _options.Parallelism > 0 ? _options.Parallelism : Environment.ProcessorCount;
+            _logger.LogInformation("Worker running: {Parallelism} consumer(s), batches of {BatchSize}.", parallelism, _options.BatchSize);
+            // Os consumidores não observam stoppingToken: param quando a fila fechada fica vazia
+            return Task.WhenAll(Enumerable.Range(0, parallelism).Select(_ => Task.Run(() => ConsumeAsync(_drain.Token))));
+        }
+
+        public override async Task StopAsync(CancellationToken cancellationToken)
+        {
+            _queue.Complete();
+            _drain.CancelAfter(TimeSpan.FromSeconds(Math.Max(0, _options.DrainTimeoutSeconds)));
+            await base.StopAsync(cancellationToken);
+        }
+
+        public override void Dispose()
+        {
+            _drain.Dispose();
+            base.Dispose();
+        }
+
+        private async Task ConsumeAsync(CancellationToken drain)
+        {
+            var batchSize = Math.Max(1, _options.BatchSize);
+            var batch = new List<WorkItem>(batchSize);
+            var reader = _queue.Reader;
+            try
+            {
+                while (await reader.WaitToReadAsync(drain))
+                {
+                    while (batch.Count < batchSize && reader.TryRead(out var item))
+                        batch.Add(item);
+                    if (batch.Count == 0)
+                        continue;
+                    try
+                    {
+                        await _handler.HandleBatchAsync(batch, drain);
+                    }
+                    catch (Exception ex) when (ex is not OperationCanceledException)
+                    {
+                        _logger.LogError(ex, "Batch of {Count} item(s) failed.", batch.Count);
+                    }
+                    batch.Clear();
+                }
+            }
+            catch (OperationCanceledException) when (drain.IsCancellationRequested)
+            {
+                _logger.LogWarning("Drain timed out after {Seconds}s; items still queued were dropped.", _options.DrainTimeoutSeconds);
+            }
+        }
+    }
+}
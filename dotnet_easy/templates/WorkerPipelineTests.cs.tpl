@@ -0,0 +1,106 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Threading;
+using System.Threading.Tasks;
+using Microsoft.Extensions.Logging.Abstractions;
+using Microsoft.Extensions.Options;
+using Xunit;
+using Xunit.Abstractions;
+
+namespace {{ ns }}.Tests
+{
+    // Dentro do namespace: 'Worker' sozinho resolveria para o namespace {{ worker_ns }}
+    using {{ worker_ns }};
+    using PipelineWorker = {{ worker_ns }}.Worker;
+
+    public class WorkerPipelineTests
+    {
+        private readonly ITestOutputHelper _output;
+        public WorkerPipelineTests(ITestOutputHelper output) => _output = output;
+
+        private sealed class CountingHandler : IWorkHandler
+        {
+            public long Items;
+            public int Batches;
+            public int LargestBatch;
+
+            public Task HandleBatchAsync(IReadOnlyList<WorkItem> batch, CancellationToken ct)
+            {
+                Interlocked.Add(ref Items, batch.Count);
+                Interlocked.Increment(ref Batches);
+                int seen;
+                while ((seen = LargestBatch) < batch.Count && Interlocked.CompareExchange(ref LargestBatch, batch.Count, seen) != seen) { }
+                return Task.CompletedTask;
+            }
+        }
+
+        private static (WorkQueue, PipelineWorker, CountingHandler) Pipeline(int capacity, int parallelism, int batchSize)
+        {
+            var options = Options.Create(new WorkerOptions { Capacity = capacity, Parallelism = parallelism, BatchSize = batchSize });
+            var queue = new WorkQueue(options);
+            var handler = new CountingHandler();
+            return (queue, new PipelineWorker(queue, handler, options, NullLogger<PipelineWorker>.Instance), handler);
+        }
+
+        [Fact]
+        public async Task Throughput_ProcessesEveryItemUnderBackpressure()
+        {
+            const int total = 200_000;
+            var (queue, worker, handler) = Pipeline(capacity: 256, parallelism: 4, batchSize: 64);
+            await worker.StartAsync(CancellationToken.None);
+            var watch = Stopwatch.StartNew();
+            for (var i = 0; i < total; i++)
+                await queue.EnqueueAsync(new WorkItem(i, "payload"));
+            await worker.StopAsync(CancellationToken.None);
+            watch.Stop();
+
+            Assert.Equal(total, Interlocked.Read(ref handler.Items));
+            _output.WriteLine($"{total / watch.Elapsed.TotalSeconds:N0} items/s in {handler.Batches} batch(es)");
+            Assert.True(watch.Elapsed < TimeSpan.FromSeconds(30), $"took {watch.Elapsed}");
+        }
+
+        [Fact]
+        public async Task Consumers_DequeueInBatches()
+        {
+            var (queue, worker, handler) = Pipeline(capacity: 128, parallelism: 1, batchSize: 10);
+            for (var i = 0; i < 100; i++)
+                Assert.True(queue.TryEnqueue(new WorkItem(i, "payload")));
+            await worker.StartAsync(CancellationToken.None);
+            await worker.StopAsync(CancellationToken.None);
+
+            Assert.Equal(100, handler.Items);
+            Assert.Equal(10, handler.Batches);
+            Assert.Equal(10, handler.LargestBatch);
+        }
+
+        [Fact]
+        public async Task FullQueue_MakesProducersWait()
+        {
+            var (queue, worker, handler) = Pipeline(capacity: 2, parallelism: 1, batchSize: 1);
+            Assert.True(queue.TryEnqueue(new WorkItem(1, "a")));
+            Assert.True(queue.TryEnqueue(new WorkItem(2, "b")));
+            Assert.False(queue.TryEnqueue(new WorkItem(3, "c")));
+            var pending = queue.EnqueueAsync(new WorkItem(3, "c")).AsTask();
+            Assert.False(pending.IsCompleted);
+
+            await worker.StartAsync(CancellationToken.None);
+            await pending.WaitAsync(TimeSpan.FromSeconds(10));
+            await worker.StopAsync(CancellationToken.None);
+            Assert.Equal(3, handler.Items);
+        }
+
+        [Fact]
+        public async Task Stop_DrainsItemsAlreadyQueued()
+        {
+            var (queue, worker, handler) = Pipeline(capacity: 1000, parallelism: 2, batchSize: 16);
+            await worker.StartAsync(CancellationToken.None);
+            for (var i = 0; i < 1000; i++)
+                await queue.EnqueueAsync(new WorkItem(i, "payload"));
+            await worker.StopAsync(CancellationToken.None);
+
+            Assert.Equal(1000, handler.Items);
+            Assert.False(queue.TryEnqueue(new WorkItem(1001, "late")));
+        }
+    }
+}
@@ -0,0 +1,20 @@
+{% if sqlserver %}
+{{ services }}.{{ add_db_context }}<{{ root_ns }}.Infra.AppDbContext>(opt => opt.UseSqlServer({{ config }}.GetConnectionString("SqlServer")){{ use_model }}{{ pool_size }});
+{% endif %}
+{% if postgres %}
+{{ services }}.{{ add_db_context }}<{{ root_ns }}.Infra.AppDbContext>(opt => opt.UseNpgsql({{ config }}.GetConnectionString("Postgres")){{ use_model }}{{ pool_size }});
+{% endif %}
+{% if mysql %}
+{% if compiled_model %}
+// Versão fixa (a do mysql:8 do docker-compose): 'dotnet ef dbcontext optimize' monta este host
+// sem servidor no ar, e o AutoDetect abriria uma conexão. Ajuste para a versão do seu servidor.
+{{ services }}.{{ add_db_context }}<{{ root_ns }}.Infra.AppDbContext>(opt => opt.UseMySql({{ config }}.GetConnectionString("MySql"), new Microsoft.EntityFrameworkCore.MySqlServerVersion(new Version(8, 0))){{ use_model }}{{ pool_size }});
+{% else %}
+// NOTE: adjust ServerVersion for MySQL provider
+{{ services }}.{{ add_db_context }}<{{ root_ns }}.Infra.AppDbContext>(opt => opt.UseMySql({{ config }}.GetConnectionString("MySql"), Microsoft.EntityFrameworkCore.ServerVersion.AutoDetect({{ config }}.GetConnectionString("MySql"))){{ use_model }}{{ pool_size }});
+{% endif %}
+{% endif %}
+{% if mongo %}
+{{ services }}.AddSingleton(sp => new {{ root_ns }}.Infra.MongoContext(
+    sp.GetRequiredService<IConfiguration>().GetSection("MongoSettings").Get<{{ root_ns }}.Infra.MongoSettings>()!));
+{% endif %}
@@ -0,0 +1,82 @@
+{
+  "Logging": {
+    "LogLevel": {
+      "Default": "Information",
+      "Microsoft": "Warning",
+      "Microsoft.Hosting.Lifetime": "Information"
+    }
+  },
+  "AllowedHosts": "*",
+  "ConnectionStrings": {
+    {{ conn_strings }}
+  },
+{% if kestrel %}
+  "Kestrel": {
+    "Limits": {
+      "MaxConcurrentConnections": {{ max_connections }},
+      "MaxConcurrentUpgradedConnections": {{ max_upgraded }},
+      "MaxRequestBodySize": {{ max_body }},
+      "KeepAliveTimeout": "{{ keep_alive }}",
+      "RequestHeadersTimeout": "{{ headers_timeout }}",
+      "Http2": {
+        "MaxStreamsPerConnection": {{ max_streams }},
+        "InitialConnectionWindowSize": {{ connection_window }},
+        "InitialStreamWindowSize": {{ stream_window }}
+      }
+    }
+  },
+{% endif %}
+{% if compression %}
+  "ResponseCompression": {
+    "EnableForHttps": true,
+    "Brotli": { "Level": "Fastest" },
+    "Gzip": { "Level": "Fastest" }
+  },
+{% endif %}
+{% if output_cache %}
+  "OutputCache": {
+    "DefaultExpirationSeconds": 60,
+    "HealthExpirationSeconds": 5,
+    "SizeLimitMb": 100
+  },
+{% endif %}
+{% if rate_limit %}
+  "RateLimiting": {
+    "PermitLimit": 100,
+    "WindowSeconds": 1,
+    "QueueLimit": 0
+  },
+{% endif %}
+{% if worker %}
+  "Worker": {
+    "Capacity": 1024,
+    "Parallelism": 0,
+    "BatchSize": 64,
+    "DrainTimeoutSeconds": 20
+  },
+{% endif %}
+{% if webhooks %}
+  "Webhooks": {
+    "BatchSize": 100,
+    "PollIntervalMs": 500,
+    "LeaseSeconds": 60,
+    "MaxAttempts": 8,
+    "MaxConcurrencyPerEndpoint": 8,
+    "TimeoutSeconds": 10,
+    "InlineRetries": 2,
+    "BreakerFailures": 5,
+    "BreakerSeconds": 30
+  },
+{% endif %}
+  "MongoSettings": {
+    "ConnectionString": "{{ mongo_conn }}",
+{% if mongo %}
+    "Database": "{{ mongo_db }}",
+    "MinPoolSize": {{ pool_min }},
+    "MaxPoolSize": {{ pool_max }},
+    "WaitQueueTimeoutSeconds": {{ pool_timeout }}
+{% else %}
+    "Database": "{{ mongo_db }}"
+{% endif %}
+  }
+}
@@ -0,0 +1,63 @@
+version: '3.8'
+services:
+  app:
+    build: .
+    ports:
+      - "5000:{{ http_port }}"
+    env_file:
+      - .env
+{% if compose_runtime_env %}
+    environment:
+{{ compose_runtime_env }}
+{% endif %}
+{% if sqlserver or postgres or mysql or mongo %}
+    depends_on:
+{% endif %}
+{% if sqlserver %}
+      - db
+{% endif %}
+{% if postgres %}
+      - postgres
+{% endif %}
+{% if mysql %}
+      - mysql
+{% endif %}
+{% if mongo %}
+      - mongo
+{% endif %}
+{% if sqlserver %}
+
+  db:
+    image: mcr.microsoft.com/mssql/server:2022-latest
+    environment:
+      SA_PASSWORD: "Your_password123"
+      ACCEPT_EULA: "Y"
+    ports:
+      - "1433:1433"
+{% endif %}
+{% if postgres %}
+
+  postgres:
+    image: postgres:15
+    environment:
+      POSTGRES_USER: postgres
+      POSTGRES_PASSWORD: "Your_password123"
+    ports:
+      - "5432:5432"
+{% endif %}
+{% if mysql %}
+
+  mysql:
+    image: mysql:8
+    environment:
+      MYSQL_ROOT_PASSWORD: "Your_password123"
+    ports:
+      - "3306:3306"
+{% endif %}
+{% if mongo %}
+
+  mongo:
+    image: mongo:6
+    ports:
+      - "27017:27017"
+{% endif %}
@@ -0,0 +1,9 @@
+**/bin/
+**/obj/
+**/.vs/
+.git/
+.env
+publish/
+*.db
+*.sqlite
+*.binlog
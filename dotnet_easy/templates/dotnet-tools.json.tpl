@@ -0,0 +1,12 @@
+{
+  "version": 1,
+  "isRoot": true,
+  "tools": {
+    "dotnet-ef": {
+      "version": "{{ ef_version }}",
+      "commands": [
+        "dotnet-ef"
+      ]
+    }
+  }
+}
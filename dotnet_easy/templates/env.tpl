@@ -0,0 +1,7 @@
+# Exemplo .env
+ASPNETCORE_ENVIRONMENT=Development
+{{ env_conn_vars }}
+{% if runtime_env %}
+# Perfil de runtime ({{ runtime_profile }}): sobrescreve o runtimeconfig.json sem rebuild
+{{ runtime_env }}
+{% endif %}
@@ -0,0 +1,8 @@
+bin/
+obj/
+.vs/
+.env
+publish/
+*.db
+*.sqlite
+*.binlog
@@ -0,0 +1,7 @@
+<?xml version="1.0" encoding="utf-8"?>
+<configuration>
+  <packageSources>
+    <clear />
+    <add key="dotnet-easy-offline" value="{{ feed }}" />
+  </packageSources>
+</configuration>
@@ -0,0 +1,92 @@
+"""Trace de fases, comandos e escritas, e o log por thread usado no modo batch."""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# -----------------------
+# Tracing (fases, comandos e escritas; formato Chrome/Perfetto)
+# -----------------------
+_thread_log = threading.local()
+
+class _ThreadStdout:
+    """
+    sys.stdout usado no modo batch: cada thread com _thread_log.buffer escreve no próprio
+    log (impresso inteiro ao fim do job); as demais escrevem no stdout real.
+    """
+    def __init__(self, real):
+        self.real = real
+
+    def write(self, text):
+        buf = getattr(_thread_log, "buffer", None)
+        return (buf if buf is not None else self.real).write(text)
+
+    def flush(self):
+        self.real.flush()
+
+class Tracer:
+    """
+    Spans de tempo (comandos, escritas de arquivo, fases da geração) de todas as threads.
+    dump() grava no formato Chrome trace (chrome://tracing, Perfetto); summary() agrega.
+    """
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self.events = []
+        self.lock = threading.Lock()
+        self.tids = {}
+
+    @contextmanager
+    def span(self, name, cat, **args):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record(name, cat, start, time.perf_counter(), args)
+
+    def phase(self, name=None):
+        """
+        Marca o início de uma fase na thread atual, encerrando a anterior
+        (evita aninhar blocos 'with' em funções longas). phase() só encerra.
+        """
+        now = time.perf_counter()
+        current = getattr(_thread_log, "phase", None)
+        if current:
+            self._record(current[0], "phase", current[1], now, {})
+        _thread_log.phase = (name, now) if name else None
+
+    def _record(self, name, cat, start, end, args):
+        job = getattr(_thread_log, "job", None)
+        if job:
+            args["job"] = job
+        with self.lock:
+            tid = self.tids.setdefault(threading.get_ident(), len(self.tids) + 1)
+            self.events.append({
+                "name": name, "cat": cat, "ph": "X", "pid": os.getpid(), "tid": tid,
+                "ts": round((start - self.t0) * 1e6), "dur": round((end - start) * 1e6),
+                "args": args,
+            })
+
+    def dump(self, path):
+        with self.lock:
+            data = {"traceEvents": list(self.events), "displayTimeUnit": "ms"}
+        Path(path).write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+    def summary(self, top=15):
+        """Tabela das fases/comandos mais lentos (tempo somado por nome)."""
+        totals = {}
+        with self.lock:
+            for e in self.events:
+                t = totals.setdefault((e["cat"], e["name"]), [0, 0, 0])
+                t[0] += 1
+                t[1] += e["dur"]
+                t[2] = max(t[2], e["dur"])
+        rows = sorted(totals.items(), key=lambda kv: kv[1][1], reverse=True)[:top]
+        print("\nTempos por fase (mais lentos primeiro)")
+        print(f"{'categoria':<9} {'nome':<34} {'n':>5} {'total':>9} {'máx':>9}")
+        for (cat, name), (n, total, peak) in rows:
+            print(f"{cat:<9} {name[:34]:<34} {n:>5} {total / 1e6:>8.2f}s {peak / 1e6:>8.2f}s")
+
+TRACER = Tracer()
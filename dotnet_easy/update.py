@@ -0,0 +1,168 @@
+"""Manifesto da geração anterior e atualização incremental de uma solução existente."""
+
+import hashlib
+import json
+from pathlib import Path
+
+from .tracing import TRACER
+from .proc import run, run_parallel
+from .emit import emit_files, walk_files
+from .msbuild import remove_csproj_items, wire_solution
+from .nuget import add_package_references, write_central_package_props
+
+# -----------------------
+# Atualização incremental (manifesto de hashes do que foi gerado)
+# -----------------------
+GEN_MANIFEST = ".dotnet-easy.json"
+GEN_MANIFEST_FORMAT = 1
+
+def file_hash(path: Path):
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+def read_gen_manifest(root: Path):
+    """Manifesto da última geração em root, ou None (ausente, corrompido ou de outro formato)."""
+    try:
+        data = json.loads((root / GEN_MANIFEST).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data if data.get("format") == GEN_MANIFEST_FORMAT else None
+
+def write_gen_manifest(root: Path, plan, files):
+    """
+    Grava o que esta geração produziu: hash de cada arquivo gerado (como está no disco),
+    comandos 'dotnet new' por projeto, referências, membros do .sln e pacotes com versão.
+    files: arquivo relativo -> sha256; None = calcula do disco para todo plan.files.
+    """
+    if files is None:
+        files = {rel: file_hash(root / rel) for rel in plan.files}
+    data = {
+        "format": GEN_MANIFEST_FORMAT,
+        "files": {rel.as_posix(): h for rel, h in sorted(files.items()) if h},
+        "projects": {c.as_posix(): cmd for c, cmd in plan.commands.items()},
+        "refs": {t.as_posix(): [d.as_posix() for d in deps] for t, deps in plan.refs.items()},
+        "sln": [c.as_posix() for c in plan.sln_projects],
+        "packages": {c.as_posix(): {p: (plan.versions or {}).get(p) for p in pkgs} for c, pkgs in plan.packages},
+        "packages_mode": plan.opts.packages,
+        "tree": sorted(p.as_posix() for p in plan.emitted | {Path(GEN_MANIFEST)}),
+    }
+    (root / GEN_MANIFEST).write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+def update_tree(plan, root: Path, old, opts):
+    """
+    Aplica o plano sobre uma geração anterior, no lugar, comparando com o manifesto:
+    - 'dotnet new' só para projetos novos ou cujo comando mudou (target, template);
+    - arquivo reescrito só se o conteúdo novo difere E o disco ainda tem o hash gerado
+      da última vez; editado à mão => mantido. Arquivos que deixaram de ser gerados são
+      removidos se intocados;
+    - referências/.sln/pacotes só quando mudaram.
+    O manifesto é gravado por último: uma atualização interrompida é refeita na próxima.
+    Retorna quantas mudanças foram aplicadas (0 = nada a fazer).
+    """
+    jobs = opts.jobs
+    old_files = old.get("files", {})
+    changes = 0
+
+    TRACER.phase("projetos (dotnet new)")
+    recreated = [c for c, cmd in plan.commands.items()
+                 if old.get("projects", {}).get(c.as_posix()) != cmd or not (root / c).exists()]
+    fresh_folders = {c.parent for c in recreated}
+    # 'dotnet new --force' sobrescreve Program.cs & cia: guarda antes o que foi editado à mão
+    edited = {}
+    for rel_posix, prev in old_files.items():
+        rel = Path(rel_posix)
+        if fresh_folders & set(rel.parents) and file_hash(root / rel) not in (prev, None):
+            edited[rel] = (root / rel).read_bytes()
+    run_parallel([(plan.commands[c] + (" --force" if (root / c.parent).exists() else ""), str(root))
+                  for c in recreated], jobs)
+    for rel, data in edited.items():
+        (root / rel).write_bytes(data)
+    changes += len(recreated)
+    for rel in plan.deletes:
+        if rel.parent in fresh_folders and (root / rel).exists():
+            (root / rel).unlink()
+
+    TRACER.phase("pastas + templates")
+    recorded, pending, kept, unchanged = {}, {}, [], 0
+    for rel, content in plan.files.items():
+        data = content.encode("utf-8")
+        new = hashlib.sha256(data).hexdigest()
+        disk = file_hash(root / rel)
+        prev = old_files.get(rel.as_posix())
+        if disk == new:
+            recorded[rel] = new
+            unchanged += 1
+        elif disk is None or disk == prev or (fresh_folders & set(rel.parents) and rel not in edited):
+            # ausente, intocado desde a última geração, ou recém-sobrescrito pelo 'dotnet new --force'
+            pending[rel] = data
+            recorded[rel] = new
+        else:
+            kept.append(rel)
+            recorded[rel] = prev
+    emit_files(root, pending, plan.dirs, jobs)
+    written = list(pending)
+    removed = []
+    for rel_posix, prev in old_files.items():
+        rel = Path(rel_posix)
+        if rel in plan.files:
+            continue
+        if file_hash(root / rel) == prev:
+            (root / rel).unlink()
+            removed.append(rel)
+        elif (root / rel).exists():
+            kept.append(rel)
+    changes += len(written) + len(removed)
+    plan.removed = removed
+    plan.emitted = {Path(p) for p in old.get("tree", [])} - set(removed)
+    plan.emitted.update(rel for rel in plan.files if (root / rel).exists())
+    for c in recreated:
+        plan.emitted.update(walk_files(root / c.parent, root))
+
+    TRACER.phase("referências + sln")
+    old_refs = {Path(t): [Path(d) for d in deps] for t, deps in old.get("refs", {}).items()}
+    old_sln = [Path(c) for c in old.get("sln", [])]
+    if recreated or old_refs != plan.refs or old_sln != plan.sln_projects \
+            or not (root / f"{plan.sln_name}.sln").exists():
+        sln_csprojs = [root / c for c in plan.sln_projects if (root / c).exists()]
+        refs = {root / t: [root / d for d in deps] for t, deps in plan.refs.items()}
+        wire_solution(root, plan.sln_name, sln_csprojs, refs, [root / c for c in plan.build_order],
+                      use_cli=opts.cli_wiring, jobs=jobs)
+        plan.emitted.add(Path(f"{plan.sln_name}.sln"))
+        changes += 1
+
+    TRACER.phase("pacotes NuGet")
+    old_pkgs = {Path(c): pkgs for c, pkgs in old.get("packages", {}).items()}
+    if old.get("packages_mode") != opts.packages:
+        old_pkgs = {}  # outro modo de versões: reescreve todos os PackageReference
+    new_pkgs = {c: {p: (plan.versions or {}).get(p) for p in pkgs} for c, pkgs in plan.packages}
+    central = opts.packages == "central"
+    touched = 0
+    for csproj in [c for c in plan.build_order if c in new_pkgs or c in old_pkgs]:
+        had = {} if csproj in recreated else old_pkgs.get(csproj, {})
+        want = new_pkgs.get(csproj, {})
+        if had == want or not (root / csproj).exists():
+            continue
+        touched += 1
+        # sai o que não é mais usado e o que mudou de versão; entra o que falta
+        remove_csproj_items(root / csproj, "PackageReference", [p for p in had if want.get(p, "-") != had[p]])
+        add = [p for p in want if had.get(p, "-") != want[p]]
+        if plan.versions is None:
+            for pkg in add:
+                run(f"dotnet add \"{root / csproj}\" package {pkg}", cwd=str(root))
+        else:
+            add_package_references(root / csproj, [(p, None if central else want[p]) for p in add])
+    if touched and central:
+        write_central_package_props(root, [root / c for c in plan.build_order if (root / c).exists()], plan.versions)
+        plan.emitted.add(Path("Directory.Packages.props"))
+    changes += touched
+
+    if changes:
+        write_gen_manifest(root, plan, recorded)
+    print(f"> [update] {len(recreated)} projeto(s) recriado(s), {len(written)} arquivo(s) reescrito(s), "
+          f"{unchanged} sem mudança, "
+          f"{len(removed)} removido(s), {touched} csproj com pacotes alterados")
+    for rel in kept:
+        print(f"  ⚠️ {rel.as_posix()} foi editado à mão; mantido (apague-o para regerar)")
+    return changes